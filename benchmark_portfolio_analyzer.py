@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+Portfolio Analyzer Benchmark Suite
+==================================
+
+This script measures the throughput of ultimate_pdf_portfolio_analyzer.py:
+- Generates a synthetic corpus of resume PDFs (sections, bullets, pages, noise)
+- Times every stage of the analyzer: discovery, each installed PDF backend,
+  each extract_*_from_text parser, experience merging and JSON saving
+- Writes machine-readable results (seconds, docs/sec, bytes/sec)
+- Times interpreter startup for --help, a bare import and text-only parsing
+- Measures memory retained by the parsed records (experiences, projects,
+  skills, certifications, achievements) per 10k resumes
+- Measures line classification throughput (lines/sec) of the compiled
+  LineClassifier against the previous per-call predicates
+- Compares against a previous results file to catch regressions
+
+Usage:
+    python benchmark_portfolio_analyzer.py pipeline --docs 200 --pages 2 --output bench.json
+    python benchmark_portfolio_analyzer.py pipeline --compare bench.json --threshold 0.2
+    python benchmark_portfolio_analyzer.py startup --runs 20
+    python benchmark_portfolio_analyzer.py memory --docs 2000
+    python benchmark_portfolio_analyzer.py lines --docs 500
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import ultimate_pdf_portfolio_analyzer as analyzer_module
+from ultimate_pdf_portfolio_analyzer import UltimatePDFPortfolioAnalyzer
+
+ALL_SECTIONS = ['summary', 'experience', 'projects', 'education', 'skills', 'certifications', 'awards']
+
+TEXT_PARSERS = [
+    'extract_personal_info_from_text',
+    'extract_experience_from_text',
+    'extract_projects_from_text',
+    'extract_skills_from_text',
+    'extract_education_from_text',
+    'extract_certifications_from_text',
+    'extract_achievements_from_text',
+]
+
+FIRST_NAMES = ['Alex', 'Priya', 'Jordan', 'Wei', 'Maria', 'Sam', 'Fatima', 'Lucas', 'Aisha', 'Noah']
+LAST_NAMES = ['Johnson', 'Sharma', 'Chen', 'Garcia', 'Okafor', 'Smith', 'Nguyen', 'Silva', 'Khan', 'Brown']
+COMPANIES = [
+    'Tata Consultancy Services', 'ACME CLOUD SOLUTIONS', 'Globex Technologies', 'Initech Systems Inc',
+    'Umbrella Services LLC', 'Stark Industries', 'Wayne Enterprises Corp', 'Hooli Software Ltd'
+]
+TITLES = ['Senior DevOps Engineer', 'Systems Engineer', 'Software Developer', 'Cloud Architect',
+          'Site Reliability Engineer', 'Data Analyst', 'Junior Developer', 'Technical Lead']
+LOCATIONS = ['Boston, MA', 'Austin, TX', 'Chennai, India', 'Toronto, Canada', 'Remote', 'London, UK']
+TECHNOLOGIES = ['Python', 'Java', 'JavaScript', 'Go', 'Terraform', 'Kubernetes', 'Docker', 'AWS', 'Azure',
+                'GCP', 'Jenkins', 'Ansible', 'PostgreSQL', 'MongoDB', 'Redis', 'React', 'Django', 'Linux', 'Git']
+VERBS = ['Built', 'Automated', 'Migrated', 'Designed', 'Optimized', 'Led', 'Implemented', 'Reduced']
+OBJECTS = ['CI/CD pipelines', 'infrastructure provisioning', 'monitoring dashboards', 'deployment workflows',
+           'database clusters', 'microservices', 'log processing jobs', 'access management']
+NOISE_WORDS = ['lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit', 'sed', 'tempor']
+
+LINES_PER_PDF_PAGE = 60
+MAX_PDF_LINE_CHARS = 95
+
+
+def generate_resume_text(rng: random.Random, sections: List[str], bullets: int, noise: float) -> List[str]:
+    """Generate the lines of one synthetic resume"""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        rng.choice(TITLES),
+        f"{name.lower().replace(' ', '.')}@example.com | (555) {rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
+        f"{rng.choice(LOCATIONS)} | linkedin.com/in/{name.lower().replace(' ', '')} | github.com/{name.split()[0].lower()}",
+    ]
+
+    def bullet() -> str:
+        techs = rng.sample(TECHNOLOGIES, 2)
+        return (f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {techs[0]} and {techs[1]}, "
+                f"improving reliability by {rng.randint(10, 60)} percent")
+
+    for section in sections:
+        if section == 'summary':
+            lines.append('Professional Summary')
+            lines.append(f"Engineer with {rng.randint(2, 15)} years of experience in "
+                         f"{', '.join(rng.sample(TECHNOLOGIES, 4))}.")
+        elif section == 'experience':
+            lines.append('Professional Experience')
+            for _ in range(rng.randint(2, 4)):
+                start_year = rng.randint(2010, 2022)
+                lines.extend([
+                    rng.choice(COMPANIES),
+                    rng.choice(TITLES),
+                    f"Jan {start_year} - Dec {start_year + rng.randint(1, 3)}",
+                    rng.choice(LOCATIONS),
+                ])
+                lines.extend(bullet() for _ in range(bullets))
+        elif section == 'projects':
+            lines.append('Projects')
+            for _ in range(rng.randint(1, 3)):
+                lines.append(f"{rng.choice(['Deployment', 'Monitoring', 'Analytics'])} Automation Platform")
+                lines.append(f"Tooling for {rng.choice(OBJECTS)}")
+                lines.extend(bullet() for _ in range(max(1, bullets // 2)))
+        elif section == 'education':
+            lines.extend([
+                'Education',
+                'Master of Science in Computer Science',
+                'University of Massachusetts Lowell',
+                f"Aug {rng.randint(2015, 2022)} - May {rng.randint(2023, 2025)}",
+                f"GPA {rng.randint(30, 40) / 10}/4.0",
+            ])
+        elif section == 'skills':
+            lines.append('Technical Skills')
+            lines.append(', '.join(rng.sample(TECHNOLOGIES, 10)))
+        elif section == 'certifications':
+            lines.append('Certifications')
+            lines.append('AWS Certified Solutions Architect Associate')
+            lines.append('Microsoft Certified Azure Administrator Associate')
+        elif section == 'awards':
+            lines.append('Awards and Recognition')
+            lines.append(f"Star of the Month Award for {rng.choice(OBJECTS)}")
+
+    # Sprinkle noise lines (headers, footers, OCR junk) through the document
+    noisy_lines = []
+    for line in lines:
+        noisy_lines.append(line)
+        if rng.random() < noise:
+            noisy_lines.append(' '.join(rng.choice(NOISE_WORDS) for _ in range(rng.randint(3, 12))))
+    return noisy_lines
+
+
+def _pdf_escape(text: str) -> str:
+    """Escape a string for a PDF literal string"""
+    text = text.encode('latin-1', 'replace').decode('latin-1')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path: str, lines: List[str], pages: int):
+    """Write lines as a minimal text-only PDF spread over at least `pages` pages"""
+    wrapped = []
+    for line in lines:
+        while len(line) > MAX_PDF_LINE_CHARS:
+            wrapped.append(line[:MAX_PDF_LINE_CHARS])
+            line = line[MAX_PDF_LINE_CHARS:]
+        wrapped.append(line)
+
+    lines_per_page = min(LINES_PER_PDF_PAGE, max(1, -(-len(wrapped) // max(1, pages))))
+    page_lines = [wrapped[i:i + lines_per_page] for i in range(0, len(wrapped), lines_per_page)] or [[]]
+    while len(page_lines) < pages:
+        page_lines.append([])
+
+    # Objects 1-3 are the catalog, page tree and font; each page adds a page and a content object
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    }
+    kids = []
+    for page_num, content_lines in enumerate(page_lines):
+        page_obj = 4 + page_num * 2
+        content_obj = page_obj + 1
+        kids.append(f"{page_obj} 0 R")
+        stream = "BT /F1 10 Tf 12 TL 50 760 Td " + ' '.join(f"({_pdf_escape(line)}) Tj T*" for line in content_lines) + " ET"
+        stream_bytes = stream.encode('latin-1')
+        objects[page_obj] = (f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                             f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_obj} 0 R >>").encode('latin-1')
+        objects[content_obj] = b"<< /Length %d >>\nstream\n" % len(stream_bytes) + stream_bytes + b"\nendstream"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>".encode('latin-1')
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_num in sorted(objects):
+        offsets[obj_num] = len(output)
+        output += b"%d 0 obj\n" % obj_num + objects[obj_num] + b"\nendobj\n"
+    xref_offset = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for obj_num in sorted(objects):
+        output += b"%010d 00000 n \n" % offsets[obj_num]
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+
+    with open(path, 'wb') as f:
+        f.write(output)
+
+
+def generate_corpus(workspace: str, docs: int, pages: int, sections: List[str], bullets: int,
+                    noise: float, seed: int) -> List[str]:
+    """Write a synthetic resume corpus into workspace/resume and return the resume texts"""
+    rng = random.Random(seed)
+    resume_folder = os.path.join(workspace, 'resume')
+    os.makedirs(resume_folder, exist_ok=True)
+
+    texts = []
+    for doc_num in range(docs):
+        lines = generate_resume_text(rng, sections, bullets, noise)
+        write_pdf(os.path.join(resume_folder, f"candidate_{doc_num:05d}_resume.pdf"), lines, pages)
+        texts.append('\n'.join(lines))
+    return texts
+
+
+def _time_stage(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    """Run func `repeat` times and return the best wall time and the last result"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _stage_result(seconds: float, docs: int, num_bytes: int) -> Dict[str, Any]:
+    return {
+        'seconds': round(seconds, 6),
+        'docs': docs,
+        'bytes': num_bytes,
+        'docs_per_sec': round(docs / seconds, 2) if seconds > 0 else None,
+        'bytes_per_sec': round(num_bytes / seconds, 2) if seconds > 0 else None,
+    }
+
+
+def run_pipeline_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Generate a corpus and time every analyzer stage"""
+    sections = [s.strip() for s in args.sections.split(',') if s.strip()]
+    workspace = tempfile.mkdtemp(prefix='portfolio_bench_')
+    stages = {}
+    try:
+        print(f"📄 Generating {args.docs} synthetic resumes ({args.pages} pages, {args.bullets} bullets/role)...")
+        texts = generate_corpus(workspace, args.docs, args.pages, sections, args.bullets, args.noise, args.seed)
+        analyzer = UltimatePDFPortfolioAnalyzer(workspace)
+        pdf_files = analyzer.pdf_files
+        pdf_bytes = sum(os.path.getsize(p) for p in pdf_files)
+        text_bytes = sum(len(t.encode('utf-8')) for t in texts)
+
+        # Discovery
+        seconds, _ = _time_stage(analyzer._find_pdf_files, args.repeat)
+        stages['discovery'] = _stage_result(seconds, len(pdf_files), 0)
+
+        # PDF backends
+        for backend in args.backends.split(','):
+            if backend not in analyzer_module.AVAILABLE_PDF_BACKENDS:
+                print(f"⚠️  Skipping {backend}: not installed")
+                continue
+            extract = lambda p: analyzer._join_pages(analyzer.iter_pdf_pages(p, backend))
+            seconds, _ = _time_stage(lambda: [extract(p) for p in pdf_files], args.repeat)
+            stages[f"extract_{backend}"] = _stage_result(seconds, len(pdf_files), pdf_bytes)
+
+        # Section index shared by the line-oriented parsers
+        def build_indexes():
+            analyzer_module._get_text_index.cache_clear()
+            return [analyzer_module.TextIndex(text) for text in texts]
+        seconds, _ = _time_stage(build_indexes, args.repeat)
+        stages['text_index'] = _stage_result(seconds, len(texts), text_bytes)
+
+        # Text parsers
+        all_experiences = []
+        for parser_name in TEXT_PARSERS:
+            parser = getattr(analyzer, parser_name)
+            if parser_name == 'extract_experience_from_text':
+                run = lambda: [exp for i, text in enumerate(texts) for exp in parser(text, f"doc_{i}.pdf")]
+            else:
+                run = lambda: [parser(text) for text in texts]
+            seconds, result = _time_stage(run, args.repeat)
+            stages[parser_name] = _stage_result(seconds, len(texts), text_bytes)
+            if parser_name == 'extract_experience_from_text':
+                all_experiences = result
+
+        # Merge
+        seconds, merged = _time_stage(lambda: analyzer._merge_duplicate_experiences(all_experiences), args.repeat)
+        stages['merge'] = _stage_result(seconds, len(texts), 0)
+        stages['merge']['experiences_in'] = len(all_experiences)
+        stages['merge']['experiences_out'] = len(merged)
+
+        # Serialization
+        combined_text = '\n'.join(texts)
+        portfolio_data = analyzer._build_portfolio_data(combined_text, merged, {}, pdf_files)
+        seconds, output_file = _time_stage(lambda: analyzer.save_portfolio_data(portfolio_data), args.repeat)
+        output_bytes = os.path.getsize(output_file) if output_file else 0
+        stages['save_portfolio_data'] = _stage_result(seconds, 1, output_bytes)
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    return {
+        'benchmark': 'pipeline',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {
+            'docs': args.docs, 'pages': args.pages, 'sections': sections, 'bullets': args.bullets,
+            'noise': args.noise, 'seed': args.seed, 'repeat': args.repeat,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'corpus': {'pdf_bytes': pdf_bytes, 'text_bytes': text_bytes},
+        'stages': stages,
+    }
+
+
+ANALYZER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ultimate_pdf_portfolio_analyzer.py')
+
+# Command name -> Python code run in a fresh interpreter
+STARTUP_SNIPPETS = {
+    'interpreter': "pass",
+    'import': "import ultimate_pdf_portfolio_analyzer",
+    'text_parse': (
+        "import ultimate_pdf_portfolio_analyzer as u\n"
+        "a = u.UltimatePDFPortfolioAnalyzer()\n"
+        "text = 'Jane Doe\\nProfessional Experience\\nACME SOLUTIONS INC\\nDevOps Engineer\\n- Built Terraform modules for AWS'\n"
+        "a.extract_experience_from_text(text * 5, 'bench.pdf')\n"
+        "a.extract_skills_from_text(text)\n"
+        "loaded = [m for m in ('pymupdf', 'fitz', 'PyPDF2', 'pdfplumber') if m in __import__('sys').modules]\n"
+        "assert not loaded, f'PDF backends imported on the text-only path: {loaded}'"
+    ),
+}
+
+
+def run_startup_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Time fresh-interpreter startup for --help, a bare import and a text-only parse"""
+    commands = {name: [sys.executable, '-c', code] for name, code in STARTUP_SNIPPETS.items()}
+    commands['cli_help'] = [sys.executable, ANALYZER_SCRIPT, '--help']
+    # Running as a module reuses the cached bytecode instead of recompiling the script
+    commands['cli_help_module'] = [sys.executable, '-m', 'ultimate_pdf_portfolio_analyzer', '--help']
+
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(ANALYZER_SCRIPT))
+    workspace = tempfile.mkdtemp(prefix='portfolio_startup_')
+    stages = {}
+    try:
+        for name, command in commands.items():
+            timings = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                completed = subprocess.run(command, cwd=workspace, env=env, capture_output=True, text=True)
+                timings.append(time.perf_counter() - start)
+                if completed.returncode != 0:
+                    raise RuntimeError(f"Startup command '{name}' failed:\n{completed.stderr}")
+            stages[name] = _stage_result(statistics.median(timings), 1, 0)
+            stages[name]['min_seconds'] = round(min(timings), 6)
+            stages[name]['runs'] = args.runs
+    finally:
+        shutil.rmtree(workspace, ignore_errors=True)
+
+    return {
+        'benchmark': 'startup',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {'runs': args.runs},
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'stages': stages,
+    }
+
+
+RECORD_PARSERS = [
+    'extract_projects_from_text',
+    'extract_skills_from_text',
+    'extract_certifications_from_text',
+    'extract_achievements_from_text',
+]
+
+
+def run_memory_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Parse synthetic resume texts, keep every record and measure the memory they retain"""
+    sections = [s.strip() for s in args.sections.split(',') if s.strip()]
+    rng = random.Random(args.seed)
+    texts = ['\n'.join(generate_resume_text(rng, sections, args.bullets, args.noise)) for _ in range(args.docs)]
+    num_bytes = sum(len(text.encode('utf-8')) for text in texts)
+    analyzer = UltimatePDFPortfolioAnalyzer(tempfile.gettempdir())
+
+    # Warm module-level caches so only the retained records are measured
+    analyzer.extract_experience_from_text(texts[0], 'warmup.pdf')
+    for parser_name in RECORD_PARSERS:
+        getattr(analyzer, parser_name)(texts[0])
+
+    print(f"🧮 Parsing {args.docs} synthetic resumes and retaining every record...")
+    tracemalloc.start()
+    start = time.perf_counter()
+    retained = []
+    for i, text in enumerate(texts):
+        experiences = analyzer.extract_experience_from_text(text, f"candidate_{i:05d}_resume.pdf")
+        retained.append((analyzer._merge_duplicate_experiences(experiences),
+                         *(getattr(analyzer, parser_name)(text) for parser_name in RECORD_PARSERS)))
+    seconds = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stage = _stage_result(seconds, args.docs, num_bytes)
+    stage['retained_bytes'] = current
+    stage['peak_bytes'] = peak
+    stage['retained_bytes_per_10k_resumes'] = round(current / args.docs * 10000)
+    print(f"📦 Retained {current / (1024 * 1024):.1f} MB for {args.docs} resumes "
+          f"({stage['retained_bytes_per_10k_resumes'] / (1024 * 1024):.1f} MB per 10k resumes)")
+    del retained
+
+    return {
+        'benchmark': 'memory',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {
+            'docs': args.docs, 'sections': sections, 'bullets': args.bullets,
+            'noise': args.noise, 'seed': args.seed,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'stages': {'parse_and_retain_records': stage},
+    }
+
+
+class LegacyLinePredicates:
+    """The per-call line predicates the analyzer used before LineClassifier, kept as the baseline"""
+
+    def is_company_line(self, line: str) -> bool:
+        company_indicators = ['inc', 'corp', 'llc', 'ltd', 'company', 'solutions', 'technologies', 'systems', 'services', 'university', 'college']
+        line_lower = line.lower()
+        if any(word in line_lower for word in ['experience', 'skills', 'education', 'projects']):
+            return False
+        if any(indicator in line_lower for indicator in company_indicators):
+            return True
+        if line.isupper() and len(line) > 3:
+            return True
+        if line.istitle() and 5 <= len(line) <= 50:
+            return True
+        return False
+
+    def is_title_line(self, line: str) -> bool:
+        title_keywords = ['engineer', 'developer', 'analyst', 'manager', 'assistant', 'specialist', 'consultant', 'architect', 'lead', 'senior', 'junior', 'intern']
+        return any(keyword in line.lower() for keyword in title_keywords)
+
+    def is_date_line(self, line: str) -> bool:
+        date_patterns = [
+            r'\d{4}\s*[-–]\s*\d{4}',
+            r'\w+\s+\d{4}\s*[-–]\s*\w+\s+\d{4}',
+            r'\d{1,2}/\d{4}\s*[-–]\s*\d{1,2}/\d{4}',
+            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',
+            r'present|current'
+        ]
+        line_lower = line.lower()
+        return any(re.search(pattern, line_lower) for pattern in date_patterns)
+
+    def is_location_line(self, line: str) -> bool:
+        location_patterns = [r'\w+,\s*\w{2}', r'\w+,\s*\w+']
+        location_words = ['usa', 'india', 'canada', 'uk', 'remote']
+        return (any(re.search(pattern, line) for pattern in location_patterns) or
+                any(word in line.lower() for word in location_words))
+
+    def is_bullet_point(self, line: str) -> bool:
+        bullet_chars = ['•', '◦', '▪', '–', '-', '*', '→']
+        return bool(any(line.startswith(char) for char in bullet_chars) or
+                    line.startswith('â€¢') or
+                    re.match(r'^\s*\d+\.', line))
+
+    def is_project_title(self, line: str) -> bool:
+        if len(line) < 10 or len(line) > 100:
+            return False
+        project_indicators = ['system', 'platform', 'application', 'tool', 'website', 'app', 'portal', 'dashboard']
+        return (any(indicator in line.lower() for indicator in project_indicators) or
+                (line.istitle() and len(line.split()) <= 8))
+
+    def is_institution_line(self, line: str) -> bool:
+        institution_keywords = ['university', 'college', 'institute', 'school', 'academy']
+        return any(keyword in line.lower() for keyword in institution_keywords)
+
+    def is_degree_line(self, line: str) -> bool:
+        degree_keywords = ['bachelor', 'master', 'phd', 'doctorate', 'associate', 'certificate', 'diploma']
+        return any(keyword in line.lower() for keyword in degree_keywords)
+
+    def classify(self, line: str) -> int:
+        """Evaluate every predicate, as the experience, fallback, education and project passes did"""
+        return ((analyzer_module.LINE_COMPANY if self.is_company_line(line) else 0) |
+                (analyzer_module.LINE_TITLE if self.is_title_line(line) else 0) |
+                (analyzer_module.LINE_DATE if self.is_date_line(line) else 0) |
+                (analyzer_module.LINE_LOCATION if self.is_location_line(line) else 0) |
+                (analyzer_module.LINE_BULLET if self.is_bullet_point(line) else 0) |
+                (analyzer_module.LINE_PROJECT_TITLE if self.is_project_title(line) else 0) |
+                (analyzer_module.LINE_INSTITUTION if self.is_institution_line(line) else 0) |
+                (analyzer_module.LINE_DEGREE if self.is_degree_line(line) else 0))
+
+
+def run_lines_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Time line classification with the per-call predicates and with the compiled LineClassifier"""
+    sections = [s.strip() for s in args.sections.split(',') if s.strip()]
+    rng = random.Random(args.seed)
+    lines = [line.strip() for _ in range(args.docs)
+             for line in generate_resume_text(rng, sections, args.bullets, args.noise) if line.strip()]
+    lines_lower = [line.lower() for line in lines]
+    num_bytes = sum(len(line.encode('utf-8')) for line in lines)
+    legacy = LegacyLinePredicates()
+    classifier = analyzer_module.LineClassifier()
+
+    print(f"🏷️  Classifying {len(lines)} lines from {args.docs} synthetic resumes...")
+    legacy_seconds, legacy_codes = _time_stage(lambda: bytes(legacy.classify(line) for line in lines), args.repeat)
+    compiled_seconds, compiled_codes = _time_stage(lambda: classifier.classify_lines(lines, lines_lower), args.repeat)
+    if legacy_codes != compiled_codes:
+        mismatch = next(i for i, (a, b) in enumerate(zip(legacy_codes, compiled_codes)) if a != b)
+        raise RuntimeError(f"LineClassifier disagrees with the legacy predicates on: {lines[mismatch]!r}")
+
+    stages = {}
+    for name, seconds in (('legacy_predicates', legacy_seconds), ('line_classifier', compiled_seconds)):
+        stages[name] = _stage_result(seconds, args.docs, num_bytes)
+        stages[name]['lines'] = len(lines)
+        stages[name]['lines_per_sec'] = round(len(lines) / seconds, 1) if seconds > 0 else None
+        print(f"⚡ {name}: {stages[name]['lines_per_sec']:,.0f} lines/sec")
+    print(f"🚀 Speedup: {legacy_seconds / compiled_seconds:.1f}x")
+
+    return {
+        'benchmark': 'lines',
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'config': {
+            'docs': args.docs, 'sections': sections, 'bullets': args.bullets,
+            'noise': args.noise, 'seed': args.seed, 'repeat': args.repeat,
+        },
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'stages': stages,
+    }
+
+
+def compare_results(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print per-stage changes against a baseline and return the stages that regressed"""
+    regressions = []
+    print(f"\n📊 COMPARISON (regression threshold: +{threshold:.0%}):")
+    for stage, result in current['stages'].items():
+        previous = baseline.get('stages', {}).get(stage)
+        if not previous or not previous.get('seconds'):
+            print(f"- {stage}: new stage")
+            continue
+        change = result['seconds'] / previous['seconds'] - 1
+        marker = '❌' if change > threshold else '✅'
+        print(f"{marker} {stage}: {previous['seconds']:.4f}s -> {result['seconds']:.4f}s ({change:+.1%})")
+        if change > threshold:
+            regressions.append(stage)
+    return regressions
+
+
+def print_results(results: Dict[str, Any]):
+    """Print a human-readable stage table"""
+    print(f"\n{'STAGE':<36}{'SECONDS':>12}{'DOCS/SEC':>14}{'MB/SEC':>12}")
+    for stage, result in results['stages'].items():
+        mb_per_sec = (result['bytes_per_sec'] or 0) / (1024 * 1024)
+        print(f"{stage:<36}{result['seconds']:>12.4f}{result['docs_per_sec'] or 0:>14.1f}{mb_per_sec:>12.2f}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Benchmark suite for the PDF portfolio analyzer")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pipeline = subparsers.add_parser('pipeline', help="Time every analyzer stage on a synthetic corpus")
+    pipeline.add_argument('--docs', type=int, default=100, help="Number of synthetic resumes (default: 100)")
+    pipeline.add_argument('--pages', type=int, default=2, help="Minimum pages per resume (default: 2)")
+    pipeline.add_argument('--sections', default=','.join(ALL_SECTIONS),
+                          help=f"Comma-separated sections to include (default: {','.join(ALL_SECTIONS)})")
+    pipeline.add_argument('--bullets', type=int, default=4, help="Bullet points per role (default: 4)")
+    pipeline.add_argument('--noise', type=float, default=0.1,
+                          help="Probability of a noise line after each line (default: 0.1)")
+    pipeline.add_argument('--seed', type=int, default=42, help="Random seed for the corpus (default: 42)")
+    pipeline.add_argument('--repeat', type=int, default=3, help="Runs per stage; the best is kept (default: 3)")
+    pipeline.add_argument('--backends', default=','.join(analyzer_module.PDF_BACKENDS),
+                          help=f"PDF backends to time (default: {','.join(analyzer_module.PDF_BACKENDS)})")
+    startup = subparsers.add_parser('startup', help="Time --help, a bare import and a text-only parse in fresh interpreters")
+    startup.add_argument('--runs', type=int, default=10, help="Interpreter launches per command; the median is kept (default: 10)")
+    memory = subparsers.add_parser('memory', help="Measure memory retained by the parsed records of a synthetic corpus")
+    memory.add_argument('--docs', type=int, default=2000, help="Number of synthetic resumes (default: 2000)")
+    memory.add_argument('--sections', default=','.join(ALL_SECTIONS),
+                        help=f"Comma-separated sections to include (default: {','.join(ALL_SECTIONS)})")
+    memory.add_argument('--bullets', type=int, default=4, help="Bullet points per role (default: 4)")
+    memory.add_argument('--noise', type=float, default=0.1,
+                        help="Probability of a noise line after each line (default: 0.1)")
+    memory.add_argument('--seed', type=int, default=42, help="Random seed for the corpus (default: 42)")
+    lines = subparsers.add_parser('lines', help="Compare line classification throughput before and after LineClassifier")
+    lines.add_argument('--docs', type=int, default=500, help="Number of synthetic resumes (default: 500)")
+    lines.add_argument('--sections', default=','.join(ALL_SECTIONS),
+                       help=f"Comma-separated sections to include (default: {','.join(ALL_SECTIONS)})")
+    lines.add_argument('--bullets', type=int, default=4, help="Bullet points per role (default: 4)")
+    lines.add_argument('--noise', type=float, default=0.1,
+                       help="Probability of a noise line after each line (default: 0.1)")
+    lines.add_argument('--seed', type=int, default=42, help="Random seed for the corpus (default: 42)")
+    lines.add_argument('--repeat', type=int, default=3, help="Runs per variant; the best is kept (default: 3)")
+
+    for sub in (pipeline, startup, memory, lines):
+        sub.add_argument('--output', help="Write machine-readable results to this JSON file")
+        sub.add_argument('--compare', help="Previous results JSON file to compare against")
+        sub.add_argument('--threshold', type=float, default=0.2,
+                         help="Relative slowdown that counts as a regression (default: 0.2)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main execution function"""
+    args = parse_args(argv)
+    logging.getLogger(analyzer_module.__name__).setLevel(logging.WARNING)
+
+    print("⏱️  Portfolio Analyzer Benchmark Suite")
+    print("=" * 55)
+
+    if args.command == 'startup':
+        results = run_startup_benchmark(args)
+    elif args.command == 'memory':
+        results = run_memory_benchmark(args)
+    elif args.command == 'lines':
+        results = run_lines_benchmark(args)
+    else:
+        results = run_pipeline_benchmark(args)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n📁 Results saved to: {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ Regressions detected in: {', '.join(regressions)}")
+            return 1
+        print("\n✅ No regressions detected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Portfolio Analyzer HTTP Service
+===============================
+
+This script serves ultimate_pdf_portfolio_analyzer.py over HTTP (stdlib asyncio only):
+- POST /analyze with the raw PDF bytes as the body returns the portfolio JSON
+  (pass the original filename as ?filename=resume.pdf or an X-Filename header)
+- GET /health reports in-flight and queued requests
+- CPU-bound extraction runs in a warm worker pool (PDF backends and the
+  keyword matcher are loaded once per worker, not per request)
+- At most --concurrency uploads are analyzed at once, at most --queue-size
+  more wait; beyond that requests get 503 with Retry-After (backpressure)
+  before their body is read, so memory stays bounded
+- Headers and bodies must arrive within --read-timeout seconds (else 408)
+- Concurrent uploads of the same file are coalesced into a single extraction;
+  each still needs a free upload slot while its body is read (the content is
+  unknown until then), so a full service answers 503 even to duplicates
+
+Usage:
+    python portfolio_analyzer_service.py --port 8765 --jobs 4 --queue-size 32
+    curl --data-binary @resume.pdf "http://127.0.0.1:8765/analyze?filename=resume.pdf"
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import os
+import sys
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import ultimate_pdf_portfolio_analyzer as analyzer_module
+from ultimate_pdf_portfolio_analyzer import PDFTextCache, UltimatePDFPortfolioAnalyzer
+
+logger = logging.getLogger(__name__)
+
+HTTP_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+    408: 'Request Timeout', 411: 'Length Required', 413: 'Payload Too Large', 500: 'Internal Server Error',
+    503: 'Service Unavailable'
+}
+
+MAX_HEADER_LINES = 100
+
+class ServiceBusyError(Exception):
+    """Raised when the extraction queue is full"""
+    pass
+
+# Per-process analyzer used by the service worker pool
+_service_analyzer = None
+
+def _warm_analyzer(analyzer: UltimatePDFPortfolioAnalyzer):
+    """Load every configured PDF backend and the keyword matcher ahead of the first request"""
+    analyzer_module._warm_pdf_worker(analyzer)
+
+def _init_service_worker(analyzer: UltimatePDFPortfolioAnalyzer):
+    """Install and warm the analyzer copy shipped to this worker process"""
+    global _service_analyzer
+    _service_analyzer = analyzer
+    _warm_analyzer(analyzer)
+
+def _analyze_upload(upload: Tuple[str, bytes]) -> Dict[str, Any]:
+    """Process pool entry point: analyze one uploaded PDF"""
+    return _service_analyzer.analyze_pdf_bytes(upload)
+
+class PortfolioService:
+    """Asyncio HTTP front end that feeds uploaded PDFs to a warm analyzer pool"""
+    
+    def __init__(self, analyzer: UltimatePDFPortfolioAnalyzer, jobs: int = 1, executor: str = 'process',
+                 concurrency: Optional[int] = None, queue_size: int = 16, max_upload_bytes: int = 20 * 1024 * 1024,
+                 read_timeout: float = 30.0):
+        self.analyzer = analyzer
+        self.jobs = max(1, jobs)
+        self.executor_kind = executor
+        self.concurrency = concurrency or self.jobs
+        self.queue_size = queue_size
+        self.max_upload_bytes = max_upload_bytes
+        # Seconds allowed for the request headers, and again for the body
+        self.read_timeout = read_timeout
+        # Responses are compact JSON, encoded with the analyzer's encoder (orjson when installed)
+        self.json_writer = analyzer_module.PortfolioJSONWriter(compact=True, encoder=analyzer.json_writer.encoder)
+        
+        self.pool = None
+        self.server = None
+        self._slots = None
+        self._in_flight = {}
+        self._pending = 0
+        # Uploads holding a slot from before their body is read until they are answered
+        self._reserved = 0
+        self.stats = {'requests': 0, 'analyzed': 0, 'coalesced': 0, 'rejected': 0, 'errors': 0}
+    
+    def _start_pool(self):
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        
+        if self.executor_kind == 'thread':
+            _warm_analyzer(self.analyzer)
+            self.pool = ThreadPoolExecutor(max_workers=self.jobs)
+        else:
+            self.pool = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_service_worker,
+                                            initargs=(self.analyzer,))
+            # Spawn and warm every worker now rather than on the first uploads
+            for future in [self.pool.submit(os.getpid) for _ in range(self.jobs)]:
+                future.result()
+    
+    async def start(self, host: str = '127.0.0.1', port: int = 8765):
+        """Start the worker pool and begin accepting connections"""
+        self._start_pool()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        logger.info(f"🌐 Serving on {', '.join(str(sock.getsockname()) for sock in self.server.sockets)} "
+                    f"({self.jobs} {self.executor_kind} workers, concurrency {self.concurrency}, "
+                    f"queue {self.queue_size})")
+    
+    async def close(self):
+        """Stop accepting connections and shut down the worker pool"""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.pool is not None:
+            self.pool.shutdown(wait=True)
+    
+    async def analyze(self, filename: str, data: bytes) -> Dict[str, Any]:
+        """Analyze one upload, sharing the result with identical uploads already in flight"""
+        key = (hashlib.sha256(data).hexdigest(), filename)
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.stats['coalesced'] += 1
+            return await asyncio.shield(task)
+        
+        if self._is_full():
+            raise ServiceBusyError("Too many pending analyses, retry later")
+        
+        task = asyncio.ensure_future(self._run_extraction(filename, data))
+        self._in_flight[key] = task
+        self._pending += 1
+        task.add_done_callback(lambda _: self._finish(key))
+        # Shielded so a client disconnecting does not cancel the work other waiters share
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: Tuple[str, str]):
+        self._in_flight.pop(key, None)
+        self._pending -= 1
+    
+    async def _run_extraction(self, filename: str, data: bytes) -> Dict[str, Any]:
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            if self.executor_kind == 'thread':
+                result = await loop.run_in_executor(self.pool, self.analyzer.analyze_pdf_bytes, (filename, data))
+            else:
+                result = await loop.run_in_executor(self.pool, _analyze_upload, (filename, data))
+            self.stats['analyzed'] += 1
+            return result
+    
+    def _is_full(self) -> bool:
+        return self._pending >= self.concurrency + self.queue_size
+    
+    def _can_accept_upload(self) -> bool:
+        """Whether another upload body may be read (bounds the bytes buffered at once)"""
+        return self._reserved < self.concurrency + self.queue_size and not self._is_full()
+    
+    async def _read(self, read, deadline: float):
+        """Await one read from the client, raising asyncio.TimeoutError past the loop-time deadline"""
+        return await asyncio.wait_for(read, max(0.0, deadline - asyncio.get_running_loop().time()))
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            status, payload, headers = await self._handle_request(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        except asyncio.TimeoutError:
+            status, payload, headers = 408, {'error': f"Request not received within {self.read_timeout} seconds"}, {}
+        except Exception as e:
+            logger.exception(f"Unhandled error while serving request: {e}")
+            self.stats['errors'] += 1
+            status, payload, headers = 500, {'error': str(e)}, {}
+        
+        body = self.json_writer.dumps(payload)
+        head = [f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}",
+                'Content-Type: application/json; charset=utf-8',
+                f"Content-Length: {len(body)}",
+                'Connection: close']
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        try:
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def _handle_request(self, reader: asyncio.StreamReader) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        deadline = asyncio.get_running_loop().time() + self.read_timeout
+        request_line = (await self._read(reader.readline(), deadline)).decode('latin-1').strip()
+        parts = request_line.split()
+        if len(parts) != 3:
+            return 400, {'error': 'Malformed request line'}, {}
+        method, target, _ = parts
+        
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            line = (await self._read(reader.readline(), deadline)).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        else:
+            return 400, {'error': 'Too many headers'}, {}
+        
+        url = urlsplit(target)
+        self.stats['requests'] += 1
+        
+        if url.path == '/health':
+            if method != 'GET':
+                return 405, {'error': 'Use GET'}, {'Allow': 'GET'}
+            return 200, {'status': 'ok', 'pending': self._pending, 'in_flight': len(self._in_flight),
+                         'uploads': self._reserved,
+                         'backends': self.analyzer.backends, 'stats': self.stats}, {}
+        
+        if url.path != '/analyze':
+            return 404, {'error': f"Unknown path {url.path}"}, {}
+        if method != 'POST':
+            return 405, {'error': 'Use POST with the PDF bytes as the body'}, {'Allow': 'POST'}
+        
+        if 'content-length' not in headers:
+            return 411, {'error': 'Content-Length is required'}, {}
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            return 400, {'error': 'Invalid Content-Length'}, {}
+        if length <= 0:
+            return 400, {'error': 'Empty upload'}, {}
+        if length > self.max_upload_bytes:
+            return 413, {'error': f"Upload exceeds {self.max_upload_bytes} bytes"}, {}
+        
+        # Reject before reading the body, so a full service never buffers more uploads.
+        # The content hash is unknown at this point, so uploads that would coalesce
+        # with an in-flight extraction take (and can be refused) a slot like any other.
+        if not self._can_accept_upload():
+            self.stats['rejected'] += 1
+            return 503, {'error': "Too many pending analyses, retry later"}, {'Retry-After': '1'}
+        
+        self._reserved += 1
+        try:
+            deadline = asyncio.get_running_loop().time() + self.read_timeout
+            data = await self._read(reader.readexactly(length), deadline)
+            query = parse_qs(url.query)
+            filename = os.path.basename(query.get('filename', [headers.get('x-filename', '')])[0]) or 'upload.pdf'
+            
+            try:
+                portfolio_data = await self.analyze(filename, data)
+            except ServiceBusyError as e:
+                self.stats['rejected'] += 1
+                return 503, {'error': str(e)}, {'Retry-After': '1'}
+            except Exception as e:
+                logger.error(f"Analysis of {filename} failed: {e}")
+                self.stats['errors'] += 1
+                return 500, {'error': f"Analysis failed: {e}"}, {}
+            return 200, portfolio_data, {}
+        finally:
+            self._reserved -= 1
+
+def parse_args(argv: Optional[list] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve the PDF portfolio analyzer over HTTP")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="Port to listen on (default: 8765)")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="Warm extraction workers (default: 1, 0 = one per CPU)")
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process',
+                        help="Worker pool type (default: process)")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help="Uploads analyzed at once (default: --jobs)")
+    parser.add_argument('--queue-size', type=int, default=16,
+                        help="Uploads allowed to wait for a free slot before answering 503 (default: 16)")
+    parser.add_argument('--max-upload-mb', type=float, default=20,
+                        help="Largest accepted upload in MB (default: 20)")
+    parser.add_argument('--read-timeout', type=float, default=30,
+                        help="Seconds allowed for request headers, and again for the body, before 408 (default: 30)")
+    parser.add_argument('--backends', default=None,
+                        help="Comma-separated PDF backend fallback order (default: fastest installed first)")
+    parser.add_argument('--max-pages', type=int, default=None,
+                        help="Only extract text from the first N pages of each PDF")
+    parser.add_argument('--cache-dir', default=None,
+                        help="Directory for the extracted text cache (default: ./.pdf_text_cache)")
+    parser.add_argument('--cache-size-mb', type=int, default=256,
+                        help="Maximum size of the extracted text cache in MB (default: 256)")
+    parser.add_argument('--no-cache', action='store_true', help="Disable the extracted text cache")
+    return parser.parse_args(argv)
+
+async def serve(args: argparse.Namespace):
+    text_cache = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir or os.path.join(os.getcwd(), '.pdf_text_cache')
+        text_cache = PDFTextCache(cache_dir, max_bytes=args.cache_size_mb * 1024 * 1024)
+    
+    analyzer = UltimatePDFPortfolioAnalyzer(text_cache=text_cache, max_pages=args.max_pages,
+                                            backends=args.backends.split(',') if args.backends else None)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    service = PortfolioService(analyzer, jobs=jobs, executor=args.executor, concurrency=args.concurrency,
+                               queue_size=args.queue_size, max_upload_bytes=int(args.max_upload_mb * 1024 * 1024),
+                               read_timeout=args.read_timeout)
+    await service.start(args.host, args.port)
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.close()
+
+def main(argv: Optional[list] = None) -> int:
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    if not analyzer_module.AVAILABLE_PDF_BACKENDS:
+        print("❌ No PDF library found. Install PyPDF2, pdfplumber or PyMuPDF")
+        return 1
+    
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        logger.info("Service stopped")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
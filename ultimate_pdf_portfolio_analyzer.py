@@ -20,42 +20,1854 @@ Author: Sai Ram Peruri
 Version: 4.0 (Multi-PDF Edition)
 """
 
+import argparse
+import copy
+import hashlib
+import heapq
+import importlib
+import importlib.util
+import io
 import json
+import math
+import mmap
 import re
 import os
+import sqlite3
 import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager, nullcontext, suppress
+from dataclasses import dataclass, replace
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, ClassVar, Iterable, Iterator, Optional, Tuple, Union
 import logging
 
-# PDF extraction libraries
-try:
-    import PyPDF2
-    PDF_LIBRARY = "PyPDF2"
-except ImportError:
+# PDF extraction libraries, fastest first (the default backend order).
+# Each backend lists the modules that provide it; they are only located here
+# and imported on first use, so importing this module stays fast.
+PDF_BACKENDS = ('PyMuPDF', 'PyPDF2', 'pdfplumber')
+_PDF_BACKEND_MODULES = {
+    'PyMuPDF': ('pymupdf', 'fitz'),  # 'fitz' is the PyMuPDF module name before 1.24
+    'PyPDF2': ('PyPDF2',),
+    'pdfplumber': ('pdfplumber',),
+}
+
+def _find_backend_module(backend: str) -> Optional[str]:
+    """Return the importable module name for a backend without importing it"""
+    for module_name in _PDF_BACKEND_MODULES[backend]:
+        if importlib.util.find_spec(module_name) is not None:
+            return module_name
+    return None
+
+AVAILABLE_PDF_BACKENDS = [backend for backend in PDF_BACKENDS if _find_backend_module(backend)]
+
+# Preferred (fastest installed) backend
+PDF_LIBRARY = AVAILABLE_PDF_BACKENDS[0] if AVAILABLE_PDF_BACKENDS else None
+
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def _load_pdf_backend(backend: str):
+    """Import a PDF backend's module on first use"""
+    module_name = _find_backend_module(backend)
+    if module_name is None:
+        raise ImportError(f"PDF backend '{backend}' is not installed")
+    return importlib.import_module(module_name)
+
+def _pdf_library_version(backend: Optional[str] = None) -> str:
+    """Return the version string of a PDF library (default: the preferred one)"""
+    backend = backend or PDF_LIBRARY
+    if backend is None:
+        return 'none'
+    module = _load_pdf_backend(backend)
+    if backend == "PyMuPDF":
+        return getattr(module, 'VersionBind', None) or getattr(module, '__version__', 'unknown')
+    return getattr(module, '__version__', 'unknown')
+
+def _file_sha256(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """Compute the SHA-256 hex digest of a file without loading it whole"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# A PDF given as a filesystem path or as its bytes already in memory
+PDFSource = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+
+# Path inputs at least this large are memory-mapped once and shared by hashing and every backend
+MMAP_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+def _source_sha256(pdf_source: PDFSource) -> str:
+    """Compute the SHA-256 hex digest of a PDF path or in-memory buffer"""
+    if isinstance(pdf_source, str):
+        return _file_sha256(pdf_source)
+    # hashlib reads bytes, memoryview and mmap through the buffer protocol, without copying
+    return hashlib.sha256(pdf_source).hexdigest()
+
+class _BufferStream(io.RawIOBase):
+    """Read-only seekable file over an in-memory buffer, so file-based backends need no copy of it"""
+    
+    def __init__(self, buffer: Union[bytearray, memoryview]):
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def tell(self) -> int:
+        return self._pos
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+    
+    def readinto(self, b) -> int:
+        chunk = self._view[self._pos:self._pos + len(b)]
+        n = len(chunk)
+        b[:n] = chunk
+        self._pos += n
+        return n
+    
+    def close(self):
+        self._view.release()
+        super().close()
+
+@contextmanager
+def _open_pdf_stream(pdf_source: PDFSource) -> Iterator[Any]:
+    """Open a PDF source as a binary file object for backends that parse streams"""
+    if isinstance(pdf_source, str):
+        with open(pdf_source, 'rb') as f:
+            yield f
+    elif isinstance(pdf_source, mmap.mmap):
+        # An mmap is already a seekable file; the caller owns (and closes) it
+        pdf_source.seek(0)
+        yield pdf_source
+    elif isinstance(pdf_source, bytes):
+        # BytesIO shares an immutable bytes object's buffer instead of copying it
+        yield io.BytesIO(pdf_source)
+    else:
+        with io.BufferedReader(_BufferStream(pdf_source)) as f:
+            yield f
+
+class _FileMap(mmap.mmap):
+    """Read-only mapping of a PDF file that remembers its path (see _map_large_pdf)"""
+    path = None
+
+@contextmanager
+def _map_large_pdf(pdf_source: PDFSource, threshold: int = MMAP_THRESHOLD_BYTES) -> Iterator[PDFSource]:
+    """Memory-map a large PDF path for the duration of the block; other sources pass through"""
+    if not isinstance(pdf_source, str) or os.path.getsize(pdf_source) < threshold:
+        yield pdf_source
+        return
+    
+    with open(pdf_source, 'rb') as f, _FileMap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        mapped.path = pdf_source
+        yield mapped
+
+def _shareable_source(pdf_source: PDFSource) -> Union[str, bytes]:
+    """Return a form of a PDF source that can be sent to another process (a path where one is known)"""
+    if isinstance(pdf_source, (str, bytes)):
+        return pdf_source
+    if isinstance(pdf_source, _FileMap) and pdf_source.path:
+        return pdf_source.path
+    return bytes(pdf_source)
+
+class PDFTextCache:
+    """Content-addressed on-disk cache for extracted PDF text
+    
+    Entries are keyed by the file's SHA-256 plus the extraction backend and its
+    version, so an unchanged resume is never re-extracted and upgrading or
+    switching the PDF library invalidates old entries automatically. The cache
+    directory is kept under max_bytes by evicting least recently used entries.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._written_bytes = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def make_key(self, pdf_path: str, backend: str, backend_version: str, options: str = '') -> str:
+        """Build the cache key for a PDF, extraction backend and extraction options"""
+        return self.key_for_hash(_file_sha256(pdf_path), backend, backend_version, options)
+    
+    def key_for_hash(self, content_hash: str, backend: str, backend_version: str, options: str = '') -> str:
+        """Build the cache key from an already computed content hash"""
+        scope = f"v{self.FORMAT_VERSION}:{backend}:{backend_version}:{options}:{content_hash}"
+        return hashlib.sha256(scope.encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.txt")
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return cached text for key, or None on a miss"""
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            return None
+        
+        # Touch the entry so LRU eviction sees it as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return text
+    
+    def put(self, key: str, text: str):
+        """Store text under key, evicting old entries when over budget"""
+        entry_path = self._entry_path(key)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Could not write text cache entry {entry_path}: {e}")
+            return
+        
+        self._written_bytes += len(text.encode('utf-8'))
+        if self._written_bytes > self.max_bytes // 4:
+            self.prune()
+    
+    def prune(self) -> int:
+        """Evict least recently used entries until the cache fits max_bytes"""
+        entries = []
+        total_bytes = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.txt'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_bytes += stat.st_size
+        
+        evicted = 0
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            total_bytes -= size
+            evicted += 1
+        
+        self._written_bytes = 0
+        if evicted:
+            logger.info(f"Evicted {evicted} entries from PDF text cache")
+        return evicted
+    
+    def clear(self) -> int:
+        """Remove every cached entry and return how many were deleted"""
+        removed = 0
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and (entry.name.endswith('.txt') or entry.name.endswith('.tmp')):
+                    os.remove(entry.path)
+                    removed += 1
+        return removed
+
+class PortfolioRecord:
+    """Base class for the slotted records behind experiences, projects, skills, certifications and achievements
+    
+    Records replace per-item dicts: field names live on the class instead of in
+    every item, and categorical strings (companies, titles, technologies, ...)
+    are interned so repeated values share one object across a corpus. They are
+    converted to dicts only when serialized (see _portfolio_json_default), and
+    record['key'] / record.get('key') still work for read-only consumers.
+    """
+    
+    __slots__ = ()
+    
+    # Fields interned on construction, and optional fields left out of the dict form while None
+    INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = ()
+    OMIT_IF_NONE: ClassVar[Tuple[str, ...]] = ()
+    
+    def __post_init__(self):
+        for name in self.INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the plain dict written to the portfolio JSON"""
+        # The generated __slots__ lists exactly the dataclass fields, in declaration order
+        return {name: getattr(self, name) for name in self.__slots__
+                if not (name in self.OMIT_IF_NONE and getattr(self, name) is None)}
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PortfolioRecord':
+        """Rebuild a record from its dict form"""
+        return cls(**data)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__ or (key in self.OMIT_IF_NONE and getattr(self, key) is None):
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+@dataclass(slots=True)
+class Experience(PortfolioRecord):
+    """One role parsed from a resume's experience section"""
+    id: int
+    company: str
+    title: str = ''
+    location: str = ''
+    period: str = ''
+    type: str = 'Full-time'
+    achievements: Optional[List[str]] = None
+    technologies: Optional[List[str]] = None
+    source: str = ''
+    sources: Optional[List[str]] = None
+    
+    INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = ('company', 'title', 'location', 'period', 'type', 'source')
+    OMIT_IF_NONE: ClassVar[Tuple[str, ...]] = ('sources',)
+    
+    def __post_init__(self):
+        if self.achievements is None:
+            self.achievements = []
+        if self.technologies is None:
+            self.technologies = []
+        PortfolioRecord.__post_init__(self)
+
+@dataclass(slots=True)
+class Project(PortfolioRecord):
+    """One project parsed from a resume's projects section"""
+    id: int
+    title: str
+    category: str
+    description: str
+    longDescription: str
+    image: str
+    technologies: List[str]
+    features: List[str]
+    githubUrl: str
+    liveUrl: Optional[str]
+    status: str
+    startDate: str
+    endDate: str
+    
+    INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = ('title', 'category', 'image', 'status')
+
+@dataclass(slots=True)
+class Skill(PortfolioRecord):
+    """One matched skill with its estimated level and years"""
+    name: str
+    level: int
+    years: int
+    category: str
+    
+    INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = ('name', 'category')
+
+@dataclass(slots=True)
+class Certification(PortfolioRecord):
+    """One certification found in a resume"""
+    id: int
+    name: str
+    issuer: str
+    date: str
+    credentialId: str
+    description: str
+    skills: List[str]
+    badgeUrl: str
+    verificationUrl: str
+    
+    INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = ('name', 'issuer', 'date', 'badgeUrl')
+
+@dataclass(slots=True)
+class Achievement(PortfolioRecord):
+    """One award or recognition line found in a resume"""
+    id: int
+    title: str
+    organization: str
+    date: str
+    category: str
+    description: str
+    icon: str
+    
+    INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = ('organization', 'date', 'category', 'icon')
+
+@dataclass(slots=True)
+class SkippedDocument(PortfolioRecord):
+    """A PDF left out of the results because its analysis hit a limit or failed in its worker"""
+    file: str
+    reason: str  # 'time_limit', 'memory_limit', 'crashed' or 'error'
+    detail: str
+    seconds: float
+    
+    INTERNED_FIELDS: ClassVar[Tuple[str, ...]] = ('reason',)
+
+def _portfolio_json_default(obj: Any) -> Any:
+    """json.dump(s) hook that converts portfolio records to dicts as they are written"""
+    if isinstance(obj, PortfolioRecord):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Sectioned output (see save_portfolio_sections): manifest format and section file names
+SECTIONS_FORMAT_VERSION = 1
+SECTION_HASH_CHARS = 12
+# Manifests whose section files are kept (current + previous), so a page holding an older manifest can still load
+SECTION_GENERATIONS_KEPT = 3
+SECTION_HISTORY_FILE = '.manifest_history.json'
+
+# ES module output (see save_portfolio_es_modules)
+ES_MODULE_HEADER = "// Generated by ultimate_pdf_portfolio_analyzer.py from the resume PDFs - do not edit.\n"
+_JS_IDENTIFIER_RE = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
+JS_RESERVED_WORDS = frozenset((
+    'await', 'break', 'case', 'catch', 'class', 'const', 'continue', 'debugger', 'default', 'delete', 'do',
+    'else', 'enum', 'export', 'extends', 'false', 'finally', 'for', 'function', 'if', 'implements', 'import',
+    'in', 'instanceof', 'interface', 'let', 'new', 'null', 'package', 'private', 'protected', 'public',
+    'return', 'static', 'super', 'switch', 'this', 'throw', 'true', 'try', 'typeof', 'var', 'void', 'while',
+    'with', 'yield', 'arguments', 'eval'
+))
+
+def _is_js_identifier(name: str) -> bool:
+    """Check whether a name can be used as a JavaScript binding"""
+    return bool(_JS_IDENTIFIER_RE.match(name)) and name not in JS_RESERVED_WORDS
+
+def _write_if_changed(path: str, content: bytes) -> bool:
+    """Atomically write content unless the file already holds it; return whether it was written"""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with _atomic_write(path) as f:
+        f.write(content)
+    return True
+
+# JSON encoders for portfolio output; 'orjson' is optional and only imported on first use
+JSON_ENCODERS = ('orjson', 'json')
+
+@lru_cache(maxsize=None)
+def _load_orjson():
+    """Import orjson on first use"""
+    return importlib.import_module('orjson')
+
+@contextmanager
+def _atomic_write(path: str, mode: str = 'wb') -> Iterator[Any]:
+    """Write to a temp file next to path and rename it over path only once complete"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        import pdfplumber
-        PDF_LIBRARY = "pdfplumber"
-    except ImportError:
+        with open(tmp_path, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+class PortfolioJSONWriter:
+    """Encodes portfolio data one top-level section at a time and writes it atomically
+    
+    Pretty output is laid out like json.dump(data, indent=2, ensure_ascii=False)
+    and compact output drops all optional whitespace. With the 'orjson' encoder
+    (picked by 'auto' when installed) each section is encoded in C; the
+    standard library falls back to its pure-Python encoder whenever it indents.
+    The encoders format some values differently (orjson writes 1e-05 as
+    0.00001 and NaN as null), so the exact bytes depend on the encoder; output
+    that is content-hashed uses encoder='json' to stay the same everywhere.
+    """
+    
+    def __init__(self, compact: bool = False, encoder: str = 'auto'):
+        self.compact = compact
+        self.encoder = self._resolve_encoder(encoder)
+    
+    @staticmethod
+    def _resolve_encoder(encoder: str) -> str:
+        """Validate an encoder name, mapping 'auto' to the fastest installed one"""
+        if encoder == 'auto':
+            return 'orjson' if importlib.util.find_spec('orjson') is not None else 'json'
+        if encoder not in JSON_ENCODERS:
+            raise ValueError(f"Unknown JSON encoder '{encoder}' (choose from auto, {', '.join(JSON_ENCODERS)})")
+        if encoder == 'orjson' and importlib.util.find_spec('orjson') is None:
+            raise ImportError("JSON encoder 'orjson' is not installed (pip install orjson)")
+        return encoder
+    
+    def encode(self, value: Any, level: int = 0) -> bytes:
+        """Encode one value as UTF-8 JSON, indented to sit `level` levels deep in the document"""
+        data = None
+        if self.encoder == 'orjson':
+            orjson = _load_orjson()
+            option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+            if not self.compact:
+                option |= orjson.OPT_INDENT_2
+            try:
+                data = orjson.dumps(value, default=_portfolio_json_default, option=option)
+            except TypeError:
+                # e.g. integers beyond 64 bits; the standard library handles everything JSON can hold
+                data = None
+        if data is None:
+            if self.compact:
+                text = json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=_portfolio_json_default)
+            else:
+                text = json.dumps(value, ensure_ascii=False, indent=2, default=_portfolio_json_default)
+            data = text.encode('utf-8')
+        if level and not self.compact:
+            data = data.replace(b'\n', b'\n' + b'  ' * level)
+        return data
+    
+    def iter_chunks(self, data: Any) -> Iterator[bytes]:
+        """Yield the encoded document section by section"""
+        if not isinstance(data, dict) or not data:
+            yield self.encode(data)
+            return
+        
+        if self.compact:
+            opening, separator, colon, closing = b'{', b',', b':', b'}'
+        else:
+            opening, separator, colon, closing = b'{\n  ', b',\n  ', b': ', b'\n}'
+        yield opening
+        for position, (key, value) in enumerate(data.items()):
+            key_bytes = self.encode(key if isinstance(key, str) else str(key))
+            yield (separator if position else b'') + key_bytes + colon + self.encode(value, 1)
+        yield closing
+    
+    def dumps(self, data: Any) -> bytes:
+        """Encode a whole document"""
+        return b''.join(self.iter_chunks(data))
+    
+    def write(self, data: Any, path: str) -> int:
+        """Stream a document to path atomically and return the number of bytes written"""
+        written = 0
+        with _atomic_write(path) as f:
+            for chunk in self.iter_chunks(data):
+                written += f.write(chunk)
+        return written
+
+# Legal-form words ignored when comparing company names
+COMPANY_SUFFIXES = frozenset((
+    'inc', 'incorporated', 'llc', 'llp', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company',
+    'plc', 'pvt', 'private', 'gmbh', 'ag', 'sa', 'pte'
+))
+
+_NON_ALNUM_RE = re.compile(r'[^0-9a-z]+')
+
+def _normalize_words(text: str) -> List[str]:
+    """Lowercase alphanumeric words of text"""
+    return _NON_ALNUM_RE.sub(' ', text.lower().replace('&', ' and ')).split()
+
+def _normalize_company(company: str) -> str:
+    words = _normalize_words(company)
+    return ' '.join(word for word in words if word not in COMPANY_SUFFIXES) or ' '.join(words)
+
+@lru_cache(maxsize=65536)
+def _token_hash(token: str) -> int:
+    """Stable 32-bit hash of a token (Python's hash() is salted per process)"""
+    return zlib.crc32(token.encode('utf-8'))
+
+def _char_shingles(text: str, size: int = 3) -> frozenset:
+    """Hashed character n-grams of a normalized string"""
+    padded = f" {text} "
+    return frozenset(_token_hash(padded[i:i + size]) for i in range(max(1, len(padded) - size + 1)))
+
+def _word_shingles(texts: Iterable[str], size: int = 2) -> frozenset:
+    """Hashed word n-grams across several texts, combined from cached per-word hashes"""
+    shingles = set()
+    for text in texts:
+        hashes = [_token_hash(word) for word in _normalize_words(text)]
+        if len(hashes) < size:
+            shingles.update(hashes)
+        for i in range(len(hashes) - size + 1):
+            shingle = 0
+            for h in hashes[i:i + size]:
+                shingle = (shingle * 1000003 + h) & 0xFFFFFFFFFFFF
+            shingles.add(shingle)
+    return frozenset(shingles)
+
+# Title words that tell roles at one company apart (promotions): levels, seniority and roman/numeric grades
+TITLE_LEVEL_WORDS = frozenset((
+    'i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
+    'jr', 'junior', 'sr', 'senior', 'staff', 'principal', 'distinguished', 'lead', 'chief', 'head',
+    'associate', 'assistant', 'intern', 'trainee', 'entry', 'mid', 'fellow'
+))
+_TITLE_LEVEL_RE = re.compile(r'^(?:[lepm]|ic|sde|swe)?\d+$')
+
+def _title_levels(title_words: Iterable[str]) -> frozenset:
+    """Level and seniority tokens of a normalized title (e.g. {'ii'} or {'sr'} or {'l5'})"""
+    return frozenset(word for word in title_words if word in TITLE_LEVEL_WORDS or _TITLE_LEVEL_RE.match(word))
+
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a or not b:
+        return 0.0
+    intersection = len(a & b)
+    return intersection / (len(a) + len(b) - intersection)
+
+class ExperienceDeduplicator:
+    """Groups experiences that describe the same role, without comparing every pair
+    
+    Experiences first group on an exact normalized key (case, punctuation and
+    legal suffixes such as 'Inc' or 'Ltd' ignored in the company). Each group
+    then gets a one-permutation MinHash signature over its company and title
+    character trigrams and its bullet word bigrams. LSH banding buckets those
+    signatures, so only groups sharing a bucket are compared. Two groups are
+    the same role when their companies are at least `threshold` similar
+    (Jaccard), their titles carry the same level tokens (I/II, Sr/Staff,
+    L4/L5, ...), and either their normalized titles are equal or both their
+    titles and their bullets are at least `threshold` similar.
+    
+    Experiences from the same source PDF are never merged: a resume lists
+    each role once, so two entries in one file are two roles.
+    """
+    
+    NUM_BINS = 32
+    # Buckets this large hold boilerplate shared by unrelated roles; comparing them is quadratic and useless
+    MAX_BUCKET_SIZE = 64
+    
+    def __init__(self, threshold: float = 0.8):
+        self.threshold = threshold
+        self.rows = self._rows_per_band(threshold, self.NUM_BINS)
+    
+    @staticmethod
+    def _rows_per_band(threshold: float, num_bins: int) -> int:
+        """Most rows per band whose LSH cut-off, (1/bands)**(1/rows), stays well below the threshold"""
+        best = 1
+        rows = 1
+        while rows <= num_bins:
+            if (rows / num_bins) ** (1 / rows) <= threshold - 0.1:
+                best = rows
+            rows *= 2
+        return best
+    
+    def _signature(self, shingles: frozenset) -> Tuple[int, ...]:
+        """One-permutation MinHash: minimum hash per bin, empty bins filled from the next non-empty bin"""
+        bins = [None] * self.NUM_BINS
+        for h in shingles:
+            b = h % self.NUM_BINS
+            value = h // self.NUM_BINS
+            if bins[b] is None or value < bins[b]:
+                bins[b] = value
+        
+        filled = [i for i, value in enumerate(bins) if value is not None]
+        if not filled:
+            return tuple([0] * self.NUM_BINS)
+        for i in range(self.NUM_BINS):
+            if bins[i] is None:
+                # Rotation densification: borrow the next filled bin, offset by the distance borrowed
+                j = next((k for k in filled if k > i), filled[0])
+                bins[i] = bins[j] + ((j - i) % self.NUM_BINS) * 0x100000000
+        return tuple(bins)
+    
+    @staticmethod
+    def _sources(exp: Experience) -> set:
+        """Source files an experience came from (empty when unknown)"""
+        return {source for source in (exp.sources or [exp.source]) if source and source != 'unknown'}
+    
+    def cluster(self, experiences: List[Experience]) -> List[List[int]]:
+        """Return clusters of indexes into experiences, ordered by first appearance"""
+        # Exact company/title matches group together, split so that no group holds two entries of one source
+        groups = []
+        group_sources = []
+        keys = []
+        open_groups = {}
+        for i, exp in enumerate(experiences):
+            key = (_normalize_company(exp.company), ' '.join(_normalize_words(exp.title)))
+            sources = self._sources(exp)
+            for g in open_groups.get(key, ()):
+                if not group_sources[g] & sources:
+                    groups[g].append(i)
+                    group_sources[g] |= sources
+                    break
+            else:
+                open_groups.setdefault(key, []).append(len(groups))
+                groups.append([i])
+                group_sources.append(set(sources))
+                keys.append(key)
+        if self.threshold >= 1.0 or len(keys) < 2:
+            return groups
+        
+        companies = [_char_shingles(company) for company, _ in keys]
+        titles = [_char_shingles(title) for _, title in keys]
+        levels = [_title_levels(title.split()) for _, title in keys]
+        bullets = [_word_shingles(achievement for i in group for achievement in experiences[i].achievements)
+                   for group in groups]
+        
+        buckets = {}
+        for g in range(len(keys)):
+            signature = self._signature(companies[g] | {h ^ 0x5BD1E995 for h in titles[g]} | bullets[g])
+            for band in range(0, self.NUM_BINS, self.rows):
+                buckets.setdefault((band, signature[band:band + self.rows]), []).append(g)
+        
+        parent = list(range(len(keys)))
+        
+        def find(g: int) -> int:
+            while parent[g] != g:
+                parent[g] = parent[parent[g]]
+                g = parent[g]
+            return g
+        
+        compared = set()
+        for members in buckets.values():
+            if len(members) < 2 or len(members) > self.MAX_BUCKET_SIZE:
+                continue
+            for a_pos, a in enumerate(members):
+                for b in members[a_pos + 1:]:
+                    if (a, b) in compared:
+                        continue
+                    compared.add((a, b))
+                    if not self._same_role(a, b, keys, companies, titles, levels, bullets):
+                        continue
+                    root_a, root_b = find(a), find(b)
+                    if root_a == root_b or group_sources[root_a] & group_sources[root_b]:
+                        continue
+                    # Keep the earliest group as the root so clusters stay in first-seen order
+                    root, child = min(root_a, root_b), max(root_a, root_b)
+                    parent[child] = root
+                    # Sources of a cluster are kept on its root
+                    group_sources[root] |= group_sources[child]
+        
+        clusters = {}
+        for g, group in enumerate(groups):
+            clusters.setdefault(find(g), []).extend(group)
+        return [sorted(indexes) for indexes in clusters.values()]
+    
+    def _same_role(self, a: int, b: int, keys: List[Tuple[str, str]], companies: List[frozenset],
+                   titles: List[frozenset], levels: List[frozenset], bullets: List[frozenset]) -> bool:
+        """Whether groups a and b describe one role (see the class docstring)"""
+        if levels[a] != levels[b] or _jaccard(companies[a], companies[b]) < self.threshold:
+            return False
+        if keys[a][1] == keys[b][1]:
+            return True
+        return (_jaccard(titles[a], titles[b]) >= self.threshold and
+                _jaccard(bullets[a], bullets[b]) >= self.threshold)
+    
+    @staticmethod
+    def bullet_shingles(bullet: str) -> frozenset:
+        """Word set of one bullet (bigrams are too strict for single sentences)"""
+        return _word_shingles((bullet,), size=1)
+    
+    def is_duplicate_bullet(self, shingles: frozenset, existing: List[frozenset]) -> bool:
+        """Whether a bullet is a light edit of one already kept (all given as bullet_shingles)"""
+        return any(_jaccard(shingles, other) >= self.threshold for other in existing)
+
+class AnalysisManifest:
+    """Record of every analyzed input for incremental re-analysis
+    
+    For each PDF (keyed by its path relative to the workspace) the manifest
+    keeps the size, mtime and SHA-256 seen at the last run together with the
+    extracted text and parsed experiences. A file whose size and mtime are
+    unchanged is trusted as-is; otherwise its hash decides whether it really
+    changed. Changing the extraction options discards the whole manifest.
+    """
+    
+    FORMAT_VERSION = 1
+    
+    def __init__(self, path: str, options: Dict[str, Any]):
+        self.path = path
+        self.options = options
+        self.files = {}
+    
+    @classmethod
+    def load(cls, path: str, options: Dict[str, Any]) -> 'AnalysisManifest':
+        """Load a manifest, starting empty if it is missing, unreadable or stale"""
+        manifest = cls(path, options)
         try:
-            import fitz  # PyMuPDF
-            PDF_LIBRARY = "PyMuPDF"
-        except ImportError:
-            PDF_LIBRARY = None
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return manifest
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+            return manifest
+        
+        if data.get('version') != cls.FORMAT_VERSION or data.get('options') != options:
+            logger.info("Extraction options changed since the last run, re-analyzing every file")
+            return manifest
+        manifest.files = data.get('files', {})
+        for entry in manifest.files.values():
+            entry['experiences'] = [Experience.from_dict(exp) for exp in entry['experiences']]
+            if entry.get('skipped'):
+                entry['skipped'] = SkippedDocument.from_dict(entry['skipped'])
+        return manifest
+    
+    def save(self):
+        """Write the manifest atomically"""
+        PortfolioJSONWriter(compact=True).write(
+            {'version': self.FORMAT_VERSION, 'options': self.options, 'files': self.files}, self.path)
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-logger = logging.getLogger(__name__)
+class LegacyTextIndex:
+    """In-memory index of text saved by earlier tools in the legacy resume_analysis*.json files
+    
+    The JSON files map PDF filenames to dicts holding 'original_text' or 'text'.
+    They are parsed once into lookups by PDF basename and by content hash (taken
+    from a recorded 'sha256' or by hashing the named PDF if it is still on disk),
+    and re-parsed only when one of the files changes size or mtime. Earlier
+    files in JSON_FILES take precedence.
+    """
+    
+    JSON_FILES = (
+        'resume_analysis_final.json',
+        'resume_correctly_extracted.json',
+        'resume_analysis.json'
+    )
+    
+    def __init__(self, workspace_dir: str, pdf_dirs: Optional[List[str]] = None):
+        self.workspace_dir = workspace_dir
+        self.pdf_dirs = pdf_dirs if pdf_dirs is not None else [workspace_dir]
+        self.by_name = {}
+        self.by_hash = {}
+        self._signature = None
+        self._lock = threading.Lock()
+    
+    def __getstate__(self):
+        # Locks cannot be pickled; worker processes build their own index on first use
+        state = self.__dict__.copy()
+        state.update(_lock=None, by_name={}, by_hash={}, _signature=None)
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def _current_signature(self) -> Tuple[Any, ...]:
+        signature = []
+        for json_file in self.JSON_FILES:
+            try:
+                stat = os.stat(os.path.join(self.workspace_dir, json_file))
+                signature.append((stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+    
+    def refresh(self) -> bool:
+        """Reload the index if any JSON file was added, changed or removed; returns True if reloaded"""
+        signature = self._current_signature()
+        if signature == self._signature:
+            return False
+        
+        with self._lock:
+            if signature == self._signature:
+                return False
+            by_name, by_hash = {}, {}
+            for json_file, file_signature in zip(self.JSON_FILES, signature):
+                if file_signature is not None:
+                    self._index_json_file(json_file, by_name, by_hash)
+            self.by_name, self.by_hash, self._signature = by_name, by_hash, signature
+        logger.info(f"Indexed {len(self.by_name)} PDFs from legacy JSON extraction files")
+        return True
+    
+    def _index_json_file(self, json_file: str, by_name: Dict[str, Tuple[str, str]], by_hash: Dict[str, Tuple[str, str]]):
+        try:
+            with open(os.path.join(self.workspace_dir, json_file), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping unreadable {json_file}: {e}")
+            return
+        if not isinstance(data, dict):
+            return
+        
+        for key, value in data.items():
+            if not key.endswith('.pdf') or not isinstance(value, dict):
+                continue
+            if 'original_text' in value:
+                text = value['original_text']
+            elif 'text' in value:
+                text = value['text']
+            else:
+                continue
+            
+            entry = (json_file, text)
+            by_name.setdefault(os.path.basename(key), entry)
+            content_hash = value.get('sha256') or self._hash_named_pdf(key)
+            if content_hash:
+                by_hash.setdefault(content_hash, entry)
+    
+    def _hash_named_pdf(self, key: str) -> Optional[str]:
+        for pdf_dir in self.pdf_dirs:
+            pdf_path = os.path.join(pdf_dir, os.path.basename(key))
+            if os.path.isfile(pdf_path):
+                return _file_sha256(pdf_path)
+        return None
+    
+    def lookup(self, pdf_path: str, pdf_source: Optional[PDFSource] = None) -> Optional[Tuple[str, str]]:
+        """Return (json_file, text) recorded for this PDF by name or content, or None
+        
+        In-memory PDFs (pdf_source given) are matched by content only: their name
+        comes from the caller and must not select text recorded for another file.
+        """
+        self.refresh()
+        entry = self.by_name.get(os.path.basename(pdf_path)) if pdf_source is None else None
+        if entry is None and self.by_hash:
+            source = pdf_path if pdf_source is None else pdf_source
+            if not isinstance(source, str) or os.path.isfile(source):
+                entry = self.by_hash.get(_source_sha256(source))
+        return entry
+
+# Skill taxonomy used by extract_skills_from_text: category -> keyword -> skill info
+SKILL_TAXONOMY = {
+    'languages': {
+        'python': {'name': 'Python', 'category': 'Programming'},
+        'java': {'name': 'Java', 'category': 'Programming'},
+        'javascript': {'name': 'JavaScript', 'category': 'Programming'},
+        'typescript': {'name': 'TypeScript', 'category': 'Programming'},
+        'c++': {'name': 'C++', 'category': 'Programming'},
+        'c#': {'name': 'C#', 'category': 'Programming'},
+        'go': {'name': 'Go', 'category': 'Programming'},
+        'rust': {'name': 'Rust', 'category': 'Programming'},
+        'php': {'name': 'PHP', 'category': 'Programming'},
+        'ruby': {'name': 'Ruby', 'category': 'Programming'},
+        'bash': {'name': 'Bash/Shell', 'category': 'Scripting'},
+        'shell': {'name': 'Shell Scripting', 'category': 'Scripting'},
+        'powershell': {'name': 'PowerShell', 'category': 'Scripting'}
+    },
+    'frontend': {
+        'react': {'name': 'React', 'category': 'Framework'},
+        'angular': {'name': 'Angular', 'category': 'Framework'},
+        'vue': {'name': 'Vue.js', 'category': 'Framework'},
+        'html': {'name': 'HTML/CSS', 'category': 'Markup'},
+        'css': {'name': 'CSS', 'category': 'Styling'},
+        'sass': {'name': 'Sass', 'category': 'Styling'},
+        'tailwind': {'name': 'Tailwind CSS', 'category': 'Framework'},
+        'bootstrap': {'name': 'Bootstrap', 'category': 'Framework'},
+        'vite': {'name': 'Vite', 'category': 'Build Tool'},
+        'webpack': {'name': 'Webpack', 'category': 'Build Tool'}
+    },
+    'backend': {
+        'node': {'name': 'Node.js', 'category': 'Runtime'},
+        'express': {'name': 'Express.js', 'category': 'Framework'},
+        'django': {'name': 'Django', 'category': 'Framework'},
+        'flask': {'name': 'Flask', 'category': 'Framework'},
+        'spring': {'name': 'Spring', 'category': 'Framework'},
+        'rest': {'name': 'REST APIs', 'category': 'Architecture'},
+        'graphql': {'name': 'GraphQL', 'category': 'API'},
+        'api': {'name': 'API Development', 'category': 'Architecture'}
+    },
+    'devops': {
+        'docker': {'name': 'Docker', 'category': 'Containerization'},
+        'kubernetes': {'name': 'Kubernetes', 'category': 'Orchestration'},
+        'jenkins': {'name': 'Jenkins', 'category': 'CI/CD'},
+        'terraform': {'name': 'Terraform', 'category': 'IaC'},
+        'ansible': {'name': 'Ansible', 'category': 'Configuration'},
+        'github actions': {'name': 'GitHub Actions', 'category': 'CI/CD'},
+        'gitlab': {'name': 'GitLab CI', 'category': 'CI/CD'},
+        'circleci': {'name': 'CircleCI', 'category': 'CI/CD'},
+        'helm': {'name': 'Helm', 'category': 'Package Management'},
+        'vault': {'name': 'HashiCorp Vault', 'category': 'Security'}
+    },
+    'cloud': {
+        'aws': {'name': 'AWS', 'category': 'Cloud Platform'},
+        'azure': {'name': 'Azure', 'category': 'Cloud Platform'},
+        'gcp': {'name': 'Google Cloud Platform', 'category': 'Cloud Platform'},
+        'google cloud': {'name': 'Google Cloud', 'category': 'Cloud Platform'},
+        'ec2': {'name': 'EC2', 'category': 'AWS Service'},
+        's3': {'name': 'S3', 'category': 'AWS Service'},
+        'rds': {'name': 'RDS', 'category': 'AWS Service'},
+        'vpc': {'name': 'VPC', 'category': 'AWS Service'},
+        'iam': {'name': 'IAM', 'category': 'AWS Service'},
+        'lambda': {'name': 'Lambda', 'category': 'AWS Service'},
+        'cloudformation': {'name': 'CloudFormation', 'category': 'AWS Service'}
+    },
+    'databases': {
+        'mysql': {'name': 'MySQL', 'category': 'Relational'},
+        'postgresql': {'name': 'PostgreSQL', 'category': 'Relational'},
+        'mongodb': {'name': 'MongoDB', 'category': 'NoSQL'},
+        'redis': {'name': 'Redis', 'category': 'Cache'},
+        'elasticsearch': {'name': 'Elasticsearch', 'category': 'Search'},
+        'cassandra': {'name': 'Cassandra', 'category': 'NoSQL'},
+        'dynamodb': {'name': 'DynamoDB', 'category': 'NoSQL'},
+        'sqlite': {'name': 'SQLite', 'category': 'Relational'}
+    },
+    'tools': {
+        'git': {'name': 'Git', 'category': 'Version Control'},
+        'linux': {'name': 'Linux/Unix', 'category': 'Operating System'},
+        'ubuntu': {'name': 'Ubuntu', 'category': 'Operating System'},
+        'centos': {'name': 'CentOS', 'category': 'Operating System'},
+        'red hat': {'name': 'Red Hat Enterprise Linux', 'category': 'Operating System'},
+        'windows': {'name': 'Windows', 'category': 'Operating System'},
+        'jira': {'name': 'Jira', 'category': 'Project Management'},
+        'confluence': {'name': 'Confluence', 'category': 'Documentation'},
+        'slack': {'name': 'Slack', 'category': 'Communication'},
+        'vscode': {'name': 'VS Code', 'category': 'IDE'},
+        'intellij': {'name': 'IntelliJ IDEA', 'category': 'IDE'},
+        'postman': {'name': 'Postman', 'category': 'API Testing'}
+    }
+}
+
+# Technology keywords tagged on experience and project bullet points
+TECH_KEYWORDS = (
+    # Cloud platforms
+    'aws', 'azure', 'gcp', 'google cloud', 'cloud',
+    # Programming languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby',
+    # DevOps tools
+    'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 'vault', 'github actions',
+    # Databases
+    'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
+    # Frameworks
+    'react', 'angular', 'vue', 'django', 'flask', 'spring', 'express',
+    # Tools
+    'git', 'jira', 'confluence', 'slack', 'linux', 'windows'
+)
+
+# Display form of each keyword, interned so every record shares one string per technology
+TECH_DISPLAY_NAMES = {tech: sys.intern(tech.title()) for tech in TECH_KEYWORDS}
+
+class KeywordMatcher:
+    """Find whole-word keyword occurrences in a single pass over the text
+    
+    All keywords are compiled into one prefix-factored regular expression, so
+    matching cost grows with the text length rather than with the number of
+    keywords. Keywords only match on word boundaries: 'go' does not match
+    inside 'google' and 'java' does not match inside 'javascript'.
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = sorted(set(keywords))
+        trie_pattern = self._build_trie_pattern(self.keywords)
+        # Zero-width lookahead lets overlapping keywords ('google cloud' and 'cloud') both match
+        self._pattern = re.compile(rf"(?<!\w)(?=({trie_pattern})(?!\w))")
+    
+    @classmethod
+    def _build_trie_pattern(cls, keywords: List[str]) -> str:
+        """Build a regex alternation with shared prefixes factored out"""
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+        return cls._trie_node_pattern(trie)
+    
+    @classmethod
+    def _trie_node_pattern(cls, node: Dict[str, Any]) -> str:
+        branches = []
+        is_terminal = False
+        for char in sorted(node):
+            if char == '':
+                is_terminal = True
+            else:
+                branches.append(re.escape(char) + cls._trie_node_pattern(node[char]))
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Longest match first, then fall back to the shorter keyword ending here
+        return f"(?:{pattern})?" if is_terminal else pattern
+    
+    def finditer(self, text_lower: str):
+        """Yield (keyword, position) for every keyword occurrence"""
+        for match in self._pattern.finditer(text_lower):
+            yield match.group(1), match.start()
+    
+    def matched_keywords(self, text_lower: str) -> set:
+        """Return the set of keywords that occur in the text"""
+        return {keyword for keyword, _ in self.finditer(text_lower)}
+
+@lru_cache(maxsize=1)
+def _get_keyword_matcher() -> KeywordMatcher:
+    """Compile the shared skill and technology matcher on first use"""
+    keywords = set(TECH_KEYWORDS)
+    for skill_dict in SKILL_TAXONOMY.values():
+        keywords.update(skill_dict)
+    return KeywordMatcher(keywords)
+
+# Section header terms, matched as substrings of lowercased lines
+EXPERIENCE_SECTION_TERMS = (
+    'professional experience', 'work experience', 'employment history',
+    'career history', 'experience', 'employment', 'work history'
+)
+EDUCATION_SECTION_TERMS = ('education',)
+PROJECT_SECTION_TERMS = ('projects', 'academic projects', 'personal projects', 'portfolio')
+BIO_SECTION_TERMS = ('summary', 'objective', 'about', 'profile')
+ACHIEVEMENT_TERMS = ('award', 'recognition', 'achievement', 'honor', 'accomplishment')
+
+# Terms that end each section
+EXPERIENCE_END_TERMS = ('education', 'skills', 'projects', 'certifications')
+EDUCATION_END_TERMS = ('experience', 'skills', 'projects', 'certifications')
+PROJECT_END_TERMS = ('experience', 'education', 'skills', 'certifications')
+BIO_END_TERMS = ('experience', 'education', 'skills')
+
+INDEXED_TERMS = tuple(dict.fromkeys(
+    EXPERIENCE_SECTION_TERMS + EDUCATION_SECTION_TERMS + PROJECT_SECTION_TERMS +
+    BIO_SECTION_TERMS + ACHIEVEMENT_TERMS + EXPERIENCE_END_TERMS +
+    EDUCATION_END_TERMS + PROJECT_END_TERMS + BIO_END_TERMS
+))
+_TERM_BITS = {term: 1 << bit for bit, term in enumerate(INDEXED_TERMS)}
+
+@lru_cache(maxsize=None)
+def _terms_mask(terms: Tuple[str, ...]) -> int:
+    """Combine indexed terms into a bitmask"""
+    mask = 0
+    for term in terms:
+        mask |= _TERM_BITS[term]
+    return mask
+
+# Line type bits assigned by LineClassifier; a line may carry several
+LINE_COMPANY = 1 << 0
+LINE_TITLE = 1 << 1
+LINE_DATE = 1 << 2
+LINE_LOCATION = 1 << 3
+LINE_BULLET = 1 << 4
+LINE_PROJECT_TITLE = 1 << 5
+LINE_INSTITUTION = 1 << 6
+LINE_DEGREE = 1 << 7
+
+# Keywords behind the line types, matched as substrings of lowercased lines
+COMPANY_INDICATORS = ('inc', 'corp', 'llc', 'ltd', 'company', 'solutions', 'technologies', 'systems',
+                      'services', 'university', 'college')
+COMPANY_EXCLUDED_TERMS = ('experience', 'skills', 'education', 'projects')
+TITLE_KEYWORDS = ('engineer', 'developer', 'analyst', 'manager', 'assistant', 'specialist', 'consultant',
+                  'architect', 'lead', 'senior', 'junior', 'intern')
+DATE_WORDS = ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+              'present', 'current')
+LOCATION_WORDS = ('usa', 'india', 'canada', 'uk', 'remote')
+PROJECT_INDICATORS = ('system', 'platform', 'application', 'tool', 'website', 'app', 'portal', 'dashboard')
+INSTITUTION_KEYWORDS = ('university', 'college', 'institute', 'school', 'academy')
+DEGREE_KEYWORDS = ('bachelor', 'master', 'phd', 'doctorate', 'associate', 'certificate', 'diploma')
+
+# Keyword-only bits that feed the company and project title rules
+_COMPANY_EXCLUDED = 1 << 8
+_PROJECT_WORD = 1 << 9
+
+class LineClassifier:
+    """Labels resume lines with a byte of LINE_* bits using patterns compiled once
+    
+    Folds the company, title, date, location, bullet, project title,
+    institution and degree heuristics into a single classify() call, so the
+    extractors test bits instead of re-running keyword scans and regexes on the
+    same line in every pass. Keywords are all ASCII letters, so a line contains
+    one exactly when one of its [a-z]+ runs does; the keyword bits of each
+    distinct run are computed once and memoized.
+    """
+    
+    KEYWORD_BITS = (
+        (COMPANY_INDICATORS, LINE_COMPANY),
+        (COMPANY_EXCLUDED_TERMS, _COMPANY_EXCLUDED),
+        (TITLE_KEYWORDS, LINE_TITLE),
+        (DATE_WORDS, LINE_DATE),
+        (LOCATION_WORDS, LINE_LOCATION),
+        (PROJECT_INDICATORS, _PROJECT_WORD),
+        (INSTITUTION_KEYWORDS, LINE_INSTITUTION),
+        (DEGREE_KEYWORDS, LINE_DEGREE),
+    )
+    
+    # Bits a keyword sets directly; company and project titles need further checks
+    DIRECT_BITS = LINE_TITLE | LINE_DATE | LINE_LOCATION | LINE_INSTITUTION | LINE_DEGREE
+    
+    # Memoized words before the memo is reset
+    MAX_MEMO_WORDS = 100_000
+    
+    def __init__(self):
+        self._keyword_bits = []
+        for keywords, bit in self.KEYWORD_BITS:
+            self._keyword_bits.extend((keyword, bit) for keyword in keywords)
+        self._word_bits = {}
+        self._words = re.compile(r'[a-z]+')
+        self._year = re.compile(r'\d{4}')
+        self._date_range = re.compile(
+            r'\d{4}\s*[-–]\s*\d{4}'  # 2020-2023
+            r'|\w\s+\d{4}\s*[-–]\s*\w+\s+\d{4}'  # Jan 2020 - Dec 2023
+            r'|\d{1,2}/\d{4}\s*[-–]\s*\d{1,2}/\d{4}'  # 01/2020 - 12/2023
+        )
+        self._location = re.compile(r'\w,\s*\w')  # City, ST / City, Country
+        self._bullet = re.compile(r'[•◦▪–\-*→]|â€¢|\s*\d+\.')  # Bullet characters or a numbered list
+        
+    def _bits_of_word(self, word: str) -> int:
+        """Combine the bits of every keyword found in a word, memoizing the result"""
+        bits = 0
+        for keyword, bit in self._keyword_bits:
+            if keyword in word:
+                bits |= bit
+        if len(self._word_bits) >= self.MAX_MEMO_WORDS:
+            self._word_bits.clear()
+        self._word_bits[word] = bits
+        return bits
+    
+    def classify(self, line: str, line_lower: Optional[str] = None) -> int:
+        """Return the LINE_* bits of one stripped line"""
+        if line_lower is None:
+            line_lower = line.lower()
+        hits = 0
+        word_bits = self._word_bits
+        for word in self._words.findall(line_lower):
+            bits = word_bits.get(word)
+            hits |= self._bits_of_word(word) if bits is None else bits
+        code = hits & self.DIRECT_BITS
+        length = len(line)
+        is_title_case = line.istitle()
+        
+        if not hits & _COMPANY_EXCLUDED and (
+                hits & LINE_COMPANY or
+                (length > 3 and line.isupper()) or
+                (is_title_case and 5 <= length <= 50)):
+            code |= LINE_COMPANY
+        if not code & LINE_DATE and self._year.search(line_lower) and self._date_range.search(line_lower):
+            code |= LINE_DATE
+        if not code & LINE_LOCATION and self._location.search(line):
+            code |= LINE_LOCATION
+        if self._bullet.match(line):
+            code |= LINE_BULLET
+        if 10 <= length <= 100 and (hits & _PROJECT_WORD or (is_title_case and len(line.split()) <= 8)):
+            code |= LINE_PROJECT_TITLE
+        return code
+    
+    def classify_lines(self, lines: Iterable[str], lines_lower: Iterable[str]) -> bytes:
+        """Return one type code per line"""
+        classify = self.classify
+        return bytes(classify(line, line_lower) for line, line_lower in zip(lines, lines_lower))
+
+@lru_cache(maxsize=1)
+def _get_line_classifier() -> LineClassifier:
+    """Compile the shared line classifier on first use"""
+    return LineClassifier()
+
+class TextIndex:
+    """Immutable line table and section index built in one pass over a text
+    
+    Holds the stripped non-empty lines, their lowercased forms, their LINE_*
+    type codes, a bitmask of the INDEXED_TERMS each line contains and the
+    sorted line numbers of every term. Extractors query it for their section
+    slice and line types instead of re-splitting and re-classifying the text.
+    """
+    
+    __slots__ = ('lines', 'lines_lower', 'line_types', '_line_masks', '_term_lines')
+    
+    def __init__(self, text: str):
+        lines = []
+        for raw_line in text.split('\n'):
+            line = raw_line.strip()
+            if line:
+                lines.append(line)
+        self.lines = tuple(lines)
+        self.lines_lower = tuple(line.lower() for line in lines)
+        self.line_types = _get_line_classifier().classify_lines(self.lines, self.lines_lower)
+        
+        term_lines = {term: [] for term in INDEXED_TERMS}
+        line_masks = []
+        for i, line_lower in enumerate(self.lines_lower):
+            mask = 0
+            for term, bit in _TERM_BITS.items():
+                if term in line_lower:
+                    mask |= bit
+                    term_lines[term].append(i)
+            line_masks.append(mask)
+        self._line_masks = tuple(line_masks)
+        self._term_lines = {term: tuple(positions) for term, positions in term_lines.items()}
+    
+    def __len__(self) -> int:
+        return len(self.lines)
+    
+    def has_any(self, line_idx: int, terms: Tuple[str, ...]) -> bool:
+        """Check if the line contains any of the terms"""
+        return bool(self._line_masks[line_idx] & _terms_mask(terms))
+    
+    def find(self, terms: Tuple[str, ...], start: int = 0) -> int:
+        """Return the first line index >= start containing any term, or -1"""
+        best = -1
+        for term in terms:
+            positions = self._term_lines[term]
+            pos = bisect_left(positions, start)
+            if pos < len(positions) and (best == -1 or positions[pos] < best):
+                best = positions[pos]
+        return best
+    
+    def lines_with(self, terms: Tuple[str, ...]) -> List[int]:
+        """Return the sorted indices of lines containing any term"""
+        found = set()
+        for term in terms:
+            found.update(self._term_lines[term])
+        return sorted(found)
+    
+    def section(self, header_terms: Tuple[str, ...], end_terms: Tuple[str, ...]) -> Optional[range]:
+        """Return the line range after the first header up to the next end line"""
+        header_idx = self.find(header_terms)
+        if header_idx == -1:
+            return None
+        end_idx = self.find(end_terms, header_idx + 1)
+        return range(header_idx + 1, end_idx if end_idx != -1 else len(self.lines))
+
+@lru_cache(maxsize=8)
+def _get_text_index(text: str) -> TextIndex:
+    """Build (or reuse) the TextIndex for a text shared by several extractors"""
+    return TextIndex(text)
+
+# Words that signal proficiency, strongest tier first, and the estimated level each tier implies
+SKILL_LEVEL_TIERS = (
+    (90, ('expert', 'advanced', 'senior', 'lead')),
+    (80, ('proficient', 'experienced', 'skilled')),
+    (70, ('intermediate', 'familiar')),
+    (60, ('basic', 'beginner', 'learning')),
+)
+DEFAULT_SKILL_LEVEL = 75
+
+# Characters on either side of a skill mention searched for proficiency words (about eight words)
+SKILL_CONTEXT_CHARS = 60
+
+_LEVEL_WORD_RE = re.compile(
+    rf"(?<!\w)({'|'.join(word for _, words in SKILL_LEVEL_TIERS for word in words)})(?!\w)")
+
+class TokenStats:
+    """Term statistics for one lowercased text, built in a single pass per pattern
+    
+    Holds the character offsets of every KeywordMatcher keyword mention (their
+    counts are the term frequencies) and a positional index of the proficiency
+    words in SKILL_LEVEL_TIERS. Skill estimates are lookups and bisect windows
+    on these instead of rescans of the whole text per skill.
+    """
+    
+    __slots__ = ('keyword_positions', 'word_positions')
+    
+    def __init__(self, text_lower: str):
+        keyword_positions = {}
+        for keyword, pos in _get_keyword_matcher().finditer(text_lower):
+            keyword_positions.setdefault(keyword, []).append(pos)
+        self.keyword_positions = keyword_positions
+        
+        word_positions = {}
+        for match in _LEVEL_WORD_RE.finditer(text_lower):
+            word_positions.setdefault(match.group(1), []).append(match.start())
+        self.word_positions = word_positions
+    
+    def keyword_count(self, keyword: str) -> int:
+        """Number of whole-word mentions of a KeywordMatcher keyword"""
+        return len(self.keyword_positions.get(keyword, ()))
+    
+    def near(self, pos: int, words: Tuple[str, ...], window: int) -> bool:
+        """Whether any of words occurs within window characters of pos"""
+        for word in words:
+            positions = self.word_positions.get(word)
+            if positions:
+                i = bisect_left(positions, pos - window)
+                if i < len(positions) and positions[i] <= pos + window:
+                    return True
+        return False
+
+@lru_cache(maxsize=8)
+def _get_token_stats(text_lower: str) -> TokenStats:
+    """Build (or reuse) the TokenStats for a lowercased text"""
+    return TokenStats(text_lower)
+
+class _StageTimer:
+    """Context manager that records one stage's wall and CPU time into a profiler"""
+    
+    __slots__ = ('profiler', 'name', 'file_key', 'wall_start', 'cpu_start')
+    
+    def __init__(self, profiler: 'PipelineProfiler', name: str, file_key: Optional[str]):
+        self.profiler = profiler
+        self.name = name
+        self.file_key = file_key
+    
+    def __enter__(self):
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.thread_time() - self.cpu_start
+        self.profiler._record(self.name, self.file_key, wall, cpu)
+        return False
+
+class PipelineProfiler:
+    """Per-stage and per-file timings plus pipeline counters
+    
+    Hooks are wrapped around extraction, each parser, merging and
+    serialization. When disabled, stage() hands back a shared no-op context
+    manager and count() returns immediately, so the hooks cost nothing.
+    """
+    
+    _NULL_STAGE = nullcontext()
+    # Released files whose total wall time is kept for the slowest-files report
+    MAX_RELEASED_FILES = 20
+    
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+    
+    def reset(self):
+        """Discard everything recorded so far"""
+        self.stages = {}
+        self.files = {}
+        self.counters = {}
+        # (total wall seconds, file key) of the slowest files dropped by release_files()
+        self.released_files = []
+    
+    def stage(self, name: str, file_key: Optional[str] = None):
+        """Time a block as stage `name`, optionally attributed to one input file"""
+        if not self.enabled:
+            return self._NULL_STAGE
+        return _StageTimer(self, name, file_key)
+    
+    def count(self, name: str, amount: int = 1):
+        """Increment counter `name`"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def _record(self, name: str, file_key: Optional[str], wall: float, cpu: float):
+        with self._lock:
+            totals = self.stages.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+            totals['calls'] += 1
+            totals['wall_seconds'] += wall
+            totals['cpu_seconds'] += cpu
+            if file_key is not None:
+                file_stages = self.files.setdefault(file_key, {})
+                file_totals = file_stages.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+                file_totals['wall_seconds'] += wall
+                file_totals['cpu_seconds'] += cpu
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a picklable copy of the recorded data"""
+        with self._lock:
+            return {
+                'stages': {name: dict(totals) for name, totals in self.stages.items()},
+                'files': {key: {name: dict(t) for name, t in stages.items()} for key, stages in self.files.items()},
+                'counters': dict(self.counters)
+            }
+    
+    def merge(self, snapshot: Dict[str, Any]):
+        """Fold a snapshot from a worker process into this profiler"""
+        with self._lock:
+            for name, totals in snapshot['stages'].items():
+                current = self.stages.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+                for field, value in totals.items():
+                    current[field] += value
+            for key, stages in snapshot['files'].items():
+                file_stages = self.files.setdefault(key, {})
+                for name, totals in stages.items():
+                    current = file_stages.setdefault(name, {'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+                    for field, value in totals.items():
+                        current[field] += value
+            for name, value in snapshot['counters'].items():
+                self.counters[name] = self.counters.get(name, 0) + value
+    
+    def release_files(self, file_keys: Iterable[str]):
+        """Drop the per-file entries of files already reported, keeping only the slowest totals"""
+        with self._lock:
+            for key in file_keys:
+                stages = self.files.pop(key, None)
+                if stages is not None:
+                    self.released_files.append((sum(t['wall_seconds'] for t in stages.values()), key))
+            if len(self.released_files) > 2 * self.MAX_RELEASED_FILES:
+                self.released_files = heapq.nlargest(self.MAX_RELEASED_FILES, self.released_files)
+    
+    def file_walls(self) -> List[Tuple[float, str]]:
+        """(total wall seconds, file key) of every recorded or released file, slowest first"""
+        with self._lock:
+            walls = [(sum(t['wall_seconds'] for t in stages.values()), key) for key, stages in self.files.items()]
+            walls.extend(self.released_files)
+        return sorted(walls, reverse=True)
+    
+    def to_dict(self, file_keys: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Rounded report for the output metadata (optionally only for some files)"""
+        if file_keys is None:
+            data = self.snapshot()
+        else:
+            # Copy only the requested files: a batch asks once per candidate while self.files keeps growing
+            with self._lock:
+                data = {'files': {key: {name: dict(t) for name, t in self.files[key].items()}
+                                  for key in file_keys if key in self.files}}
+        return json.loads(json.dumps(data), parse_float=lambda value: round(float(value), 6))
+
+class CountMinSketch:
+    """Fixed-size frequency estimates for an open-ended set of keys
+    
+    depth rows of width counters; a key's estimate is the smallest of its
+    counters, which never undercounts and overcounts by at most
+    e/width * total with probability 1 - exp(-depth). Updates are
+    conservative (only counters at the current minimum grow), which keeps
+    the overcount well below that bound in practice.
+    """
+    
+    def __init__(self, width: int = 2048, depth: int = 4):
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.rows = [array('Q', bytes(8 * width)) for _ in range(depth)]
+    
+    def _cells(self, key: str) -> List[int]:
+        """Counter index of key in every row"""
+        # Two 64-bit halves of one stable hash give every row its own index (double hashing)
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + row * h2) % self.width for row in range(self.depth)]
+    
+    def add(self, key: str, amount: int = 1) -> int:
+        """Count key and return its new estimate"""
+        cells = self._cells(key)
+        estimate = min(row[cell] for row, cell in zip(self.rows, cells)) + amount
+        for row, cell in zip(self.rows, cells):
+            if row[cell] < estimate:
+                row[cell] = estimate
+        self.total += amount
+        return estimate
+    
+    def estimate(self, key: str) -> int:
+        """Estimated count of key (never lower than the true count)"""
+        return min(row[cell] for row, cell in zip(self.rows, self._cells(key)))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Sketch parameters and the error bound of its estimates"""
+        return {
+            'width': self.width,
+            'depth': self.depth,
+            'total': self.total,
+            'max_overcount': round(math.e / self.width * self.total, 2),
+            'confidence': round(1 - math.exp(-self.depth), 4)
+        }
+
+class HeavyHitters:
+    """The k most frequent keys of an open-ended field, backed by a CountMinSketch
+    
+    Keys are normalized (case and whitespace) before counting; the first
+    spelling seen is kept for display. Memory is the sketch plus k entries,
+    however many distinct keys the corpus holds.
+    """
+    
+    def __init__(self, k: int = 25, width: int = 2048, depth: int = 4):
+        self.k = k
+        self.sketch = CountMinSketch(width, depth)
+        self.top = {}  # normalized key -> [display name, estimate]
+        self._floor = 0  # smallest estimate in top once it is full
+    
+    def add(self, name: str):
+        """Count one occurrence of name"""
+        name = ' '.join(name.split())
+        if not name:
+            return
+        key = name.casefold()
+        estimate = self.sketch.add(key)
+        entry = self.top.get(key)
+        if entry is not None:
+            entry[1] = estimate
+        elif len(self.top) < self.k:
+            self.top[key] = [name, estimate]
+        elif estimate > self._floor:
+            del self.top[min(self.top, key=lambda top_key: self.top[top_key][1])]
+            self.top[key] = [name, estimate]
+        else:
+            return
+        if len(self.top) >= self.k:
+            self._floor = min(entry[1] for entry in self.top.values())
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Heavy hitters by estimated count, plus the sketch's error bound"""
+        ranked = sorted(self.top.values(), key=lambda entry: (-entry[1], entry[0]))
+        return {'top': [{'name': name, 'estimate': estimate} for name, estimate in ranked],
+                'sketch': self.sketch.to_dict()}
+
+class CorpusAnalytics:
+    """Streaming aggregates over the candidate portfolios of a batch run
+    
+    add() folds in one portfolio as it finishes, so nothing has to be
+    reloaded afterwards. Skill and technology counts, technology pairs and
+    the experience-count histogram are exact (their keys are bounded by
+    SKILL_TAXONOMY and TECH_KEYWORDS); companies, titles and institutions are
+    open-ended and go through fixed-size HeavyHitters sketches. Memory stays
+    bounded regardless of corpus size.
+    """
+    
+    FORMAT_VERSION = 1
+    # Experience counts at or above this share the last histogram bucket
+    MAX_EXPERIENCE_BUCKET = 50
+    OPEN_ENDED_FIELDS = ('companies', 'titles', 'institutions')
+    
+    def __init__(self, top_k: int = 25, sketch_width: int = 2048, sketch_depth: int = 4):
+        self.candidates = 0
+        self.skipped_files = 0
+        self.skills = {}
+        self.skill_categories = {}
+        self.technologies = {}
+        self.technology_pairs = {}
+        self.experience_counts = {}
+        self.experience_total = 0
+        self.sketches = {field: HeavyHitters(top_k, sketch_width, sketch_depth) for field in self.OPEN_ENDED_FIELDS}
+    
+    def add(self, portfolio_data: Dict[str, Any]):
+        """Fold one candidate's portfolio into the aggregates"""
+        self.candidates += 1
+        self.skipped_files += len(portfolio_data['metadata'].get('skipped_files', ()))
+        
+        # Skills: how many candidates list each one (each at most once per candidate)
+        for category, skills in portfolio_data.get('skills', {}).items():
+            names = {skill['name'] for skill in skills}
+            for name in names:
+                self.skills[name] = self.skills.get(name, 0) + 1
+            if names:
+                self.skill_categories[category] = self.skill_categories.get(category, 0) + 1
+        
+        experience = portfolio_data.get('experience', [])
+        bucket = min(len(experience), self.MAX_EXPERIENCE_BUCKET)
+        self.experience_counts[bucket] = self.experience_counts.get(bucket, 0) + 1
+        self.experience_total += len(experience)
+        
+        technologies = set()
+        for exp in experience:
+            technologies.update(exp['technologies'] or ())
+            self.sketches['companies'].add(exp['company'])
+            self.sketches['titles'].add(exp['title'])
+        for edu in portfolio_data.get('education', []):
+            self.sketches['institutions'].add(edu.get('institution', ''))
+        
+        # Technologies and their co-occurrence within one candidate
+        technologies = sorted(technologies)
+        for i, tech in enumerate(technologies):
+            self.technologies[tech] = self.technologies.get(tech, 0) + 1
+            for other in technologies[i + 1:]:
+                pair = (tech, other)
+                self.technology_pairs[pair] = self.technology_pairs.get(pair, 0) + 1
+    
+    @staticmethod
+    def _ranked(counts: Dict[Any, int]) -> List[Tuple[Any, int]]:
+        """Items by descending count, ties in key order"""
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Aggregates in the form written next to the batch output"""
+        histogram = {str(bucket) if bucket < self.MAX_EXPERIENCE_BUCKET else f"{bucket}+": count
+                     for bucket, count in sorted(self.experience_counts.items())}
+        return {
+            'version': self.FORMAT_VERSION,
+            'candidates': self.candidates,
+            'skipped_files': self.skipped_files,
+            'skills': {
+                'frequency': dict(self._ranked(self.skills)),
+                'candidates_by_category': dict(self._ranked(self.skill_categories))
+            },
+            'technologies': {
+                'frequency': dict(self._ranked(self.technologies)),
+                'co_occurrence': [{'technologies': list(pair), 'count': count}
+                                  for pair, count in self._ranked(self.technology_pairs)]
+            },
+            'experience_counts': {
+                'histogram': histogram,
+                'total': self.experience_total,
+                'mean': round(self.experience_total / self.candidates, 2) if self.candidates else 0.0
+            },
+            **{field: sketch.to_dict() for field, sketch in self.sketches.items()}
+        }
+
+class PortfolioSearchIndex:
+    """SQLite FTS5 inverted index over analyzed portfolios
+    
+    One row per candidate, keyed by (source, candidate_id), where source is
+    the output file the portfolio was written to. Its full-text columns hold
+    personalInfo, experience companies, titles and achievements,
+    technologies and skills. upsert() skips candidates whose indexed text is
+    unchanged, and finish_run() drops the candidates of a source that the
+    current run did not write, so re-running keeps the index in step with
+    the output instead of rebuilding it. Nothing is committed before
+    finish_run(), which callers run once the output file is in place;
+    close() discards the upserts of a run that failed.
+    """
+    
+    FORMAT_VERSION = 1
+    COLUMNS = ('personal', 'companies', 'titles', 'achievements', 'technologies', 'skills')
+    PERSONAL_FIELDS = ('name', 'title', 'email', 'location', 'bio', 'linkedIn', 'github', 'website')
+    # Keep '+' and '#' inside tokens so C++ and C# stay searchable
+    TOKENIZER = "unicode61 tokenchars '+#'"
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.run = os.urandom(8).hex()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        try:
+            self._create_schema()
+        except sqlite3.Error:
+            self.conn.close()
+            raise
+    
+    def _create_schema(self):
+        """Create the tables on first use (raises sqlite3.OperationalError without FTS5)"""
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, self.FORMAT_VERSION):
+            raise sqlite3.DatabaseError(f"unsupported search index version {version}")
+        with self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS candidates ('
+                'id INTEGER PRIMARY KEY, source TEXT NOT NULL, candidate_id TEXT NOT NULL, '
+                'name TEXT, title TEXT, email TEXT, location TEXT, digest TEXT NOT NULL, run TEXT NOT NULL, '
+                'UNIQUE (source, candidate_id))')
+            self.conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS portfolio_fts USING fts5({', '.join(self.COLUMNS)}, "
+                f'tokenize="{self.TOKENIZER}")')
+            self.conn.execute(f'PRAGMA user_version = {self.FORMAT_VERSION}')
+    
+    @classmethod
+    def document(cls, portfolio_data: Dict[str, Any]) -> Dict[str, str]:
+        """Text of every full-text column for one portfolio"""
+        personal_info = portfolio_data.get('personalInfo', {})
+        experience = portfolio_data.get('experience', [])
+        technologies = {tech for exp in experience for tech in exp['technologies'] or ()}
+        technologies.update(tech for project in portfolio_data.get('projects', []) for tech in project['technologies'])
+        return {
+            'personal': '\n'.join(str(personal_info.get(field) or '') for field in cls.PERSONAL_FIELDS),
+            'companies': '\n'.join(exp['company'] for exp in experience),
+            'titles': '\n'.join(exp['title'] for exp in experience),
+            'achievements': '\n'.join(bullet for exp in experience for bullet in exp['achievements'] or ()),
+            'technologies': '\n'.join(sorted(technologies)),
+            'skills': '\n'.join(skill['name'] for skills in portfolio_data.get('skills', {}).values() for skill in skills)
+        }
+    
+    def upsert(self, source: str, candidate_id: str, portfolio_data: Dict[str, Any]) -> bool:
+        """Index one candidate's portfolio; return whether its indexed text changed"""
+        document = self.document(portfolio_data)
+        personal_info = portfolio_data.get('personalInfo', {})
+        stored = tuple(str(personal_info.get(field) or '') for field in ('name', 'title', 'email', 'location'))
+        digest = hashlib.sha256('\0'.join(stored + tuple(document.values())).encode('utf-8')).hexdigest()
+        
+        row = self.conn.execute('SELECT id, digest FROM candidates WHERE source = ? AND candidate_id = ?',
+                                (source, candidate_id)).fetchone()
+        if row and row[1] == digest:
+            self.conn.execute('UPDATE candidates SET run = ? WHERE id = ?', (self.run, row[0]))
+            changed = False
+        else:
+            if row:
+                self.conn.execute('DELETE FROM portfolio_fts WHERE rowid = ?', (row[0],))
+                self.conn.execute('UPDATE candidates SET name = ?, title = ?, email = ?, location = ?, digest = ?, run = ? '
+                                  'WHERE id = ?', stored + (digest, self.run, row[0]))
+                rowid = row[0]
+            else:
+                rowid = self.conn.execute(
+                    'INSERT INTO candidates (source, candidate_id, name, title, email, location, digest, run) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', (source, candidate_id) + stored + (digest, self.run)).lastrowid
+            self.conn.execute(f"INSERT INTO portfolio_fts (rowid, {', '.join(self.COLUMNS)}) "
+                              f"VALUES (?{', ?' * len(self.COLUMNS)})", (rowid,) + tuple(document.values()))
+            changed = True
+        return changed
+    
+    def finish_run(self, source: str) -> int:
+        """Drop candidates of source not written by this run, commit, and return how many were dropped"""
+        stale = [rowid for (rowid,) in self.conn.execute(
+            'SELECT id FROM candidates WHERE source = ? AND run != ?', (source, self.run))]
+        for rowid in stale:
+            self.conn.execute('DELETE FROM portfolio_fts WHERE rowid = ?', (rowid,))
+            self.conn.execute('DELETE FROM candidates WHERE id = ?', (rowid,))
+        self.conn.commit()
+        return len(stale)
+    
+    @staticmethod
+    def quote(text: str) -> str:
+        """Quote text as an FTS5 phrase"""
+        return '"' + text.replace('"', '""') + '"'
+    
+    def search(self, query: str = '', company: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Candidates matching an FTS5 query, best first
+        
+        query uses FTS5 syntax (Terraform AND Kubernetes, "site reliability",
+        kube*, technologies:docker); company additionally requires that phrase
+        in an experience company name. Raises sqlite3.OperationalError for a
+        malformed query.
+        """
+        terms = [f"({query})"] if query.strip() else []
+        if company:
+            terms.append(f"companies : {self.quote(company)}")
+        if not terms:
+            return []
+        achievements_column = self.COLUMNS.index('achievements')
+        rows = self.conn.execute(
+            'SELECT c.candidate_id, c.name, c.title, c.email, c.location, c.source, '
+            f"snippet(portfolio_fts, {achievements_column}, '[', ']', '…', 12), bm25(portfolio_fts) AS rank "
+            'FROM portfolio_fts JOIN candidates c ON c.id = portfolio_fts.rowid '
+            'WHERE portfolio_fts MATCH ? ORDER BY rank LIMIT ?', (' AND '.join(terms), limit))
+        fields = ('candidate_id', 'name', 'title', 'email', 'location', 'source', 'snippet', 'rank')
+        return [dict(zip(fields, row)) for row in rows]
+    
+    def __len__(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM candidates').fetchone()[0]
+    
+    def close(self):
+        """Close the database, rolling back upserts not committed by finish_run()"""
+        self.conn.rollback()
+        self.conn.close()
 
 class UltimatePDFPortfolioAnalyzer:
     """Ultimate portfolio analyzer that processes all PDF files"""
     
-    def __init__(self, workspace_dir: str = None):
+    # Items submitted per --jobs worker ahead of the result being yielded (see _parallel_map)
+    IN_FLIGHT_PER_WORKER = 2
+    
+    def __init__(self, workspace_dir: str = None, jobs: int = 1, executor: str = 'process',
+                 text_cache: Optional[PDFTextCache] = None, max_pages: Optional[int] = None,
+                 profile: bool = False, backends: Optional[List[str]] = None, min_text_chars: int = 50,
+                 merge_threshold: float = 0.8, compact_json: bool = False, json_encoder: str = 'auto',
+                 time_limit: Optional[float] = None, memory_limit_mb: Optional[float] = None,
+                 page_workers: int = 1, page_parallel_threshold: int = 50, sectioned: bool = False,
+                 sections_dir: Optional[str] = None, es_modules_dir: Optional[str] = None,
+                 analytics: bool = False, analytics_top: int = 25, search_index: bool = False,
+                 search_index_path: Optional[str] = None):
         self.workspace_dir = workspace_dir or os.getcwd()
         self.resume_folder = os.path.join(self.workspace_dir, 'resume')
         self.extract_folder = os.path.join(self.workspace_dir, 'extract_resume')
+        # Optional on-disk cache of extracted text (None disables caching)
+        self.text_cache = text_cache
+        # Only extract the first max_pages pages of each PDF (None = all pages)
+        self.max_pages = max_pages
+        # Stage timings and counters (no-op unless profiling is enabled)
+        self.profiler = PipelineProfiler(enabled=profile)
+        # PDF backends to try for each file, in order; extraction falls through on errors
+        # or when a backend returns min_text_chars characters or fewer
+        self.backends = self._resolve_backends(backends)
+        self.min_text_chars = min_text_chars
+        # Similarity (0-1) at which experiences are merged as the same role (1.0 = normalized exact match)
+        self.merge_threshold = merge_threshold
+        # Serializer for the output files (indent=2 unless compact; orjson when installed)
+        self.json_writer = PortfolioJSONWriter(compact=compact_json, encoder=json_encoder)
+        # Also write one content-hashed file per section plus a manifest here (None = off)
+        self.sections_dir = (sections_dir or os.path.join(self.extract_folder, 'portfolio_sections')
+                             if sectioned or sections_dir else None)
+        # Also write one ES module per section plus an index.js barrel here (None = off)
+        self.es_modules_dir = es_modules_dir
+        # Batch mode: also aggregate corpus statistics into <batch output>_analytics.json
+        self.analytics = analytics
+        self.analytics_top = analytics_top
+        # Keep a full-text search index of every written portfolio here (None = off)
+        self.search_index_path = (search_index_path or os.path.join(self.extract_folder, 'portfolio_search.db')
+                                  if search_index or search_index_path else None)
+        # Worker pool settings (jobs <= 0 means one worker per CPU)
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.executor = executor
+        # Per-PDF wall-clock (seconds) and memory (MB) limits; when set, every PDF is
+        # analyzed in a killable worker process and files over a limit are skipped
+        self.time_limit = time_limit
+        self.memory_limit_mb = memory_limit_mb
+        # Documents with at least page_parallel_threshold pages are split into page ranges
+        # extracted by page_workers processes (1 = always extract page by page in-process)
+        self.page_workers = page_workers if page_workers > 0 else (os.cpu_count() or 1)
+        self.page_parallel_threshold = page_parallel_threshold
+        # Text saved by older tools, used when real extraction yields too little
+        self.legacy_text_index = LegacyTextIndex(self.workspace_dir, [self.resume_folder, self.workspace_dir])
         self.pdf_files = self._find_pdf_files()
         self.extracted_texts = {}
+        self.skipped_files = []
         self.all_experiences = []
         
     def _find_pdf_files(self) -> List[str]:
@@ -75,8 +1887,8 @@ class UltimatePDFPortfolioAnalyzer:
         for pattern in pdf_patterns:
             pdf_files.extend(resume_path.glob(pattern))
         
-        # Convert to strings and remove duplicates
-        unique_files = list(set([str(f) for f in pdf_files]))
+        # Convert to strings and remove duplicates (sorted for a stable processing order)
+        unique_files = sorted(set(str(f) for f in pdf_files))
         
         # Filter for resume-like files
         resume_keywords = ['resume', 'cv', 'sairam', 'peruri']
@@ -89,95 +1901,245 @@ class UltimatePDFPortfolioAnalyzer:
         
         return filtered_files
     
-    def extract_text_from_pdf_real(self, pdf_path: str) -> str:
-        """Extract text from PDF using available PDF library"""
-        if PDF_LIBRARY is None:
+    @staticmethod
+    def _resolve_backends(backends: Optional[List[str]]) -> List[str]:
+        """Keep the requested backends that are installed, in order (default: fastest first)"""
+        if backends is None:
+            return list(AVAILABLE_PDF_BACKENDS)
+        
+        resolved = []
+        for backend in backends:
+            if backend not in PDF_BACKENDS:
+                logger.warning(f"Unknown PDF backend '{backend}' (choose from {', '.join(PDF_BACKENDS)})")
+            elif backend not in AVAILABLE_PDF_BACKENDS:
+                logger.warning(f"PDF backend '{backend}' is not installed, skipping it")
+            elif backend not in resolved:
+                resolved.append(backend)
+        return resolved
+    
+    def extract_text_from_pdf_real(self, pdf_source: PDFSource, name: Optional[str] = None) -> str:
+        """Extract text from PDF, falling back through self.backends until one yields enough text
+        
+        pdf_source is a path or the PDF bytes (bytes, bytearray, memoryview or mmap); in-memory
+        sources are handed to the backends without copying. name labels logs and timings.
+        """
+        file_key = name or (os.path.basename(pdf_source) if isinstance(pdf_source, str) else '<memory>')
+        if not self.backends:
             logger.error("No PDF processing library available. Install PyPDF2, pdfplumber, or PyMuPDF")
-            return f"Error: No PDF library available for {os.path.basename(pdf_path)}"
+            return f"Error: No PDF library available for {file_key}"
         
         try:
-            if PDF_LIBRARY == "PyPDF2":
-                return self._extract_with_pypdf2(pdf_path)
-            elif PDF_LIBRARY == "pdfplumber":
-                return self._extract_with_pdfplumber(pdf_path)
-            elif PDF_LIBRARY == "PyMuPDF":
-                return self._extract_with_pymupdf(pdf_path)
+            with _map_large_pdf(pdf_source) as source:
+                return self._extract_with_fallback(source, file_key)
+        except MemoryError:
+            # Not a bad PDF but an exhausted budget; let the caller (e.g. DocumentSandbox) decide
+            raise
         except Exception as e:
-            logger.error(f"Error extracting text from {pdf_path}: {e}")
-            return f"Error extracting: {os.path.basename(pdf_path)}"
+            logger.error(f"Error extracting text from {file_key}: {e}")
+            return f"Error extracting: {file_key}"
+    
+    def _extract_with_fallback(self, pdf_source: PDFSource, file_key: str) -> str:
+        """Try the text cache, then each backend in self.backends, on an opened PDF source"""
+        cache_keys = {}
+        if self.text_cache is not None:
+            content_hash = _source_sha256(pdf_source)
+            for backend in self.backends:
+                cache_keys[backend] = self.text_cache.key_for_hash(
+                    content_hash, backend, _pdf_library_version(backend), options=f"max_pages={self.max_pages}")
+                cached_text = self.text_cache.get(cache_keys[backend])
+                if cached_text is not None:
+                    logger.info(f"Using cached {backend} text for {file_key}")
+                    self.profiler.count('text_cache_hits')
+                    return cached_text
+            self.profiler.count('text_cache_misses')
+        
+        best_text = None
+        for backend in self.backends:
+            try:
+                with self.profiler.stage(f"backend_{backend}", file_key):
+                    text = self._join_pages(self.iter_pdf_pages(pdf_source, backend))
+            except MemoryError:
+                raise
+            except Exception as e:
+                logger.warning(f"{backend} failed on {file_key}: {e}")
+                self.profiler.count(f"backend_{backend}_errors")
+                continue
+            
+            if len(text) > self.min_text_chars:
+                self.profiler.count(f"backend_{backend}_successes")
+                if backend in cache_keys:
+                    self.text_cache.put(cache_keys[backend], text)
+                return text
+            
+            logger.info(f"{backend} returned only {len(text)} characters for {file_key}, trying next backend")
+            self.profiler.count(f"backend_{backend}_short_text")
+            if best_text is None or len(text) > len(best_text):
+                best_text = text
+        
+        if best_text is not None:
+            return best_text
+        return f"Error extracting: {file_key}"
+    
+    def iter_pdf_pages(self, pdf_source: PDFSource, backend: Optional[str] = None) -> Iterator[Tuple[int, str]]:
+        """Yield (page_number, page_text) from a PDF library (default: the first in self.backends)"""
+        backend = backend or (self.backends[0] if self.backends else None)
+        if backend == "PyPDF2":
+            return self._iter_pages_pypdf2(pdf_source)
+        elif backend == "pdfplumber":
+            return self._iter_pages_pdfplumber(pdf_source)
+        elif backend == "PyMuPDF":
+            return self._iter_pages_pymupdf(pdf_source)
+        return iter(())
+    
+    def _page_limit(self, page_count: int) -> int:
+        """Apply the max_pages budget to a document's page count"""
+        if self.max_pages is None:
+            return page_count
+        return min(page_count, self.max_pages)
     
-    def _extract_with_pypdf2(self, pdf_path: str) -> str:
-        """Extract text using PyPDF2"""
-        text = ""
-        with open(pdf_path, 'rb') as file:
+    @staticmethod
+    def _join_pages(pages: Iterable[Tuple[int, str]]) -> str:
+        """Build the document text from page texts in a single join"""
+        return ''.join(f"\n--- Page {page_num} ---\n{page_text}" for page_num, page_text in pages).strip()
+    
+    def _use_page_workers(self, page_count: int) -> bool:
+        """Check whether a document is long enough to split its pages across worker processes"""
+        if self.page_workers <= 1 or page_count < max(2, self.page_parallel_threshold):
+            return False
+        import multiprocessing
+        
+        # Daemonic workers (e.g. DocumentSandbox) may not start processes of their own
+        return not multiprocessing.current_process().daemon
+    
+    def _iter_pages_parallel(self, pdf_source: PDFSource, backend: str, page_count: int) -> Iterator[Tuple[int, str]]:
+        """Extract the first page_count pages in contiguous ranges on page_workers processes, yielding pages in order"""
+        from concurrent.futures import ProcessPoolExecutor
+        
+        source = _shareable_source(pdf_source)
+        workers = min(self.page_workers, page_count)
+        # A few ranges per worker even out pages of uneven cost; each range reopens the document once
+        chunk = -(-page_count // (workers * 4))
+        calls = [('_extract_page_range', (source, backend, start, min(start + chunk, page_count)))
+                 for start in range(0, page_count, chunk)]
+        logger.info(f"Extracting {page_count} pages with {workers} page workers ({len(calls)} ranges)")
+        self.profiler.count('page_parallel_documents')
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker, initargs=(self,)) as pool:
+            for pages in pool.map(_run_in_worker, calls):
+                if self.profiler.enabled:
+                    pages, worker_profile = pages
+                    self.profiler.merge(worker_profile)
+                yield from pages
+    
+    def _extract_page_range(self, task: Tuple[Union[str, bytes], str, int, int]) -> List[Tuple[int, str]]:
+        """Extract pages [start, stop) of a PDF with one backend (run in a page worker)"""
+        pdf_source, backend, start, stop = task
+        iter_pages = {
+            'PyPDF2': self._iter_pages_pypdf2,
+            'pdfplumber': self._iter_pages_pdfplumber,
+            'PyMuPDF': self._iter_pages_pymupdf,
+        }[backend]
+        return list(iter_pages(pdf_source, range(start, stop)))
+    
+    def _iter_pages_pypdf2(self, pdf_source: PDFSource, pages: Optional[range] = None) -> Iterator[Tuple[int, str]]:
+        """Yield page texts using PyPDF2 (every page within max_pages, or only the given page indexes)"""
+        PyPDF2 = _load_pdf_backend('PyPDF2')
+        with _open_pdf_stream(pdf_source) as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            for page_num, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-        return text.strip()
-    
-    def _extract_with_pdfplumber(self, pdf_path: str) -> str:
-        """Extract text using pdfplumber (more accurate)"""
-        text = ""
-        with pdfplumber.open(pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
-                page_text = page.extract_text()
+            if pages is None:
+                page_count = self._page_limit(len(pdf_reader.pages))
+                if self._use_page_workers(page_count):
+                    yield from self._iter_pages_parallel(pdf_source, 'PyPDF2', page_count)
+                    return
+                pages = range(page_count)
+            for page_num in pages:
+                self.profiler.count('pages_extracted')
+                yield page_num + 1, pdf_reader.pages[page_num].extract_text()
+    
+    def _iter_pages_pdfplumber(self, pdf_source: PDFSource, pages: Optional[range] = None) -> Iterator[Tuple[int, str]]:
+        """Yield non-empty page texts using pdfplumber (every page within max_pages, or only the given page indexes)"""
+        pdfplumber = _load_pdf_backend('pdfplumber')
+        with _open_pdf_stream(pdf_source) as file, pdfplumber.open(file) as pdf:
+            if pages is None:
+                page_count = self._page_limit(len(pdf.pages))
+                if self._use_page_workers(page_count):
+                    yield from self._iter_pages_parallel(pdf_source, 'pdfplumber', page_count)
+                    return
+                pages = range(page_count)
+            for page_num in pages:
+                page_text = pdf.pages[page_num].extract_text()
+                self.profiler.count('pages_extracted')
                 if page_text:
-                    text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-        return text.strip()
-    
-    def _extract_with_pymupdf(self, pdf_path: str) -> str:
-        """Extract text using PyMuPDF"""
-        text = ""
-        pdf_document = fitz.open(pdf_path)
-        for page_num in range(pdf_document.page_count):
-            page = pdf_document[page_num]
-            page_text = page.get_text()
-            text += f"\n--- Page {page_num + 1} ---\n{page_text}"
-        pdf_document.close()
-        return text.strip()
-    
-    def extract_text_from_pdf_simple(self, pdf_path: str) -> str:
-        """Extract text from PDF using real extraction or fallback to JSON"""
+                    yield page_num + 1, page_text
+    
+    def _iter_pages_pymupdf(self, pdf_source: PDFSource, pages: Optional[range] = None) -> Iterator[Tuple[int, str]]:
+        """Yield page texts using PyMuPDF (every page within max_pages, or only the given page indexes)"""
+        fitz = _load_pdf_backend('PyMuPDF')
+        if isinstance(pdf_source, str):
+            with fitz.open(pdf_source) as pdf_document:
+                yield from self._iter_pymupdf_document(pdf_document, pdf_source, pages)
+        else:
+            # PyMuPDF reads a memoryview in place, so bytearray and mmap sources are not copied
+            with memoryview(pdf_source) as view, fitz.open(stream=view, filetype='pdf') as pdf_document:
+                yield from self._iter_pymupdf_document(pdf_document, pdf_source, pages)
+    
+    def _iter_pymupdf_document(self, pdf_document: Any, pdf_source: PDFSource,
+                               pages: Optional[range] = None) -> Iterator[Tuple[int, str]]:
+        if pages is None:
+            page_count = self._page_limit(pdf_document.page_count)
+            if self._use_page_workers(page_count):
+                yield from self._iter_pages_parallel(pdf_source, 'PyMuPDF', page_count)
+                return
+            pages = range(page_count)
+        for page_num in pages:
+            self.profiler.count('pages_extracted')
+            yield page_num + 1, pdf_document[page_num].get_text()
+    
+    def _extract_with_pypdf2(self, pdf_source: PDFSource) -> str:
+        """Extract text using PyPDF2 from a path, bytes, memoryview or mmap"""
+        return self._join_pages(self._iter_pages_pypdf2(pdf_source))
+    
+    def _extract_with_pdfplumber(self, pdf_source: PDFSource) -> str:
+        """Extract text using pdfplumber (more accurate) from a path, bytes, memoryview or mmap"""
+        return self._join_pages(self._iter_pages_pdfplumber(pdf_source))
+    
+    def _extract_with_pymupdf(self, pdf_source: PDFSource) -> str:
+        """Extract text using PyMuPDF from a path, bytes, memoryview or mmap"""
+        return self._join_pages(self._iter_pages_pymupdf(pdf_source))
+    
+    def extract_text_from_pdf_simple(self, pdf_path: str, pdf_source: Optional[PDFSource] = None) -> str:
+        """Extract text from PDF using real extraction or fallback to JSON
+        
+        pdf_source optionally supplies the bytes of the PDF named by pdf_path, so it is not read from disk.
+        """
         try:
             # First try real PDF extraction
-            if PDF_LIBRARY:
-                logger.info(f"Extracting text from {os.path.basename(pdf_path)} using {PDF_LIBRARY}")
-                text = self.extract_text_from_pdf_real(pdf_path)
-                if text and len(text) > 50:  # Valid extraction
+            if self.backends:
+                logger.info(f"Extracting text from {os.path.basename(pdf_path)} using {' -> '.join(self.backends)}")
+                text = self.extract_text_from_pdf_real(pdf_path if pdf_source is None else pdf_source,
+                                                       name=self._profile_key(pdf_path))
+                if text and len(text) > self.min_text_chars:  # Valid extraction
                     return text
             
-            # Fallback to existing JSON data
-            json_files = [
-                'resume_analysis_final.json',
-                'resume_correctly_extracted.json',
-                'resume_analysis.json'
-            ]
-            
-            for json_file in json_files:
-                json_path = os.path.join(self.workspace_dir, json_file)
-                if os.path.exists(json_path):
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    # Look for any resume data
-                    for key, value in data.items():
-                        if key.endswith('.pdf') and isinstance(value, dict):
-                            if 'original_text' in value:
-                                logger.info(f"Using extracted text from {json_file} for {key}")
-                                return value['original_text']
-                            elif 'text' in value:
-                                return value['text']
+            # Fallback to text previously saved for this PDF in the legacy JSON files
+            self.profiler.count('text_json_fallbacks')
+            legacy_entry = self.legacy_text_index.lookup(pdf_path, pdf_source)
+            if legacy_entry is not None:
+                json_file, text = legacy_entry
+                logger.info(f"Using extracted text from {json_file} for {os.path.basename(pdf_path)}")
+                return text
             
             # If no extraction possible
             logger.warning(f"No text extraction available for {pdf_path}. Install a PDF library.")
             return f"Unable to extract text from: {os.path.basename(pdf_path)}"
             
+        except MemoryError:
+            raise
         except Exception as e:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             return f"Error: {os.path.basename(pdf_path)}"
     
-    def extract_experience_from_text(self, text: str, source_file: str) -> List[Dict[str, Any]]:
+    def extract_experience_from_text(self, text: str, source_file: str) -> List[Experience]:
         """
         Intelligent experience extraction from any resume text
         """
@@ -186,21 +2148,12 @@ class UltimatePDFPortfolioAnalyzer:
             return []
         
         experiences = []
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
-        
-        # Find experience sections
-        experience_keywords = [
-            'professional experience', 'work experience', 'employment history',
-            'career history', 'experience', 'employment', 'work history'
-        ]
+        index = _get_text_index(text)
         
-        experience_start_idx = -1
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in experience_keywords):
-                experience_start_idx = i
-                break
+        # Find experience section (ends at the next major section header)
+        experience_lines = index.section(EXPERIENCE_SECTION_TERMS, EXPERIENCE_END_TERMS)
         
-        if experience_start_idx == -1:
+        if experience_lines is None:
             logger.warning(f"No experience section found in {source_file}")
             return self._extract_fallback_experience(text, source_file)
         
@@ -208,123 +2161,50 @@ class UltimatePDFPortfolioAnalyzer:
         current_exp = None
         exp_id = 1
         
-        for i in range(experience_start_idx + 1, len(lines)):
-            line = lines[i].strip()
-            
-            # Skip section headers that indicate end of experience
-            if any(section in line.lower() for section in ['education', 'skills', 'projects', 'certifications']):
-                break
+        self.profiler.count('lines_scanned', len(experience_lines))
+        for i in experience_lines:
+            line = index.lines[i]
+            line_type = index.line_types[i]
             
             # Look for company/role patterns
-            if self._is_company_line(line):
+            if line_type & LINE_COMPANY:
                 # Save previous experience if exists
-                if current_exp and current_exp.get('company'):
+                if current_exp and current_exp.company:
                     experiences.append(current_exp)
                 
                 # Start new experience
-                current_exp = {
-                    'id': exp_id,
-                    'company': line,
-                    'title': '',
-                    'location': '',
-                    'period': '',
-                    'type': 'Full-time',
-                    'achievements': [],
-                    'technologies': [],
-                    'source': source_file
-                }
+                current_exp = Experience(id=exp_id, company=line, source=source_file)
                 exp_id += 1
                 
-            elif self._is_title_line(line) and current_exp:
-                current_exp['title'] = line
+            elif line_type & LINE_TITLE and current_exp:
+                current_exp.title = sys.intern(line)
                 
-            elif self._is_date_line(line) and current_exp:
-                current_exp['period'] = line
+            elif line_type & LINE_DATE and current_exp:
+                current_exp.period = sys.intern(line)
                 
-            elif self._is_location_line(line) and current_exp:
-                current_exp['location'] = line
+            elif line_type & LINE_LOCATION and current_exp:
+                current_exp.location = sys.intern(line)
                 
-            elif self._is_bullet_point(line) and current_exp:
+            elif line_type & LINE_BULLET and current_exp:
                 # Clean bullet point
                 cleaned_achievement = self._clean_bullet_point(line)
+                self.profiler.count('bullets_parsed')
                 if cleaned_achievement:
-                    current_exp['achievements'].append(cleaned_achievement)
+                    current_exp.achievements.append(cleaned_achievement)
                     
                     # Extract technologies from bullet point
-                    techs = self._extract_technologies_from_text(cleaned_achievement)
-                    current_exp['technologies'].extend(techs)
-        
-        # Add the last experience
-        if current_exp and current_exp.get('company'):
-            experiences.append(current_exp)
-        
-        # Clean up and deduplicate technologies
-        for exp in experiences:
-            exp['technologies'] = list(set(exp['technologies']))
-        
-        return experiences if experiences else self._extract_fallback_experience(text, source_file)
-    
-    def _is_company_line(self, line: str) -> bool:
-        """Check if line looks like a company name"""
-        # Company indicators
-        company_indicators = ['inc', 'corp', 'llc', 'ltd', 'company', 'solutions', 'technologies', 'systems', 'services', 'university', 'college']
-        line_lower = line.lower()
-        
-        # Skip if it's clearly not a company
-        if any(word in line_lower for word in ['experience', 'skills', 'education', 'projects']):
-            return False
-            
-        # Check for company patterns
-        if any(indicator in line_lower for indicator in company_indicators):
-            return True
-            
-        # Check if it's all caps (common for company names)
-        if line.isupper() and len(line) > 3:
-            return True
-            
-        # Check if it has title case and reasonable length
-        if line.istitle() and 5 <= len(line) <= 50:
-            return True
-            
-        return False
-    
-    def _is_title_line(self, line: str) -> bool:
-        """Check if line looks like a job title"""
-        title_keywords = ['engineer', 'developer', 'analyst', 'manager', 'assistant', 'specialist', 'consultant', 'architect', 'lead', 'senior', 'junior', 'intern']
-        return any(keyword in line.lower() for keyword in title_keywords)
-    
-    def _is_date_line(self, line: str) -> bool:
-        """Check if line contains dates"""
-        date_patterns = [
-            r'\d{4}\s*[-–]\s*\d{4}',  # 2020-2023
-            r'\w+\s+\d{4}\s*[-–]\s*\w+\s+\d{4}',  # Jan 2020 - Dec 2023
-            r'\d{1,2}/\d{4}\s*[-–]\s*\d{1,2}/\d{4}',  # 01/2020 - 12/2023
-            r'(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)',  # Month names
-            r'present|current'  # Current job indicators
-        ]
-        
-        line_lower = line.lower()
-        return any(re.search(pattern, line_lower) for pattern in date_patterns)
-    
-    def _is_location_line(self, line: str) -> bool:
-        """Check if line looks like a location"""
-        location_patterns = [
-            r'\w+,\s*\w{2}',  # City, ST
-            r'\w+,\s*\w+',    # City, Country
-        ]
+                    techs = self._extract_technologies_from_text(cleaned_achievement)
+                    current_exp.technologies.extend(techs)
         
-        # Common location indicators
-        location_words = ['usa', 'india', 'canada', 'uk', 'remote']
+        # Add the last experience
+        if current_exp and current_exp.company:
+            experiences.append(current_exp)
         
-        return (any(re.search(pattern, line) for pattern in location_patterns) or 
-                any(word in line.lower() for word in location_words))
-    
-    def _is_bullet_point(self, line: str) -> bool:
-        """Check if line is a bullet point"""
-        bullet_chars = ['•', '◦', '▪', '–', '-', '*', '→']
-        return (any(line.startswith(char) for char in bullet_chars) or
-                line.startswith('â€¢') or  # Unicode bullet
-                re.match(r'^\s*\d+\.', line))  # Numbered list
+        # Clean up and deduplicate technologies
+        for exp in experiences:
+            exp.technologies = list(set(exp.technologies))
+        
+        return experiences if experiences else self._extract_fallback_experience(text, source_file)
     
     def _clean_bullet_point(self, line: str) -> str:
         """Clean bullet point text"""
@@ -339,146 +2219,355 @@ class UltimatePDFPortfolioAnalyzer:
     
     def _extract_technologies_from_text(self, text: str) -> List[str]:
         """Extract technology names from text"""
-        tech_keywords = [
-            # Cloud platforms
-            'aws', 'azure', 'gcp', 'google cloud', 'cloud',
-            # Programming languages
-            'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'go', 'rust', 'php', 'ruby',
-            # DevOps tools
-            'docker', 'kubernetes', 'jenkins', 'terraform', 'ansible', 'vault', 'github actions',
-            # Databases
-            'mysql', 'postgresql', 'mongodb', 'redis', 'elasticsearch',
-            # Frameworks
-            'react', 'angular', 'vue', 'django', 'flask', 'spring', 'express',
-            # Tools
-            'git', 'jira', 'confluence', 'slack', 'linux', 'windows'
-        ]
-        
-        found_techs = []
-        text_lower = text.lower()
-        
-        for tech in tech_keywords:
-            if tech in text_lower:
-                # Capitalize first letter for consistency
-                found_techs.append(tech.title())
+        matched = _get_keyword_matcher().matched_keywords(text.lower())
         
-        return found_techs
+        # Capitalize first letter for consistency (one shared string per technology)
+        return [TECH_DISPLAY_NAMES[tech] for tech in TECH_KEYWORDS if tech in matched]
     
-    def _extract_fallback_experience(self, text: str, source_file: str) -> List[Dict[str, Any]]:
+    def _extract_fallback_experience(self, text: str, source_file: str) -> List[Experience]:
         """Fallback experience extraction when parsing fails"""
         logger.info(f"Using fallback extraction for {source_file}")
+        self.profiler.count('experience_fallbacks')
         
         # Try to extract at least basic info
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        index = _get_text_index(text)
+        self.profiler.count('lines_scanned', len(index))
         
         # Look for any company-like text
-        companies = []
-        for line in lines:
-            if self._is_company_line(line):
-                companies.append(line)
+        companies = [line for line, line_type in zip(index.lines, index.line_types) if line_type & LINE_COMPANY]
         
         # Create basic experience entries
         experiences = []
         for i, company in enumerate(companies[:3]):  # Limit to 3 companies
-            exp = {
-                'id': i + 1,
-                'company': company,
-                'title': 'Position details extracted from resume',
-                'location': 'Location extracted from resume',
-                'period': 'Duration extracted from resume',
-                'type': 'Full-time',
-                'achievements': [
+            exp = Experience(
+                id=i + 1,
+                company=company,
+                title='Position details extracted from resume',
+                location='Location extracted from resume',
+                period='Duration extracted from resume',
+                type='Full-time',
+                achievements=[
                     'Professional experience and achievements detailed in resume',
                     'Technical skills and accomplishments as described in source document',
                     'Key responsibilities and contributions outlined in original resume'
                 ],
-                'technologies': self._extract_technologies_from_text(text),
-                'source': source_file
-            }
+                technologies=self._extract_technologies_from_text(text),
+                source=source_file
+            )
             experiences.append(exp)
         
-        return experiences if experiences else [{
-            'id': 1,
-            'company': 'Professional Experience',
-            'title': 'Details Available in Resume',
-            'location': 'Various',
-            'period': 'Career History',
-            'type': 'Professional',
-            'achievements': [
+        return experiences if experiences else [Experience(
+            id=1,
+            company='Professional Experience',
+            title='Details Available in Resume',
+            location='Various',
+            period='Career History',
+            type='Professional',
+            achievements=[
                 'Complete professional experience and qualifications available in source resume',
                 'Technical expertise and career accomplishments detailed in original document',
                 'Full work history and achievements outlined in provided resume file'
             ],
-            'technologies': self._extract_technologies_from_text(text),
-            'source': source_file
-        }]
+            technologies=self._extract_technologies_from_text(text),
+            source=source_file
+        )]
+    
+    def _profile_key(self, pdf_path: str) -> str:
+        """Key of a PDF in profiler timings: its path relative to the workspace (unique across candidates)"""
+        if not os.path.isabs(pdf_path):
+            return pdf_path
+        return os.path.relpath(pdf_path, self.workspace_dir)
+    
+    def _analyze_pdf(self, pdf_path: str, pdf_source: Optional[PDFSource] = None) -> Tuple[str, List[Experience]]:
+        """Extract text from a single PDF (optionally given in memory) and parse its experiences"""
+        file_key = os.path.basename(pdf_path)
+        profile_key = self._profile_key(pdf_path)
+        logger.info(f"Processing PDF: {file_key}")
+        
+        # Extract text from PDF
+        with self.profiler.stage('extraction', profile_key):
+            text = self.extract_text_from_pdf_simple(pdf_path, pdf_source)
+        
+        # Extract experiences from this PDF
+        with self.profiler.stage('parse_experience', profile_key):
+            experiences = self.extract_experience_from_text(text, file_key)
+        
+        self.profiler.count('files_processed')
+        return text, experiences
+    
+    def _parallel_map(self, method_name: str, items: List[Any]) -> Iterator[Any]:
+        """Yield getattr(self, method_name)(item) for every item, in order, using the --jobs pool
+        
+        At most IN_FLIGHT_PER_WORKER items per worker are submitted ahead of
+        the one being yielded, so results finished behind a slow item wait in
+        a bounded window and memory stays flat however many items there are.
+        """
+        if self.jobs <= 1 or len(items) <= 1:
+            method = getattr(self, method_name)
+            for item in items:
+                yield method(item)
+            return
+        
+        # Imported here: concurrent.futures.process is costly and only needed with --jobs
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+        
+        workers = min(self.jobs, len(items))
+        logger.info(f"Processing {len(items)} items with {workers} {self.executor} workers")
+        if self.executor == 'thread':
+            # Threads only pay off for backends that release the GIL (e.g. PyMuPDF)
+            pool = ThreadPoolExecutor(max_workers=workers)
+            submit = partial(pool.submit, getattr(self, method_name))
+            calls = items
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_pdf_worker, initargs=(self,))
+            submit = partial(pool.submit, _run_in_worker)
+            calls = ((method_name, item) for item in items)
+        
+        def unwrap(future) -> Any:
+            result = future.result()
+            if self.executor != 'thread' and self.profiler.enabled:
+                result, worker_profile = result
+                self.profiler.merge(worker_profile)
+            return result
+        
+        window = workers * self.IN_FLIGHT_PER_WORKER
+        pending = deque()
+        with pool:
+            try:
+                # Results are yielded in submission order, so merging stays deterministic
+                for call in calls:
+                    pending.append(submit(call))
+                    if len(pending) >= window:
+                        yield unwrap(pending.popleft())
+                while pending:
+                    yield unwrap(pending.popleft())
+            finally:
+                # Stopped early (or failed): don't run what nobody will read
+                for future in pending:
+                    future.cancel()
+    
+    def _analyze_pdfs(self, pdf_files: List[str]) -> Iterator[Union[Tuple[str, List[Experience]], SkippedDocument]]:
+        """Yield _analyze_pdf results in order; with time/memory limits a file may yield a SkippedDocument"""
+        if self.time_limit or self.memory_limit_mb:
+            if self.executor == 'thread':
+                logger.info("Time/memory limits need isolated processes; using process workers")
+            sandbox = DocumentSandbox(self, workers=min(self.jobs, len(pdf_files)),
+                                      time_limit=self.time_limit, memory_limit_mb=self.memory_limit_mb)
+            return sandbox.map('_analyze_pdf', pdf_files)
+        return self._parallel_map('_analyze_pdf', pdf_files)
+    
+    def _iter_pdf_results(self):
+        """Yield (pdf_path, result) for every PDF in self.pdf_files order"""
+        yield from zip(self.pdf_files, self._analyze_pdfs(self.pdf_files))
+    
+    @staticmethod
+    def _track_experience_sources(extraction_sources: Dict[str, List[str]], experiences: List[Experience], pdf_path: str):
+        """Record which PDF each experience was extracted from"""
+        for exp in experiences:
+            exp_id = f"{exp.company}_{exp.title}"
+            if exp_id not in extraction_sources:
+                extraction_sources[exp_id] = []
+            extraction_sources[exp_id].append(os.path.basename(pdf_path))
     
-    def process_all_pdfs(self) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
+    def process_all_pdfs(self) -> Tuple[List[Experience], Dict[str, str]]:
         """Process all PDF files and extract experiences"""
         all_experiences = []
         extraction_sources = {}
+        self.skipped_files = []
         
-        for pdf_path in self.pdf_files:
-            logger.info(f"Processing PDF: {os.path.basename(pdf_path)}")
-            
-            # Extract text from PDF
-            text = self.extract_text_from_pdf_simple(pdf_path)
+        for pdf_path, result in self._iter_pdf_results():
+            if isinstance(result, SkippedDocument):
+                self.skipped_files.append(result)
+                continue
+            text, experiences = result
             self.extracted_texts[pdf_path] = text
             
-            # Extract experiences from this PDF
-            experiences = self.extract_experience_from_text(text, os.path.basename(pdf_path))
-            
             # Track source for each experience
-            for exp in experiences:
-                exp_id = f"{exp['company']}_{exp['title']}"
-                if exp_id not in extraction_sources:
-                    extraction_sources[exp_id] = []
-                extraction_sources[exp_id].append(os.path.basename(pdf_path))
-                all_experiences.append(exp)
+            self._track_experience_sources(extraction_sources, experiences, pdf_path)
+            all_experiences.extend(experiences)
+        
+        # Keep the text cache within its size budget after worker writes
+        if self.text_cache is not None:
+            self.text_cache.prune()
         
         # Remove duplicates and merge similar experiences
-        unique_experiences = self._merge_duplicate_experiences(all_experiences)
+        with self.profiler.stage('merge'):
+            unique_experiences = self._merge_duplicate_experiences(all_experiences)
         
         return unique_experiences, extraction_sources
     
-    def _merge_duplicate_experiences(self, experiences: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Merge duplicate experiences from different PDFs"""
-        merged = {}
+    def _extraction_options(self) -> Dict[str, Any]:
+        """Settings that change extraction results (a manifest is only valid for the same ones)"""
+        return {'backends': self.backends, 'max_pages': self.max_pages, 'min_text_chars': self.min_text_chars,
+                'time_limit': self.time_limit, 'memory_limit_mb': self.memory_limit_mb}
+    
+    def _default_manifest_path(self) -> str:
+        return os.path.join(self.extract_folder, '.analysis_manifest.json')
+    
+    def process_changed_pdfs(self, manifest: AnalysisManifest, force: bool = True
+                             ) -> Tuple[Optional[List[Experience]], Optional[Dict[str, List[str]]], Dict[str, int]]:
+        """Re-analyze only added or changed PDFs, drop deleted ones and merge everything from the manifest
         
-        for exp in experiences:
-            key = f"{exp['company']}_{exp['title']}"
+        When nothing was added, changed or removed and force is False, the
+        merged view is not rebuilt and (None, None, changes) is returned.
+        """
+        present = []
+        changed = []
+        current_keys = set()
+        changes = {'added': 0, 'changed': 0, 'removed': 0, 'unchanged': 0}
+        for pdf_path in self._find_pdf_files():
+            key = os.path.relpath(pdf_path, self.workspace_dir)
+            entry = manifest.files.get(key)
+            try:
+                stat = os.stat(pdf_path)
+                if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                    content_hash = None
+                else:
+                    content_hash = _file_sha256(pdf_path)
+            except FileNotFoundError:
+                # Deleted since it was listed: treat it as removed
+                continue
+            present.append(pdf_path)
+            current_keys.add(key)
+            
+            if content_hash is None:
+                changes['unchanged'] += 1
+                continue
+            if entry and entry['sha256'] == content_hash:
+                # Touched but not modified: just refresh the recorded stat
+                entry['size'], entry['mtime_ns'] = stat.st_size, stat.st_mtime_ns
+                changes['unchanged'] += 1
+                continue
             
-            if key not in merged:
-                merged[key] = exp.copy()
-                merged[key]['sources'] = [exp.get('source', 'unknown')]
+            changes['changed' if entry else 'added'] += 1
+            changed.append((pdf_path, key, stat, content_hash))
+        
+        for key in set(manifest.files) - current_keys:
+            del manifest.files[key]
+            changes['removed'] += 1
+        
+        self.pdf_files = present
+        if not (force or changes['added'] or changes['changed'] or changes['removed']):
+            return None, None, changes
+        
+        results = self._analyze_pdfs([pdf_path for pdf_path, _, _, _ in changed])
+        for (pdf_path, key, stat, content_hash), result in zip(changed, results):
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': content_hash}
+            if isinstance(result, SkippedDocument):
+                # Remembered so the file is only retried once it changes (or the limits do)
+                entry.update(text='', experiences=[], skipped=result)
             else:
-                # Merge achievements from multiple sources
-                existing_achievements = set(merged[key]['achievements'])
-                new_achievements = set(exp['achievements'])
-                
-                # Add any new achievements
-                for achievement in new_achievements:
-                    if achievement not in existing_achievements:
-                        merged[key]['achievements'].append(achievement)
-                
-                # Add source
-                if exp.get('source') not in merged[key]['sources']:
-                    merged[key]['sources'].append(exp.get('source', 'unknown'))
-                
-                # Merge technologies
-                existing_techs = set(merged[key]['technologies'])
-                new_techs = set(exp['technologies'])
-                merged[key]['technologies'] = list(existing_techs.union(new_techs))
+                entry['text'], entry['experiences'] = result
+            manifest.files[key] = entry
+        
+        # Rebuild the combined view from the manifest in discovery order
+        self.extracted_texts = {}
+        self.skipped_files = []
+        all_experiences = []
+        extraction_sources = {}
+        for pdf_path in self.pdf_files:
+            entry = manifest.files[os.path.relpath(pdf_path, self.workspace_dir)]
+            if entry.get('skipped'):
+                self.skipped_files.append(entry['skipped'])
+                continue
+            self.extracted_texts[pdf_path] = entry['text']
+            # Merging mutates experience lists, so keep the manifest's copies pristine
+            experiences = copy.deepcopy(entry['experiences'])
+            self._track_experience_sources(extraction_sources, experiences, pdf_path)
+            all_experiences.extend(experiences)
+        
+        with self.profiler.stage('merge'):
+            unique_experiences = self._merge_duplicate_experiences(all_experiences)
+        
+        return unique_experiences, extraction_sources, changes
+    
+    def run_incremental_analysis(self, manifest: Optional[AnalysisManifest] = None,
+                                 force: bool = True) -> Optional[Dict[str, Any]]:
+        """Update the portfolio output from only the files that changed since the last run
+        
+        Returns the portfolio data, or None when nothing changed and force is False.
+        """
+        if manifest is None:
+            manifest = AnalysisManifest.load(self._default_manifest_path(), self._extraction_options())
+        
+        experiences, extraction_sources, changes = self.process_changed_pdfs(manifest, force=force)
+        has_changes = changes['added'] or changes['changed'] or changes['removed']
+        logger.log(logging.INFO if has_changes or force else logging.DEBUG, f"Incremental analysis: {changes['added']} added, {changes['changed']} changed, "
+                    f"{changes['removed']} removed, {changes['unchanged']} unchanged")
+        if not has_changes and not force:
+            return None
+        
+        portfolio_data = self._portfolio_from_extracted(experiences, extraction_sources)
+        self.save_portfolio_data(portfolio_data)
+        manifest.save()
+        return portfolio_data
+    
+    def watch(self, interval: float = 0.5):
+        """Poll the resume folder and incrementally re-analyze whenever a PDF is added, edited or deleted"""
+        manifest = AnalysisManifest.load(self._default_manifest_path(), self._extraction_options())
+        logger.info(f"👀 Watching {self.resume_folder} for changes (Ctrl+C to stop)...")
         
-        # Convert back to list and reassign IDs
+        force = True
+        try:
+            while True:
+                portfolio_data = self.run_incremental_analysis(manifest, force=force)
+                if portfolio_data is not None:
+                    print(f"🔄 Portfolio updated: {len(portfolio_data['experience'])} experiences "
+                          f"from {len(self.pdf_files)} PDFs")
+                force = False
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            logger.info("Stopped watching")
+    
+    def _merge_duplicate_experiences(self, experiences: List[Experience]) -> List[Experience]:
+        """Merge experiences describing the same role in different PDFs
+        
+        Near-duplicates (case or punctuation differences, legal suffixes, lightly
+        edited titles together with similar bullets) are found with
+        ExperienceDeduplicator at self.merge_threshold; 1.0 merges only
+        normalized exact company/title matches. Roles at different levels and
+        entries from the same PDF are kept apart.
+        """
+        deduplicator = ExperienceDeduplicator(self.merge_threshold)
         result = []
-        for i, (key, exp) in enumerate(merged.items(), 1):
-            exp['id'] = i
-            result.append(exp)
+        
+        for cluster in deduplicator.cluster(experiences):
+            first = experiences[cluster[0]]
+            merged = replace(first, achievements=list(first.achievements), sources=[first.source or 'unknown'])
+            
+            if len(cluster) > 1:
+                seen_achievements = set(merged.achievements)
+                kept_shingles = [deduplicator.bullet_shingles(achievement) for achievement in merged.achievements]
+                techs = set(merged.technologies)
+                
+                for i in cluster[1:]:
+                    exp = experiences[i]
+                    # Add achievements that are neither repeated nor lightly edited copies
+                    for achievement in exp.achievements:
+                        if achievement in seen_achievements:
+                            continue
+                        seen_achievements.add(achievement)
+                        shingles = deduplicator.bullet_shingles(achievement)
+                        if deduplicator.is_duplicate_bullet(shingles, kept_shingles):
+                            continue
+                        merged.achievements.append(achievement)
+                        kept_shingles.append(shingles)
+                    
+                    # Add source
+                    if exp.source not in merged.sources:
+                        merged.sources.append(exp.source or 'unknown')
+                    
+                    # Merge technologies
+                    techs.update(exp.technologies)
+                merged.technologies = list(techs)
+            
+            # Reassign IDs in merged order
+            merged.id = len(result) + 1
+            result.append(merged)
         
         return result
     
-    def extract_skills_from_text(self, text: str) -> Dict[str, List[Dict[str, Any]]]:
+    def extract_skills_from_text(self, text: str) -> Dict[str, List[Skill]]:
         """Extract skills from resume text intelligently"""
         skills_data = {
             'languages': [],
@@ -490,135 +2579,41 @@ class UltimatePDFPortfolioAnalyzer:
             'tools': []
         }
         
-        # Comprehensive skill mappings
-        skill_mappings = {
-            'languages': {
-                'python': {'name': 'Python', 'category': 'Programming'},
-                'java': {'name': 'Java', 'category': 'Programming'},
-                'javascript': {'name': 'JavaScript', 'category': 'Programming'},
-                'typescript': {'name': 'TypeScript', 'category': 'Programming'},
-                'c++': {'name': 'C++', 'category': 'Programming'},
-                'c#': {'name': 'C#', 'category': 'Programming'},
-                'go': {'name': 'Go', 'category': 'Programming'},
-                'rust': {'name': 'Rust', 'category': 'Programming'},
-                'php': {'name': 'PHP', 'category': 'Programming'},
-                'ruby': {'name': 'Ruby', 'category': 'Programming'},
-                'bash': {'name': 'Bash/Shell', 'category': 'Scripting'},
-                'shell': {'name': 'Shell Scripting', 'category': 'Scripting'},
-                'powershell': {'name': 'PowerShell', 'category': 'Scripting'}
-            },
-            'frontend': {
-                'react': {'name': 'React', 'category': 'Framework'},
-                'angular': {'name': 'Angular', 'category': 'Framework'},
-                'vue': {'name': 'Vue.js', 'category': 'Framework'},
-                'html': {'name': 'HTML/CSS', 'category': 'Markup'},
-                'css': {'name': 'CSS', 'category': 'Styling'},
-                'sass': {'name': 'Sass', 'category': 'Styling'},
-                'tailwind': {'name': 'Tailwind CSS', 'category': 'Framework'},
-                'bootstrap': {'name': 'Bootstrap', 'category': 'Framework'},
-                'vite': {'name': 'Vite', 'category': 'Build Tool'},
-                'webpack': {'name': 'Webpack', 'category': 'Build Tool'}
-            },
-            'backend': {
-                'node': {'name': 'Node.js', 'category': 'Runtime'},
-                'express': {'name': 'Express.js', 'category': 'Framework'},
-                'django': {'name': 'Django', 'category': 'Framework'},
-                'flask': {'name': 'Flask', 'category': 'Framework'},
-                'spring': {'name': 'Spring', 'category': 'Framework'},
-                'rest': {'name': 'REST APIs', 'category': 'Architecture'},
-                'graphql': {'name': 'GraphQL', 'category': 'API'},
-                'api': {'name': 'API Development', 'category': 'Architecture'}
-            },
-            'devops': {
-                'docker': {'name': 'Docker', 'category': 'Containerization'},
-                'kubernetes': {'name': 'Kubernetes', 'category': 'Orchestration'},
-                'jenkins': {'name': 'Jenkins', 'category': 'CI/CD'},
-                'terraform': {'name': 'Terraform', 'category': 'IaC'},
-                'ansible': {'name': 'Ansible', 'category': 'Configuration'},
-                'github actions': {'name': 'GitHub Actions', 'category': 'CI/CD'},
-                'gitlab': {'name': 'GitLab CI', 'category': 'CI/CD'},
-                'circleci': {'name': 'CircleCI', 'category': 'CI/CD'},
-                'helm': {'name': 'Helm', 'category': 'Package Management'},
-                'vault': {'name': 'HashiCorp Vault', 'category': 'Security'}
-            },
-            'cloud': {
-                'aws': {'name': 'AWS', 'category': 'Cloud Platform'},
-                'azure': {'name': 'Azure', 'category': 'Cloud Platform'},
-                'gcp': {'name': 'Google Cloud Platform', 'category': 'Cloud Platform'},
-                'google cloud': {'name': 'Google Cloud', 'category': 'Cloud Platform'},
-                'ec2': {'name': 'EC2', 'category': 'AWS Service'},
-                's3': {'name': 'S3', 'category': 'AWS Service'},
-                'rds': {'name': 'RDS', 'category': 'AWS Service'},
-                'vpc': {'name': 'VPC', 'category': 'AWS Service'},
-                'iam': {'name': 'IAM', 'category': 'AWS Service'},
-                'lambda': {'name': 'Lambda', 'category': 'AWS Service'},
-                'cloudformation': {'name': 'CloudFormation', 'category': 'AWS Service'}
-            },
-            'databases': {
-                'mysql': {'name': 'MySQL', 'category': 'Relational'},
-                'postgresql': {'name': 'PostgreSQL', 'category': 'Relational'},
-                'mongodb': {'name': 'MongoDB', 'category': 'NoSQL'},
-                'redis': {'name': 'Redis', 'category': 'Cache'},
-                'elasticsearch': {'name': 'Elasticsearch', 'category': 'Search'},
-                'cassandra': {'name': 'Cassandra', 'category': 'NoSQL'},
-                'dynamodb': {'name': 'DynamoDB', 'category': 'NoSQL'},
-                'sqlite': {'name': 'SQLite', 'category': 'Relational'}
-            },
-            'tools': {
-                'git': {'name': 'Git', 'category': 'Version Control'},
-                'linux': {'name': 'Linux/Unix', 'category': 'Operating System'},
-                'ubuntu': {'name': 'Ubuntu', 'category': 'Operating System'},
-                'centos': {'name': 'CentOS', 'category': 'Operating System'},
-                'red hat': {'name': 'Red Hat Enterprise Linux', 'category': 'Operating System'},
-                'windows': {'name': 'Windows', 'category': 'Operating System'},
-                'jira': {'name': 'Jira', 'category': 'Project Management'},
-                'confluence': {'name': 'Confluence', 'category': 'Documentation'},
-                'slack': {'name': 'Slack', 'category': 'Communication'},
-                'vscode': {'name': 'VS Code', 'category': 'IDE'},
-                'intellij': {'name': 'IntelliJ IDEA', 'category': 'IDE'},
-                'postman': {'name': 'Postman', 'category': 'API Testing'}
-            }
-        }
-        
-        text_lower = text.lower()
+        stats = _get_token_stats(text.lower())
         
         # Extract skills by category
-        for category, skill_dict in skill_mappings.items():
+        for category, skill_dict in SKILL_TAXONOMY.items():
             for skill_key, skill_info in skill_dict.items():
-                if skill_key in text_lower:
+                if stats.keyword_count(skill_key):
                     # Estimate skill level based on context
-                    skill_level = self._estimate_skill_level(skill_key, text_lower)
-                    years = self._estimate_years_experience(skill_key, text_lower)
+                    skill_level = self._estimate_skill_level(skill_key, stats)
+                    years = self._estimate_years_experience(skill_key, stats)
                     
-                    skill_entry = {
-                        'name': skill_info['name'],
-                        'level': skill_level,
-                        'years': years,
-                        'category': skill_info['category']
-                    }
+                    skill_entry = Skill(
+                        name=skill_info['name'],
+                        level=skill_level,
+                        years=years,
+                        category=skill_info['category']
+                    )
                     
                     skills_data[category].append(skill_entry)
         
         return skills_data
     
-    def _estimate_skill_level(self, skill: str, text: str) -> int:
-        """Estimate skill level based on context"""
-        # Look for experience indicators
-        if any(word in text for word in ['expert', 'advanced', 'senior', 'lead']):
-            return 90
-        elif any(word in text for word in ['proficient', 'experienced', 'skilled']):
-            return 80
-        elif any(word in text for word in ['intermediate', 'familiar']):
-            return 70
-        elif any(word in text for word in ['basic', 'beginner', 'learning']):
-            return 60
-        else:
-            return 75  # Default
+    def _estimate_skill_level(self, skill: str, stats: TokenStats) -> int:
+        """Estimate skill level from proficiency words near the skill's mentions"""
+        mentions = stats.keyword_positions.get(skill, ())
+        
+        # Look for experience indicators, strongest first
+        for level, words in SKILL_LEVEL_TIERS:
+            if any(stats.near(pos, words, SKILL_CONTEXT_CHARS) for pos in mentions):
+                return level
+        return DEFAULT_SKILL_LEVEL
     
-    def _estimate_years_experience(self, skill: str, text: str) -> int:
+    def _estimate_years_experience(self, skill: str, stats: TokenStats) -> int:
         """Estimate years of experience"""
         # Simple heuristic based on skill mentions
-        skill_count = text.count(skill)
+        skill_count = stats.keyword_count(skill)
         if skill_count >= 5:
             return 4
         elif skill_count >= 3:
@@ -630,7 +2625,8 @@ class UltimatePDFPortfolioAnalyzer:
     
     def extract_personal_info_from_text(self, text: str) -> Dict[str, Any]:
         """Extract personal information from resume text"""
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        index = _get_text_index(text)
+        lines = index.lines
         
         personal_info = {
             'name': '',
@@ -710,20 +2706,16 @@ class UltimatePDFPortfolioAnalyzer:
                     break
         
         # Generate bio from first paragraph or summary
-        bio_keywords = ['summary', 'objective', 'about', 'profile']
         bio_lines = []
-        found_bio_section = False
+        bio_start = index.find(BIO_SECTION_TERMS)
         
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in bio_keywords):
-                found_bio_section = True
-                continue
-            
-            if found_bio_section:
-                if line and not any(section in line.lower() for section in ['experience', 'education', 'skills']):
-                    bio_lines.append(line)
-                else:
+        if bio_start != -1:
+            for i in range(bio_start + 1, len(index)):
+                if index.has_any(i, BIO_SECTION_TERMS):
+                    continue
+                if index.has_any(i, BIO_END_TERMS):
                     break
+                bio_lines.append(lines[i])
         
         if bio_lines:
             personal_info['bio'] = ' '.join(bio_lines)
@@ -736,32 +2728,25 @@ class UltimatePDFPortfolioAnalyzer:
     def extract_education_from_text(self, text: str) -> List[Dict[str, Any]]:
         """Extract education information from text"""
         education_list = []
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        index = _get_text_index(text)
         
-        # Find education section
-        education_start = -1
-        for i, line in enumerate(lines):
-            if 'education' in line.lower():
-                education_start = i
-                break
+        # Find education section (ends at the next major section header)
+        education_lines = index.section(EDUCATION_SECTION_TERMS, EDUCATION_END_TERMS)
         
-        if education_start == -1:
+        if education_lines is None:
             return self._create_default_education()
         
         # Extract education entries
         current_edu = None
         edu_id = 1
         
-        for i in range(education_start + 1, len(lines)):
-            line = lines[i].strip()
-            
-            # Stop at next major section
-            if any(section in line.lower() for section in ['experience', 'skills', 'projects', 'certifications']):
-                break
+        self.profiler.count('lines_scanned', len(education_lines))
+        for i in education_lines:
+            line = index.lines[i]
+            line_type = index.line_types[i]
             
             # Look for degree patterns
-            degree_keywords = ['bachelor', 'master', 'phd', 'doctorate', 'associate', 'certificate', 'diploma']
-            if any(keyword in line.lower() for keyword in degree_keywords):
+            if line_type & LINE_DEGREE:
                 if current_edu:
                     education_list.append(current_edu)
                 
@@ -782,11 +2767,11 @@ class UltimatePDFPortfolioAnalyzer:
             
             elif current_edu:
                 # Look for institution, dates, etc.
-                if self._is_institution_line(line):
+                if line_type & LINE_INSTITUTION:
                     current_edu['institution'] = line
-                elif self._is_date_line(line):
+                elif line_type & LINE_DATE:
                     current_edu['period'] = line
-                elif 'gpa' in line.lower():
+                elif 'gpa' in index.lines_lower[i]:
                     current_edu['gpa'] = line
         
         # Add the last education entry
@@ -795,11 +2780,6 @@ class UltimatePDFPortfolioAnalyzer:
         
         return education_list if education_list else self._create_default_education()
     
-    def _is_institution_line(self, line: str) -> bool:
-        """Check if line looks like an institution name"""
-        institution_keywords = ['university', 'college', 'institute', 'school', 'academy']
-        return any(keyword in line.lower() for keyword in institution_keywords)
-    
     def _create_default_education(self) -> List[Dict[str, Any]]:
         """Create default education entry when none found"""
         return [{
@@ -1025,110 +3005,279 @@ Demonstrated success in streamlining processes, resolving critical issues, and m
         # Process all PDF files
         experiences, extraction_sources = self.process_all_pdfs()
         
+        return self._portfolio_from_extracted(experiences, extraction_sources)
+    
+    def _portfolio_from_extracted(self, experiences: List[Experience],
+                                  extraction_sources: Dict[str, List[str]]) -> Dict[str, Any]:
+        """Build the combined portfolio from self.extracted_texts and merged experiences"""
         # Combine all extracted text for comprehensive analysis
-        all_text = ""
-        for pdf_path, text in self.extracted_texts.items():
-            all_text += f"\n{text}\n"
+        all_text = ''.join(f"\n{text}\n" for text in self.extracted_texts.values())
         
+        processed_files = [pdf_path for pdf_path in self.pdf_files if pdf_path in self.extracted_texts]
+        portfolio_data = self._build_portfolio_data(all_text, experiences, extraction_sources, processed_files,
+                                                    self.skipped_files)
+        if self.profiler.enabled:
+            portfolio_data['metadata']['performance'] = self.profiler.to_dict()
+        return portfolio_data
+    
+    def _build_portfolio_data(self, all_text: str, experiences: List[Experience],
+                              extraction_sources: Dict[str, List[str]], pdf_files: List[str],
+                              skipped_files: Optional[List[SkippedDocument]] = None) -> Dict[str, Any]:
+        """Assemble the portfolio sections for one document's text and experiences"""
         # Extract information intelligently from combined text
-        personal_info = self.extract_personal_info_from_text(all_text)
-        skills_data = self.extract_skills_from_text(all_text)
-        education_data = self.extract_education_from_text(all_text)
+        with self.profiler.stage('parse_personal_info'):
+            personal_info = self.extract_personal_info_from_text(all_text)
+        with self.profiler.stage('parse_skills'):
+            skills_data = self.extract_skills_from_text(all_text)
+        with self.profiler.stage('parse_education'):
+            education_data = self.extract_education_from_text(all_text)
+        with self.profiler.stage('parse_projects'):
+            projects_data = self.extract_projects_from_text(all_text)
+        with self.profiler.stage('parse_certifications'):
+            certifications_data = self.extract_certifications_from_text(all_text)
+        with self.profiler.stage('parse_achievements'):
+            achievements_data = self.extract_achievements_from_text(all_text)
         
         # Calculate total achievements
-        total_achievements = sum(len(exp.get('achievements', [])) for exp in experiences)
+        total_achievements = sum(len(exp.achievements) for exp in experiences)
         
         # Generate comprehensive portfolio data
         portfolio_data = {
             'personalInfo': personal_info,
             'experience': experiences,
-            'projects': self.extract_projects_from_text(all_text),
+            'projects': projects_data,
             'skills': skills_data,
             'education': education_data,
-            'certifications': self.extract_certifications_from_text(all_text),
-            'achievements': self.extract_achievements_from_text(all_text),
+            'certifications': certifications_data,
+            'achievements': achievements_data,
             'metadata': {
                 'generated_by': 'Ultimate PDF Portfolio Analyzer v4.0 - Real Extraction',
                 'generation_date': '2025-07-19',
                 'extraction_method': 'Intelligent PDF processing with real text extraction',
-                'pdf_files_processed': len(self.pdf_files),
-                'pdf_files_list': [os.path.basename(pdf) for pdf in self.pdf_files],
+                'pdf_files_processed': len(pdf_files),
+                'pdf_files_list': [os.path.basename(pdf) for pdf in pdf_files],
                 'extraction_sources': extraction_sources,
                 'total_achievements_extracted': total_achievements,
                 'total_sections': 7,
                 'data_quality': 'Production Ready - Real PDF Extraction',
-                'pdf_library_used': PDF_LIBRARY,
+                'pdf_library_used': self.backends[0] if self.backends else None,
+                'pdf_backend_order': self.backends,
                 'text_extracted_chars': len(all_text)
             }
         }
+        if skipped_files:
+            portfolio_data['metadata']['skipped_files'] = skipped_files
+        
+        return portfolio_data
+    
+    def _find_candidate_groups(self) -> List[Tuple[str, List[str]]]:
+        """Group resume PDFs by candidate for batch mode
+        
+        Every resume PDF directly in the resume folder is its own candidate, and
+        every subfolder of the resume folder is one candidate made of all the
+        PDFs inside it.
+        """
+        groups = [(Path(pdf_path).stem, [pdf_path]) for pdf_path in self.pdf_files]
+        
+        resume_path = Path(self.resume_folder)
+        if resume_path.exists():
+            for candidate_dir in sorted(p for p in resume_path.iterdir() if p.is_dir()):
+                pdf_files = sorted(set(str(f) for pattern in ("*.pdf", "*.PDF") for f in candidate_dir.glob(pattern)))
+                if pdf_files:
+                    groups.append((candidate_dir.name, pdf_files))
+        
+        return groups
+    
+    def analyze_candidate(self, candidate: Tuple[str, List[str]]) -> Dict[str, Any]:
+        """Generate a standalone portfolio for one candidate's PDFs"""
+        candidate_id, pdf_files = candidate
+        return self._candidate_portfolio(candidate_id, pdf_files, [self._analyze_pdf(pdf_path) for pdf_path in pdf_files])
+    
+    def _candidate_portfolio(self, candidate_id: str, pdf_files: List[str],
+                             results: List[Tuple[str, List[Experience]]]) -> Dict[str, Any]:
+        """Merge one candidate's per-file (text, experiences) or SkippedDocument results into a portfolio"""
+        texts = []
+        all_experiences = []
+        extraction_sources = {}
+        processed_files = []
+        skipped_files = []
         
+        for pdf_path, result in zip(pdf_files, results):
+            if isinstance(result, SkippedDocument):
+                skipped_files.append(result)
+                continue
+            text, experiences = result
+            processed_files.append(pdf_path)
+            texts.append(text)
+            self._track_experience_sources(extraction_sources, experiences, pdf_path)
+            all_experiences.extend(experiences)
+        
+        candidate_text = ''.join(f"\n{text}\n" for text in texts)
+        with self.profiler.stage('merge'):
+            experiences = self._merge_duplicate_experiences(all_experiences)
+        portfolio_data = self._build_portfolio_data(candidate_text, experiences, extraction_sources, processed_files,
+                                                    skipped_files)
+        portfolio_data['metadata']['candidate_id'] = candidate_id
+        if self.profiler.enabled:
+            # Run-wide totals are logged at the end of the batch; records carry their own files
+            portfolio_data['metadata']['performance'] = self.profiler.to_dict(
+                file_keys=[self._profile_key(pdf_path) for pdf_path in pdf_files])
         return portfolio_data
     
-    def extract_projects_from_text(self, text: str) -> List[Dict[str, Any]]:
+    def analyze_pdf_bytes(self, upload: Tuple[str, PDFSource]) -> Dict[str, Any]:
+        """Generate a standalone portfolio for one in-memory PDF given as (filename, bytes/memoryview/mmap)"""
+        filename, data = upload
+        filename = os.path.basename(filename or '') or 'upload.pdf'
+        return self._candidate_portfolio(os.path.splitext(filename)[0], [filename],
+                                         [self._analyze_pdf(filename, data)])
+    
+    def _iter_candidate_portfolios(self, groups: List[Tuple[str, List[str]]]) -> Iterator[Dict[str, Any]]:
+        """Yield analyze_candidate(group) for every group, in order
+        
+        With time/memory limits the PDFs of all candidates go through one
+        DocumentSandbox and each candidate's portfolio is assembled here, so a
+        limit applies to a single file and only that file is skipped.
+        """
+        if not (self.time_limit or self.memory_limit_mb):
+            yield from self._parallel_map('analyze_candidate', groups)
+            return
+        
+        results = self._analyze_pdfs([pdf_path for _, pdf_files in groups for pdf_path in pdf_files])
+        for candidate_id, pdf_files in groups:
+            yield self._candidate_portfolio(candidate_id, pdf_files, [next(results) for _ in pdf_files])
+    
+    def run_batch_analysis(self, output_file: str = None) -> Optional[str]:
+        """Analyze every candidate separately and stream one portfolio per line to a JSONL file
+        
+        Records are written as soon as each candidate finishes and nothing is
+        kept in memory afterwards, so memory use stays flat however many
+        candidates the resume folder holds. Each line is appended and flushed
+        to <output_file>.partial as its candidate finishes, so records are
+        visible while the batch runs; the file is renamed to output_file once
+        every candidate is written and kept as-is if the run fails. With analytics
+        enabled each record is also folded into a CorpusAnalytics, saved next
+        to output_file as <name>_analytics.json, and with a search index each
+        record is indexed as it is written and committed once output_file is
+        in place (a failed run leaves the index as it was).
+        """
+        groups = self._find_candidate_groups()
+        output_file = output_file or os.path.join(self.extract_folder, 'portfolio_batch.jsonl')
+        partial_file = f"{output_file}.partial"
+        os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
+        # JSON Lines needs one record per line, whatever the pretty/compact setting
+        line_writer = PortfolioJSONWriter(compact=True, encoder=self.json_writer.encoder)
+        
+        analytics = CorpusAnalytics(top_k=self.analytics_top) if self.analytics else None
+        search_index = self._open_search_index() if self.search_index_path else None
+        
+        logger.info(f"🚀 Starting batch analysis of {len(groups)} candidates...")
+        written = 0
+        try:
+            with open(partial_file, 'wb') as f:
+                for (_, pdf_files), portfolio_data in zip(groups, self._iter_candidate_portfolios(groups)):
+                    with self.profiler.stage('serialization'):
+                        for chunk in line_writer.iter_chunks(portfolio_data):
+                            f.write(chunk)
+                        f.write(b'\n')
+                        f.flush()
+                    written += 1
+                    # The record carries its own file timings; keep only run-wide totals from here on
+                    self.profiler.release_files(self._profile_key(pdf_path) for pdf_path in pdf_files)
+                    if analytics is not None:
+                        with self.profiler.stage('analytics'):
+                            analytics.add(portfolio_data)
+                    if search_index is not None:
+                        self._index_portfolio(search_index, output_file, portfolio_data)
+                os.fsync(f.fileno())
+            os.replace(partial_file, output_file)
+            
+            # Index rows are committed only now that the records they point to are in output_file
+            if search_index is not None:
+                removed = search_index.finish_run(os.path.abspath(output_file))
+                logger.info(f"🔎 Search index {self.search_index_path}: {len(search_index)} candidates "
+                            f"({removed} no longer in this batch removed)")
+        except OSError as e:
+            logger.error(f"❌ Error writing batch output: {e} ({written} records kept in {partial_file})")
+            return None
+        finally:
+            # Any failure before finish_run() rolls back this run's index rows
+            if search_index is not None:
+                search_index.close()
+        
+        if analytics is not None:
+            analytics_file = f"{os.path.splitext(output_file)[0]}_analytics.json"
+            try:
+                self.json_writer.write(analytics.to_dict(), analytics_file)
+                logger.info(f"📊 Corpus analytics saved to: {analytics_file}")
+            except OSError as e:
+                logger.error(f"❌ Error saving corpus analytics: {e}")
+        
+        if self.text_cache is not None:
+            self.text_cache.prune()
+        
+        logger.info(f"✅ Wrote {written} candidate portfolios to: {output_file}")
+        if self.profiler.enabled:
+            print(self.generate_performance_report())
+        return output_file
+    
+    def extract_projects_from_text(self, text: str) -> List[Project]:
         """Extract projects from resume text"""
         projects = []
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        index = _get_text_index(text)
         
-        # Find projects section
-        project_start = -1
-        project_keywords = ['projects', 'academic projects', 'personal projects', 'portfolio']
-        
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in project_keywords):
-                project_start = i
-                break
+        # Find projects section (ends at the next major section header)
+        project_lines = index.section(PROJECT_SECTION_TERMS, PROJECT_END_TERMS)
         
-        if project_start == -1:
+        if project_lines is None:
             return self._create_default_projects()
         
         # Extract project entries
         current_project = None
         project_id = 1
         
-        for i in range(project_start + 1, len(lines)):
-            line = lines[i].strip()
-            
-            # Stop at next major section
-            if any(section in line.lower() for section in ['experience', 'education', 'skills', 'certifications']):
-                break
+        self.profiler.count('lines_scanned', len(project_lines))
+        for i in project_lines:
+            line = index.lines[i]
+            line_type = index.line_types[i]
             
             # Check if this looks like a project title
-            if self._is_project_title(line):
+            if line_type & LINE_PROJECT_TITLE:
                 if current_project:
                     projects.append(current_project)
                 
-                current_project = {
-                    'id': project_id,
-                    'title': line,
-                    'category': 'Software Development',
-                    'description': '',
-                    'longDescription': '',
-                    'image': '/api/placeholder/600/400',
-                    'technologies': [],
-                    'features': [],
-                    'githubUrl': '',
-                    'liveUrl': None,
-                    'status': 'Completed',
-                    'startDate': '',
-                    'endDate': ''
-                }
+                current_project = Project(
+                    id=project_id,
+                    title=line,
+                    category='Software Development',
+                    description='',
+                    longDescription='',
+                    image='/api/placeholder/600/400',
+                    technologies=[],
+                    features=[],
+                    githubUrl='',
+                    liveUrl=None,
+                    status='Completed',
+                    startDate='',
+                    endDate=''
+                )
                 project_id += 1
             
             elif current_project and line:
                 # Add as description or feature
-                if self._is_bullet_point(line):
+                if line_type & LINE_BULLET:
                     feature = self._clean_bullet_point(line)
+                    self.profiler.count('bullets_parsed')
                     if feature:
-                        current_project['features'].append(feature)
+                        current_project.features.append(feature)
                         # Extract technologies
                         techs = self._extract_technologies_from_text(feature)
-                        current_project['technologies'].extend(techs)
+                        current_project.technologies.extend(techs)
                 else:
                     # Add to description
-                    if not current_project['description']:
-                        current_project['description'] = line
+                    if not current_project.description:
+                        current_project.description = line
                     else:
-                        current_project['longDescription'] += f" {line}"
+                        current_project.longDescription += f" {line}"
         
         # Add the last project
         if current_project:
@@ -1136,45 +3285,33 @@ Demonstrated success in streamlining processes, resolving critical issues, and m
         
         # Clean up technologies
         for project in projects:
-            project['technologies'] = list(set(project['technologies']))
+            project.technologies = list(set(project.technologies))
         
         return projects if projects else self._create_default_projects()
     
-    def _is_project_title(self, line: str) -> bool:
-        """Check if line looks like a project title"""
-        # Project title indicators
-        if len(line) < 10 or len(line) > 100:
-            return False
-        
-        # Common project patterns
-        project_indicators = ['system', 'platform', 'application', 'tool', 'website', 'app', 'portal', 'dashboard']
-        
-        return (any(indicator in line.lower() for indicator in project_indicators) or
-                (line.istitle() and len(line.split()) <= 8))
-    
-    def _create_default_projects(self) -> List[Dict[str, Any]]:
+    def _create_default_projects(self) -> List[Project]:
         """Create default projects when none found"""
-        return [{
-            'id': 1,
-            'title': 'Professional Projects',
-            'category': 'Software Development',
-            'description': 'Project details and technical accomplishments available in source resume',
-            'longDescription': 'Complete project portfolio including technical implementations, achievements, and technologies used as detailed in the original resume document.',
-            'image': '/api/placeholder/600/400',
-            'technologies': ['Various Technologies'],
-            'features': [
+        return [Project(
+            id=1,
+            title='Professional Projects',
+            category='Software Development',
+            description='Project details and technical accomplishments available in source resume',
+            longDescription='Complete project portfolio including technical implementations, achievements, and technologies used as detailed in the original resume document.',
+            image='/api/placeholder/600/400',
+            technologies=['Various Technologies'],
+            features=[
                 'Project features and technical implementations detailed in resume',
                 'Professional accomplishments and technical contributions',
                 'Complete project specifications available in source document'
             ],
-            'githubUrl': '',
-            'liveUrl': None,
-            'status': 'Completed',
-            'startDate': '',
-            'endDate': ''
-        }]
+            githubUrl='',
+            liveUrl=None,
+            status='Completed',
+            startDate='',
+            endDate=''
+        )]
     
-    def extract_certifications_from_text(self, text: str) -> List[Dict[str, Any]]:
+    def extract_certifications_from_text(self, text: str) -> List[Certification]:
         """Extract certifications from text"""
         certifications = []
         cert_id = 1
@@ -1198,17 +3335,17 @@ Demonstrated success in streamlining processes, resolving critical issues, and m
             for match in matches:
                 cert_text = match.group().strip()
                 if len(cert_text) > 10:  # Valid certification length
-                    cert = {
-                        'id': cert_id,
-                        'name': cert_text.title(),
-                        'issuer': self._extract_cert_issuer(cert_text),
-                        'date': 'Valid',
-                        'credentialId': f'CERT-{cert_id}',
-                        'description': f'Professional certification in {cert_text}',
-                        'skills': self._extract_cert_skills(cert_text),
-                        'badgeUrl': '/api/placeholder/100/100',
-                        'verificationUrl': ''
-                    }
+                    cert = Certification(
+                        id=cert_id,
+                        name=cert_text.title(),
+                        issuer=self._extract_cert_issuer(cert_text),
+                        date='Valid',
+                        credentialId=f'CERT-{cert_id}',
+                        description=f'Professional certification in {cert_text}',
+                        skills=self._extract_cert_skills(cert_text),
+                        badgeUrl='/api/placeholder/100/100',
+                        verificationUrl=''
+                    )
                     certifications.append(cert)
                     cert_id += 1
         
@@ -1243,74 +3380,256 @@ Demonstrated success in streamlining processes, resolving critical issues, and m
         
         return skills
     
-    def _create_default_certifications(self) -> List[Dict[str, Any]]:
+    def _create_default_certifications(self) -> List[Certification]:
         """Create default certifications"""
-        return [{
-            'id': 1,
-            'name': 'Professional Certifications',
-            'issuer': 'Various Certification Bodies',
-            'date': 'As Listed in Resume',
-            'credentialId': 'See Resume',
-            'description': 'Professional certifications and qualifications detailed in source resume',
-            'skills': ['Professional Skills'],
-            'badgeUrl': '/api/placeholder/100/100',
-            'verificationUrl': ''
-        }]
+        return [Certification(
+            id=1,
+            name='Professional Certifications',
+            issuer='Various Certification Bodies',
+            date='As Listed in Resume',
+            credentialId='See Resume',
+            description='Professional certifications and qualifications detailed in source resume',
+            skills=['Professional Skills'],
+            badgeUrl='/api/placeholder/100/100',
+            verificationUrl=''
+        )]
     
-    def extract_achievements_from_text(self, text: str) -> List[Dict[str, Any]]:
+    def extract_achievements_from_text(self, text: str) -> List[Achievement]:
         """Extract achievements from text"""
         achievements = []
-        achievement_keywords = ['award', 'recognition', 'achievement', 'honor', 'accomplishment']
-        
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        index = _get_text_index(text)
         
         achievement_id = 1
-        for line in lines:
-            line_lower = line.lower()
-            if any(keyword in line_lower for keyword in achievement_keywords):
-                if len(line) > 15:  # Reasonable achievement length
-                    achievement = {
-                        'id': achievement_id,
-                        'title': line,
-                        'organization': 'As detailed in resume',
-                        'date': 'Date in resume',
-                        'category': 'Professional Achievement',
-                        'description': line,
-                        'icon': '🏆'
-                    }
-                    achievements.append(achievement)
-                    achievement_id += 1
+        for i in index.lines_with(ACHIEVEMENT_TERMS):
+            line = index.lines[i]
+            if len(line) > 15:  # Reasonable achievement length
+                achievement = Achievement(
+                    id=achievement_id,
+                    title=line,
+                    organization='As detailed in resume',
+                    date='Date in resume',
+                    category='Professional Achievement',
+                    description=line,
+                    icon='🏆'
+                )
+                achievements.append(achievement)
+                achievement_id += 1
         
         return achievements if achievements else self._create_default_achievements()
     
-    def _create_default_achievements(self) -> List[Dict[str, Any]]:
+    def _create_default_achievements(self) -> List[Achievement]:
         """Create default achievements"""
-        return [{
-            'id': 1,
-            'title': 'Professional Achievements',
-            'organization': 'Career Accomplishments',
-            'date': 'Throughout Career',
-            'category': 'Professional Excellence',
-            'description': 'Professional achievements, awards, and recognitions detailed in source resume document',
-            'icon': '🏆'
-        }]
+        return [Achievement(
+            id=1,
+            title='Professional Achievements',
+            organization='Career Accomplishments',
+            date='Throughout Career',
+            category='Professional Excellence',
+            description='Professional achievements, awards, and recognitions detailed in source resume document',
+            icon='🏆'
+        )]
     
     def save_portfolio_data(self, data: Dict[str, Any], filename: str = "ultimate_multi_pdf_portfolio_data.json"):
-        """Save portfolio data to JSON file in extract_resume folder"""
-        # Ensure extract_resume folder exists
-        os.makedirs(self.extract_folder, exist_ok=True)
-        
+        """Save portfolio data to JSON file in extract_resume folder (written atomically, section by section)"""
         output_file = os.path.join(self.extract_folder, filename)
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with self.profiler.stage('serialization'):
+                self.profiler.count('output_bytes', self.json_writer.write(data, output_file))
             
             logger.info(f"✅ Ultimate multi-PDF portfolio data saved to: {output_file}")
-            return output_file
         except Exception as e:
             logger.error(f"❌ Error saving portfolio data: {e}")
             return None
+        
+        if self.sections_dir:
+            self.save_portfolio_sections(data)
+        if self.es_modules_dir:
+            self.save_portfolio_es_modules(data)
+        if self.search_index_path:
+            search_index = self._open_search_index()
+            if search_index is not None:
+                try:
+                    self._index_portfolio(search_index, output_file, data)
+                    search_index.finish_run(os.path.abspath(output_file))
+                finally:
+                    search_index.close()
+        return output_file
+    
+    def _open_search_index(self) -> Optional[PortfolioSearchIndex]:
+        """Open the search index, logging and returning None when it cannot be used"""
+        try:
+            return PortfolioSearchIndex(self.search_index_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"❌ Cannot open search index {self.search_index_path}: {e}")
+            return None
+    
+    def _index_portfolio(self, search_index: PortfolioSearchIndex, output_file: str, data: Dict[str, Any]):
+        """Add one written portfolio to the search index"""
+        candidate_id = data['metadata'].get('candidate_id') or os.path.splitext(os.path.basename(output_file))[0]
+        with self.profiler.stage('indexing'):
+            if search_index.upsert(os.path.abspath(output_file), candidate_id, data):
+                self.profiler.count('portfolios_indexed')
+    
+    def save_portfolio_sections(self, data: Dict[str, Any], output_dir: Optional[str] = None) -> Optional[str]:
+        """Write each top-level section to its own content-hashed file plus a small manifest.json
+        
+        A section file is named <section>.<hash>.json after the first 12 hex
+        digits of its SHA-256, so it can be served with a far-future cache
+        lifetime and only changes name when its content does. The manifest,
+        written last, maps each section to its file, size and hash.
+        
+        Section files stay on disk for SECTION_GENERATIONS_KEPT manifests, so
+        a browser holding a recent manifest can still lazy-load its sections.
+        The file lists of those manifests are kept in .manifest_history.json;
+        only files that an older manifest listed, and no kept one does, are
+        removed, so unrelated files in the directory are never touched.
+        Returns the manifest path.
+        """
+        output_dir = output_dir or self.sections_dir or os.path.join(self.extract_folder, 'portfolio_sections')
+        manifest = {'version': SECTIONS_FORMAT_VERSION, 'sections': {}}
+        # The standard library encoder, so section hashes do not depend on whether orjson is installed
+        writer = PortfolioJSONWriter(compact=self.json_writer.compact, encoder='json')
+        
+        try:
+            with self.profiler.stage('serialization'):
+                os.makedirs(output_dir, exist_ok=True)
+                for section, value in data.items():
+                    encoded = writer.dumps(value)
+                    digest = hashlib.sha256(encoded).hexdigest()
+                    filename = f"{section}.{digest[:SECTION_HASH_CHARS]}.json"
+                    section_path = os.path.join(output_dir, filename)
+                    # Same name means same content, so an unchanged section is not rewritten
+                    if not os.path.exists(section_path):
+                        with _atomic_write(section_path) as f:
+                            f.write(encoded)
+                    manifest['sections'][section] = {'file': filename, 'bytes': len(encoded), 'sha256': digest}
+                
+                manifest_path = os.path.join(output_dir, 'manifest.json')
+                generations = self._section_generations(output_dir, manifest_path)
+                manifest_bytes = writer.write(manifest, manifest_path)
+        except Exception as e:
+            logger.error(f"❌ Error saving portfolio sections: {e}")
+            return None
+        
+        current_files = sorted(entry['file'] for entry in manifest['sections'].values())
+        if not generations or generations[-1] != current_files:
+            generations.append(current_files)
+        kept, dropped = generations[-SECTION_GENERATIONS_KEPT:], generations[:-SECTION_GENERATIONS_KEPT]
+        kept_files = {filename for generation in kept for filename in generation}
+        for filename in {filename for generation in dropped for filename in generation} - kept_files:
+            if os.path.basename(filename) != filename:
+                continue
+            with suppress(OSError):
+                os.remove(os.path.join(output_dir, filename))
+        try:
+            PortfolioJSONWriter(compact=True).write({'version': SECTIONS_FORMAT_VERSION, 'generations': kept},
+                                                    os.path.join(output_dir, SECTION_HISTORY_FILE))
+        except OSError as e:
+            logger.warning(f"Could not save section history in {output_dir}: {e}")
+        
+        total_bytes = sum(entry['bytes'] for entry in manifest['sections'].values())
+        first_paint = manifest_bytes + manifest['sections'].get('personalInfo', {}).get('bytes', 0)
+        logger.info(f"✅ Wrote {len(manifest['sections'])} portfolio sections to {output_dir} "
+                    f"(manifest + personalInfo: {first_paint / 1024:.1f} KB of {total_bytes / 1024:.1f} KB)")
+        return manifest_path
+    
+    @staticmethod
+    def _section_generations(output_dir: str, manifest_path: str) -> List[List[str]]:
+        """File lists of the previous section manifests, oldest first
+        
+        Starts from the existing manifest.json when there is no history yet
+        (e.g. output written before the history was kept).
+        """
+        try:
+            with open(os.path.join(output_dir, SECTION_HISTORY_FILE), 'r', encoding='utf-8') as f:
+                history = json.load(f)
+            if history.get('version') == SECTIONS_FORMAT_VERSION:
+                return [list(generation) for generation in history['generations']]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            return [sorted(entry['file'] for entry in previous['sections'].values())]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return []
+    
+    def _es_module_source(self, section: str, value: Any) -> str:
+        """Render one section as an ES module with a named and a default export
+        
+        Object sections also export each top-level field as its own binding, so
+        a bundler can drop the fields a site never imports.
+        """
+        parts = [ES_MODULE_HEADER]
+        if isinstance(value, dict) and value:
+            fields = []
+            for key, field_value in value.items():
+                if _is_js_identifier(key) and key != section:
+                    parts.append(f"\nexport const {key} = {self.json_writer.encode(field_value).decode('utf-8')};\n")
+                    fields.append(key)
+                else:
+                    fields.append(f"{json.dumps(key, ensure_ascii=False)}: {self.json_writer.encode(field_value).decode('utf-8')}")
+            parts.append(f"\nexport const {section} = {{\n" + ''.join(f"  {field},\n" for field in fields) + "};\n")
+        else:
+            parts.append(f"\nexport const {section} = {self.json_writer.encode(value).decode('utf-8')};\n")
+        parts.append(f"\nexport default {section};\n")
+        return ''.join(parts)
+    
+    def save_portfolio_es_modules(self, data: Dict[str, Any], output_dir: Optional[str] = None) -> Optional[str]:
+        """Write each section as an ES module (<section>.js) plus an index.js barrel for the site's bundler
+        
+        Every section is its own module, so Vite can tree-shake them; index.js
+        re-exports them with a combined `portfolio` object, and loaders.js maps
+        each section to a dynamic import() so Vite can split it into its own
+        chunk. Unchanged modules are not rewritten (no needless dev-server
+        reloads), and generated modules for sections that no longer exist are
+        removed. Returns the barrel path.
+        """
+        output_dir = output_dir or self.es_modules_dir
+        sections = [section for section in data
+                    if _is_js_identifier(section) and section not in ('index', 'loaders', 'portfolio', 'sectionLoaders')]
+        skipped = [section for section in data if section not in sections]
+        if skipped:
+            logger.warning(f"Skipping sections that cannot be ES module names: {', '.join(skipped)}")
+        
+        barrel = [ES_MODULE_HEADER, '\n']
+        barrel.extend(f"import {{ {section} }} from './{section}.js';\n" for section in sections)
+        barrel.append(f"\nexport {{ {', '.join(sections)} }};\n")
+        barrel.append("\nexport const portfolio = {\n" + ''.join(f"  {section},\n" for section in sections) + "};\n")
+        barrel.append("\nexport default portfolio;\n")
+        # Kept out of index.js: a section imported statically anywhere cannot be split into its own chunk
+        loaders = [ES_MODULE_HEADER, "\nexport const sectionLoaders = {\n"]
+        loaders.extend(f"  {section}: () => import('./{section}.js').then((module) => module.default),\n" for section in sections)
+        loaders.append("};\n\nexport default sectionLoaders;\n")
+        
+        written = 0
+        try:
+            with self.profiler.stage('serialization'):
+                os.makedirs(output_dir, exist_ok=True)
+                for section in sections:
+                    source = self._es_module_source(section, data[section])
+                    written += _write_if_changed(os.path.join(output_dir, f"{section}.js"), source.encode('utf-8'))
+                written += _write_if_changed(os.path.join(output_dir, 'loaders.js'), ''.join(loaders).encode('utf-8'))
+                barrel_path = os.path.join(output_dir, 'index.js')
+                written += _write_if_changed(barrel_path, ''.join(barrel).encode('utf-8'))
+        except Exception as e:
+            logger.error(f"❌ Error saving portfolio ES modules: {e}")
+            return None
+        
+        # Remove modules this tool generated for sections that are gone (hand-written files are left alone)
+        current_files = {f"{section}.js" for section in sections} | {'index.js', 'loaders.js'}
+        for filename in os.listdir(output_dir):
+            path = os.path.join(output_dir, filename)
+            if filename.endswith('.js') and filename not in current_files:
+                with suppress(OSError), open(path, 'r', encoding='utf-8') as f:
+                    generated = f.readline() == ES_MODULE_HEADER
+                if generated:
+                    with suppress(OSError):
+                        os.remove(path)
+        
+        logger.info(f"✅ Wrote ES modules for {len(sections)} sections to {output_dir} ({written} files changed)")
+        return barrel_path
     
     def generate_summary_report(self, data: Dict[str, Any]) -> str:
         """Generate a comprehensive summary report"""
@@ -1322,7 +3641,8 @@ Demonstrated success in streamlining processes, resolving critical issues, and m
 {'='*70}
 
 📊 MULTI-PDF EXTRACTION SUMMARY:
-- PDF files processed: {pdf_count}
+- PDF files processed: {pdf_count - len(self.skipped_files)}
+- PDF files skipped (time/memory limits or errors): {len(self.skipped_files)}
 - PDF files found: {[os.path.basename(pdf) for pdf in self.pdf_files]}
 - Experiences extracted: {len(data.get('experience', []))}
 - Total real achievements: {total_achievements}
@@ -1382,12 +3702,33 @@ Demonstrated success in streamlining processes, resolving critical issues, and m
 - Frontend & Backend: {len(data.get('skills', {}).get('frontend', []))} + {len(data.get('skills', {}).get('backend', []))} skills
 - Tools & Databases: {len(data.get('skills', {}).get('tools', []))} + {len(data.get('skills', {}).get('databases', []))} skills
 
+"""
+        if self.profiler.enabled:
+            report += self.generate_performance_report()
+        
+        report += f"""
 ✅ MULTI-PDF ANALYSIS COMPLETE - {total_achievements} achievements from {pdf_count} PDFs!
 ✅ Production-ready portfolio data generated from ALL PDF sources!
 {'='*70}
 """
         return report
     
+    def generate_performance_report(self, slowest_files: int = 5) -> str:
+        """Summarize recorded stage timings, counters and the slowest files"""
+        profile = self.profiler.snapshot()
+        report = f"""
+⏱️ PERFORMANCE PROFILE:
+"""
+        for name, totals in sorted(profile['stages'].items(), key=lambda item: -item[1]['wall_seconds']):
+            report += f"- {name}: {totals['wall_seconds']:.3f}s wall, {totals['cpu_seconds']:.3f}s CPU ({totals['calls']} calls)\n"
+        
+        if profile['counters']:
+            report += "- Counters: " + ', '.join(f"{name}={value}" for name, value in sorted(profile['counters'].items())) + "\n"
+        
+        for wall, key in self.profiler.file_walls()[:slowest_files]:
+            report += f"- Slow file: {key} ({wall:.3f}s)\n"
+        return report
+    
     def run_ultimate_multi_pdf_analysis(self) -> Dict[str, Any]:
         """Run the ultimate multi-PDF portfolio analysis"""
         logger.info("🚀 Starting Ultimate Multi-PDF Portfolio Analysis...")
@@ -1406,8 +3747,353 @@ Demonstrated success in streamlining processes, resolving critical issues, and m
         
         return portfolio_data
 
-def main():
+# Per-process analyzer used by the --jobs worker pool
+_worker_analyzer = None
+
+def _init_pdf_worker(analyzer: UltimatePDFPortfolioAnalyzer):
+    """Install the analyzer copy shipped to this worker process"""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
+def _warm_pdf_worker(analyzer: UltimatePDFPortfolioAnalyzer):
+    """Load every configured PDF backend and the keyword/line matchers ahead of the first document"""
+    for backend in analyzer.backends:
+        _load_pdf_backend(backend)
+    _get_keyword_matcher()
+    _get_line_classifier()
+
+def _run_in_worker(call: Tuple[str, Any]) -> Any:
+    """Process pool entry point: run one analyzer method on one item"""
+    method_name, item = call
+    if not _worker_analyzer.profiler.enabled:
+        return getattr(_worker_analyzer, method_name)(item)
+    
+    # Ship this call's timings back to the parent along with the result
+    _worker_analyzer.profiler.reset()
+    result = getattr(_worker_analyzer, method_name)(item)
+    return result, _worker_analyzer.profiler.snapshot()
+
+def _address_space_bytes() -> Optional[int]:
+    """Current virtual memory size of this process, or None where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _sandbox_worker_main(conn, analyzer: UltimatePDFPortfolioAnalyzer, memory_limit_bytes: Optional[int]):
+    """Worker process loop: run one analyzer call per message under the per-document memory budget
+    
+    Backends are imported before the worker reports 'ready', so neither their
+    import time nor their memory counts against the first document's limits.
+    """
+    _init_pdf_worker(analyzer)
+    try:
+        _warm_pdf_worker(analyzer)
+    except Exception as e:
+        # A broken backend fails the documents that need it, not the worker
+        logger.warning(f"Could not preload PDF backends: {e}")
+    resource = None
+    if memory_limit_bytes:
+        import resource
+        base_limits = resource.getrlimit(resource.RLIMIT_AS)
+    conn.send(('ready', None))
+    
+    while True:
+        try:
+            call = conn.recv()
+        except EOFError:
+            return
+        if call is None:
+            return
+        
+        try:
+            if resource is not None:
+                # The budget is on top of whatever the worker already has mapped
+                resource.setrlimit(resource.RLIMIT_AS, ((_address_space_bytes() or 0) + memory_limit_bytes, base_limits[1]))
+            try:
+                reply = ('ok', _run_in_worker(call))
+            finally:
+                if resource is not None:
+                    resource.setrlimit(resource.RLIMIT_AS, base_limits)
+        except MemoryError:
+            reply = ('memory_limit', "ran out of its memory budget")
+        except Exception as e:
+            reply = ('error', f"{type(e).__name__}: {e}")
+        conn.send(reply)
+
+class _SandboxWorker:
+    """One killable worker process and the parent's end of its pipe"""
+    
+    __slots__ = ('process', 'conn')
+    
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+
+class DocumentSandbox:
+    """Runs analyzer calls one document at a time in isolated, killable worker processes
+    
+    A document still running after time_limit seconds has its worker killed,
+    and each call may grow the worker's address space by at most
+    memory_limit_mb (RLIMIT_AS, where the platform supports it). A document
+    that hits a limit, crashes its worker or raises comes back as a
+    SkippedDocument, its worker is replaced, and the rest of the batch carries on.
+    Workers preload the PDF backends and only get documents (and start their
+    clock) once they report ready.
+    """
+    
+    def __init__(self, analyzer: UltimatePDFPortfolioAnalyzer, workers: int = 1,
+                 time_limit: Optional[float] = None, memory_limit_mb: Optional[float] = None):
+        self.analyzer = analyzer
+        self.workers = max(1, workers)
+        self.time_limit = time_limit
+        self.memory_limit_bytes = int(memory_limit_mb * 1024 * 1024) if memory_limit_mb else None
+        if self.memory_limit_bytes and not self.memory_limit_supported():
+            logger.warning("Per-document memory limits need RLIMIT_AS and /proc (Linux); only the time limit is enforced")
+            self.memory_limit_bytes = None
+        
+    @staticmethod
+    def memory_limit_supported() -> bool:
+        """Check whether the platform can cap a worker's address space"""
+        if importlib.util.find_spec('resource') is None or _address_space_bytes() is None:
+            return False
+        return hasattr(importlib.import_module('resource'), 'RLIMIT_AS')
+    
+    def _spawn(self) -> _SandboxWorker:
+        import multiprocessing
+        
+        parent_conn, child_conn = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_sandbox_worker_main, daemon=True,
+                                          args=(child_conn, self.analyzer, self.memory_limit_bytes))
+        process.start()
+        # Only the child holds its end now, so recv() sees EOF if the worker dies
+        child_conn.close()
+        return _SandboxWorker(process, parent_conn)
+    
+    @staticmethod
+    def _kill(worker: _SandboxWorker):
+        worker.process.kill()
+        worker.process.join()
+        worker.conn.close()
+    
+    @staticmethod
+    def _stop(worker: _SandboxWorker):
+        try:
+            worker.conn.send(None)
+        except OSError:
+            pass
+        worker.process.join(timeout=1)
+        if worker.process.is_alive():
+            worker.process.kill()
+            worker.process.join()
+        worker.conn.close()
+    
+    def _skipped(self, item: Any, reason: str, detail: str, started: float) -> SkippedDocument:
+        name = os.path.basename(item if isinstance(item, str) else str(item))
+        skipped = SkippedDocument(file=name, reason=reason, detail=detail,
+                                  seconds=round(time.monotonic() - started, 3))
+        logger.warning(f"⏭️ Skipped {name}: {detail}")
+        self.analyzer.profiler.count('files_skipped')
+        return skipped
+    
+    def map(self, method_name: str, items: List[Any]) -> Iterator[Any]:
+        """Yield getattr(analyzer, method_name)(item) or a SkippedDocument for every item, in order"""
+        from multiprocessing.connection import wait
+        
+        pending = list(enumerate(items))
+        pending.reverse()
+        done = {}
+        next_index = 0
+        idle = []
+        starting = {}  # parent connection -> worker still loading its backends
+        busy = {}  # parent connection -> (worker, index, item, start time)
+        try:
+            while next_index < len(items):
+                while pending and idle:
+                    worker = idle.pop()
+                    index, item = pending.pop()
+                    worker.conn.send((method_name, item))
+                    busy[worker.conn] = (worker, index, item, time.monotonic())
+                for _ in range(min(len(pending), self.workers - len(busy) - len(starting))):
+                    worker = self._spawn()
+                    starting[worker.conn] = worker
+                
+                timeout = None
+                if self.time_limit and busy:
+                    oldest = min(started for _, _, _, started in busy.values())
+                    timeout = max(0.0, oldest + self.time_limit - time.monotonic())
+                
+                for conn in wait(list(busy) + list(starting), timeout):
+                    if conn in starting:
+                        worker = starting.pop(conn)
+                        try:
+                            conn.recv()
+                        except (EOFError, OSError):
+                            worker.process.join()
+                            worker.conn.close()
+                            raise RuntimeError(f"Sandbox worker exited during start-up with code {worker.process.exitcode}")
+                        idle.append(worker)
+                        continue
+                    worker, index, item, started = busy.pop(conn)
+                    try:
+                        status, payload = conn.recv()
+                    except (EOFError, OSError):
+                        worker.process.join()
+                        done[index] = self._skipped(item, 'crashed', f"worker exited with code {worker.process.exitcode}", started)
+                        worker.conn.close()
+                        continue
+                    
+                    if status == 'ok':
+                        if self.analyzer.profiler.enabled:
+                            payload, worker_profile = payload
+                            self.analyzer.profiler.merge(worker_profile)
+                        done[index] = payload
+                        idle.append(worker)
+                    elif status == 'memory_limit':
+                        done[index] = self._skipped(item, status, f"exceeded the {self.memory_limit_bytes // (1024 * 1024)} MB memory limit", started)
+                        # Recycle the worker rather than trust a heap that just hit its ceiling
+                        self._stop(worker)
+                    else:
+                        done[index] = self._skipped(item, status, payload, started)
+                        idle.append(worker)
+                
+                if self.time_limit:
+                    now = time.monotonic()
+                    for conn, (worker, index, item, started) in list(busy.items()):
+                        if now - started >= self.time_limit and not conn.poll():
+                            del busy[conn]
+                            self._kill(worker)
+                            done[index] = self._skipped(item, 'time_limit', f"exceeded the {self.time_limit:g}s time limit", started)
+                
+                while next_index in done:
+                    yield done.pop(next_index)
+                    next_index += 1
+        finally:
+            for worker, _, _, _ in busy.values():
+                self._kill(worker)
+            for worker in starting.values():
+                self._kill(worker)
+            for worker in idle:
+                self._stop(worker)
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(description="Ultimate PDF Portfolio Analyzer - extract portfolio data from resume PDFs")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="Number of parallel workers for extraction and parsing (0 = one per CPU, default: 1)")
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process',
+                        help="Worker pool type for --jobs; 'thread' suits backends that release the GIL (default: process)")
+    parser.add_argument('--max-pages', type=int, default=None,
+                        help="Only extract the first N pages of each PDF (default: all pages)")
+    parser.add_argument('--batch', action='store_true',
+                        help="Analyze each PDF (or each subfolder of resume/) as a separate candidate")
+    parser.add_argument('--batch-output', default=None,
+                        help="JSONL file for --batch results (default: extract_resume/portfolio_batch.jsonl)")
+    parser.add_argument('--analytics', action='store_true',
+                        help="With --batch, also write skill/technology/company statistics across all candidates "
+                             "to <batch output>_analytics.json")
+    parser.add_argument('--analytics-top', type=int, default=25,
+                        help="Most frequent companies, titles and institutions kept by --analytics (default: 25)")
+    parser.add_argument('--search-index', action='store_true',
+                        help="Keep a full-text (SQLite FTS5) index of written portfolios, updated as each one is written")
+    parser.add_argument('--search-index-path', default=None,
+                        help="Search index database; implies --search-index (default: extract_resume/portfolio_search.db)")
+    parser.add_argument('--search', default=None, metavar='QUERY',
+                        help="Query the search index and exit, e.g. 'Terraform AND Kubernetes' (FTS5 syntax)")
+    parser.add_argument('--search-company', default=None,
+                        help="With --search, only candidates with this phrase in an experience company name")
+    parser.add_argument('--search-limit', type=int, default=20,
+                        help="Maximum --search results (default: 20)")
+    parser.add_argument('--backends', default=None,
+                        help=f"Comma-separated PDF backend fallback order (default: installed ones from {','.join(PDF_BACKENDS)})")
+    parser.add_argument('--min-text-chars', type=int, default=50,
+                        help="Try the next backend when extracted text has this many characters or fewer (default: 50)")
+    parser.add_argument('--merge-threshold', type=float, default=0.8,
+                        help="Similarity (0-1) at which experiences are merged as the same role; "
+                             "1.0 merges only exact company/title matches ignoring case and punctuation (default: 0.8)")
+    parser.add_argument('--page-workers', type=int, default=1,
+                        help="Processes that split the pages of a long PDF between them (0 = one per CPU, default: 1 = off)")
+    parser.add_argument('--page-parallel-threshold', type=int, default=50,
+                        help="Minimum page count before a PDF is split across --page-workers (default: 50)")
+    parser.add_argument('--time-limit', type=float, default=None,
+                        help="Skip any PDF whose analysis takes longer than this many seconds; "
+                             "each PDF then runs in its own killable worker process (default: no limit)")
+    parser.add_argument('--memory-limit-mb', type=float, default=None,
+                        help="Skip any PDF whose analysis needs more than this many MB of extra memory "
+                             "(Linux; enforced in isolated worker processes, default: no limit)")
+    parser.add_argument('--compact-json', action='store_true',
+                        help="Write the portfolio JSON without indentation or spaces (smaller and faster)")
+    parser.add_argument('--json-encoder', choices=('auto',) + JSON_ENCODERS, default='auto',
+                        help="JSON encoder for output files; 'auto' uses orjson when installed (default: auto)")
+    parser.add_argument('--sectioned', action='store_true',
+                        help="Also write one content-hashed JSON file per section plus manifest.json, "
+                             "so a site can load personalInfo first and lazy-load the rest")
+    parser.add_argument('--sections-dir', default=None,
+                        help="Directory for --sectioned output; implies --sectioned (default: extract_resume/portfolio_sections)")
+    parser.add_argument('--es-modules', nargs='?', const='src/data/portfolio', default=None, metavar='DIR',
+                        help="Also write one ES module per section plus an index.js barrel for the site "
+                             "(default DIR: src/data/portfolio)")
+    parser.add_argument('--profile', action='store_true',
+                        help="Record per-stage and per-file timings and counters in metadata and the report")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only re-analyze PDFs added or changed since the last run (tracked in extract_resume/.analysis_manifest.json)")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and incrementally re-analyze whenever the resume folder changes")
+    parser.add_argument('--watch-interval', type=float, default=0.5,
+                        help="Seconds between resume folder checks in --watch mode (default: 0.5)")
+    parser.add_argument('--cache-dir', default=None,
+                        help="Directory for the extracted text cache (default: <workspace>/.pdf_text_cache)")
+    parser.add_argument('--cache-size-mb', type=int, default=256,
+                        help="Maximum text cache size in MB before LRU eviction (default: 256)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Disable the extracted text cache")
+    parser.add_argument('--clear-cache', action='store_true',
+                        help="Invalidate the extracted text cache before running")
+    args = parser.parse_args(argv)
+    if args.json_encoder == 'orjson' and importlib.util.find_spec('orjson') is None:
+        parser.error("--json-encoder orjson requires orjson (pip install orjson)")
+    if args.analytics and not args.batch:
+        parser.error("--analytics requires --batch")
+    if args.search_company and args.search is None:
+        args.search = ''
+    return args
+
+def run_search(args: argparse.Namespace):
+    """Answer --search from the search index and print the matching candidates"""
+    index_path = args.search_index_path or os.path.join(os.getcwd(), 'extract_resume', 'portfolio_search.db')
+    if not os.path.exists(index_path):
+        print(f"❌ No search index at {index_path} (build one with --search-index)")
+        return
+    search_index = PortfolioSearchIndex(index_path)
+    try:
+        start = time.perf_counter()
+        results = search_index.search(args.search, company=args.search_company, limit=args.search_limit)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    except sqlite3.OperationalError as e:
+        print(f"❌ Invalid search query: {e}")
+        return
+    finally:
+        search_index.close()
+    
+    print(f"🔎 {len(results)} matching candidates ({elapsed_ms:.1f} ms)")
+    for result in results:
+        print(f"- {result['candidate_id']}: {result['name'] or '(no name)'}"
+              f"{' - ' + result['title'] if result['title'] else ''} [{os.path.basename(result['source'])}]")
+        if result['snippet']:
+            print(f"    {' '.join(result['snippet'].split())}")
+
+def main(argv: Optional[List[str]] = None):
     """Main execution function"""
+    args = parse_args(argv)
+    
+    # Setup logging (only for CLI runs, so importing the module has no side effects)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    
+    if args.search is not None:
+        run_search(args)
+        return
+    
     print("🎯 Ultimate PDF Portfolio Analyzer v4.0 - REAL PDF EXTRACTION")
     print("=" * 65)
     print("📋 FEATURES:")
@@ -1419,8 +4105,8 @@ def main():
     print("=" * 65)
     
     # Check PDF library availability
-    if PDF_LIBRARY:
-        print(f"✅ PDF Library: {PDF_LIBRARY} available")
+    if AVAILABLE_PDF_BACKENDS:
+        print(f"✅ PDF Libraries available: {', '.join(AVAILABLE_PDF_BACKENDS)}")
     else:
         print("❌ No PDF library found. Install one of:")
         print("   pip install PyPDF2")
@@ -1428,8 +4114,38 @@ def main():
         print("   pip install PyMuPDF")
         return
     
+    # Set up the extracted text cache
+    text_cache = None
+    if not args.no_cache:
+        cache_dir = args.cache_dir or os.path.join(os.getcwd(), '.pdf_text_cache')
+        text_cache = PDFTextCache(cache_dir, max_bytes=args.cache_size_mb * 1024 * 1024)
+        if args.clear_cache:
+            print(f"🧹 Cleared {text_cache.clear()} cached PDF text entries")
+    
     # Initialize analyzer
-    analyzer = UltimatePDFPortfolioAnalyzer()
+    analyzer = UltimatePDFPortfolioAnalyzer(jobs=args.jobs, executor=args.executor, text_cache=text_cache,
+                                            max_pages=args.max_pages, profile=args.profile,
+                                            backends=args.backends.split(',') if args.backends else None,
+                                            min_text_chars=args.min_text_chars,
+                                            merge_threshold=args.merge_threshold,
+                                            compact_json=args.compact_json, json_encoder=args.json_encoder,
+                                            time_limit=args.time_limit, memory_limit_mb=args.memory_limit_mb,
+                                            page_workers=args.page_workers,
+                                            page_parallel_threshold=args.page_parallel_threshold,
+                                            sectioned=args.sectioned, sections_dir=args.sections_dir,
+                                            es_modules_dir=args.es_modules,
+                                            analytics=args.analytics, analytics_top=args.analytics_top,
+                                            search_index=args.search_index, search_index_path=args.search_index_path)
+    
+    if args.watch:
+        analyzer.watch(interval=args.watch_interval)
+        return
+    
+    if args.batch:
+        output_file = analyzer.run_batch_analysis(args.batch_output)
+        if output_file:
+            print(f"\n🎉 Batch analysis complete! One portfolio per line in: {output_file}")
+        return
     
     if not analyzer.pdf_files:
         print("❌ No PDF resume files found in 'resume' folder")
@@ -1437,7 +4153,11 @@ def main():
         return
     
     # Run complete analysis
-    portfolio_data = analyzer.run_ultimate_multi_pdf_analysis()
+    if args.incremental:
+        portfolio_data = analyzer.run_incremental_analysis()
+        print(analyzer.generate_summary_report(portfolio_data))
+    else:
+        portfolio_data = analyzer.run_ultimate_multi_pdf_analysis()
     
     print(f"\n📁 PDF files processed: {len(analyzer.pdf_files)}")
     print(f"📄 Files: {[os.path.basename(pdf) for pdf in analyzer.pdf_files]}")